@@ -0,0 +1,28 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmark suite of quantumcat.
+
+Run all benchmarks and store the timings as JSON:
+
+    python -m benchmarks run --output results/HEAD.json
+
+Select benchmarks by name with -k, e.g. -k conversion, and compare two runs,
+e.g. of two commits:
+
+    python -m benchmarks compare results/before.json results/HEAD.json
+
+Benchmarks needing a provider SDK that is not installed are recorded as
+skipped.
+"""
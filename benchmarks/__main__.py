@@ -0,0 +1,51 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import argparse
+import sys
+from benchmarks import runner
+from benchmarks import bench_construction, bench_conversion, bench_execution, bench_algorithms  # noqa: F401
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='quantumcat benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-k', dest='pattern', help='only run benchmarks whose name contains PATTERN')
+    run_parser.add_argument('-o', '--output', help='JSON file to store the results in')
+    run_parser.add_argument('--min-seconds', type=float, default=0.2, help='time spent repeating each benchmark')
+    run_parser.add_argument('--max-repeat', type=int, default=10, help='maximum calls of each benchmark')
+    compare_parser = commands.add_parser('compare', help='compare two stored runs')
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    compare_parser.add_argument('--threshold', type=float, default=1.1,
+                                help='ratio above which a benchmark is reported as slower')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = runner.run(args.pattern, args.min_seconds, args.max_repeat)
+        if args.output:
+            runner.save(results, args.output)
+        return 0
+
+    rows, slower = runner.compare(runner.load(args.before), runner.load(args.after), args.threshold)
+    for name, before, after, ratio in rows:
+        print('{:<70} {:>12.6f} {:>12.6f} {:>7.2f}x'.format(name, before, after, ratio))
+    if slower:
+        print('\n{} benchmark(s) slower than {}x: {}'.format(len(slower), args.threshold, ', '.join(slower)))
+    return 1 if slower else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Scaling of the algorithms and applications on the native simulator."""
+
+from benchmarks.runner import benchmark
+from quantumcat.algorithms import GroversAlgorithm, DeutschJozsa
+from quantumcat.utils import providers
+
+PROVIDER = providers.NATIVE_PROVIDER
+
+
+@benchmark(num_qubits=[2, 4, 6, 8])
+def grovers_known_solution(num_qubits):
+    keyword = '1' * num_qubits
+    return lambda: GroversAlgorithm(search_keyword=keyword, solution_known='Y').execute(provider=PROVIDER)
+
+
+@benchmark(num_qubits=[4, 8, 12], case=['balanced', 'constant'])
+def deutsch_jozsa(num_qubits, case):
+    return lambda: DeutschJozsa(case, num_qubits).execute(provider=PROVIDER)
+
+
+@benchmark(length=[4, 8, 16])
+def random_number(length):
+    # the generator package also imports the password generator and its requests dependency
+    from quantumcat.applications.generator import RandomNumber
+    return lambda: RandomNumber(length).execute(provider=PROVIDER)
@@ -0,0 +1,96 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""QCircuit construction benchmarks, and the circuits used by the other benchmarks."""
+
+from benchmarks.runner import benchmark
+from quantumcat.circuit import QCircuit
+
+
+def single(circ, index, qubit, num_qubits):
+    (circ.h_gate, circ.x_gate, circ.s_gate, circ.t_gate)[index % 4](qubit)
+
+
+def two_qubit(circ, index, qubit, num_qubits):
+    (circ.cx_gate, circ.cz_gate, circ.swap_gate)[index % 3](qubit, (qubit + 1) % num_qubits)
+
+
+def rotation(circ, index, qubit, num_qubits):
+    angle = 0.1 * (index % 31)
+    if index % 4 == 3:
+        circ.u3_gate(angle, angle / 2, angle / 3, qubit)
+    else:
+        (circ.rx_gate, circ.ry_gate, circ.rz_gate)[index % 4](angle, qubit)
+
+
+def multi_controlled(circ, index, qubit, num_qubits):
+    qubits = [(qubit + offset) % num_qubits for offset in range(4)]
+    if index % 2 == 0:
+        circ.ccx_gate(qubits[0], qubits[1], qubits[2])
+    else:
+        circ.mct_gate(qubits[:3], qubits[3])
+
+
+def custom(circ, index, qubit, num_qubits):
+    """Gates that cirq and braket build from quantumcat custom gates."""
+    other = (qubit + 1) % num_qubits
+    if index % 4 == 0:
+        circ.u_gate(0.1, 0.2, 0.3, qubit)
+    elif index % 4 == 1:
+        circ.ch_gate(qubit, other)
+    elif index % 4 == 2:
+        circ.crx_gate(0.4, qubit, other)
+    else:
+        circ.rzx_gate(0.5, qubit, other)
+
+
+FAMILIES = {
+    'single': single,
+    'two_qubit': two_qubit,
+    'rotation': rotation,
+    'multi_controlled': multi_controlled,
+    'custom': custom,
+}
+
+
+def build(num_qubits, num_gates, family='mixed'):
+    """Returns a circuit of num_gates gates of a family, or of all families in turn for 'mixed'."""
+    circ = QCircuit(num_qubits)
+    families = list(FAMILIES.values())
+    for index in range(num_gates):
+        add = families[index % len(families)] if family == 'mixed' else FAMILIES[family]
+        add(circ, index // len(families) if family == 'mixed' else index, index % num_qubits, num_qubits)
+    return circ
+
+
+def layered(num_qubits, depth):
+    """Returns a circuit of depth layers of rotations and a cx chain, measuring all qubits."""
+    circ = QCircuit(num_qubits)
+    for layer in range(depth):
+        for qubit in range(num_qubits):
+            circ.ry_gate(0.1 * (layer + qubit + 1), qubit)
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            circ.cx_gate(qubit, qubit + 1)
+    circ.measure_all()
+    return circ
+
+
+@benchmark(num_gates=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+def construction(num_gates):
+    return lambda: build(16, num_gates)
+
+
+@benchmark(num_gates=[10 ** 4], family=sorted(FAMILIES))
+def construction_family(num_gates, family):
+    return lambda: build(16, num_gates, family)
@@ -0,0 +1,29 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Conversion of circuits to each provider, per gate family."""
+
+from benchmarks.bench_construction import FAMILIES, build
+from benchmarks.runner import benchmark
+from quantumcat import backends
+from quantumcat.utils import providers
+
+
+@benchmark(provider=[providers.IBM_PROVIDER, providers.GOOGLE_PROVIDER, providers.AMAZON_PROVIDER],
+           family=sorted(FAMILIES), num_gates=[10 ** 3])
+def conversion(provider, family, num_gates):
+    backend = backends.get_backend(provider)
+    circ = build(8, num_gates, family)
+    # backend.convert translates the whole circuit on every call, unlike the cached QCircuit conversion
+    return lambda: backend.convert(circ)
@@ -0,0 +1,28 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""End-to-end execution on the local simulators: construction, conversion and sampling."""
+
+from benchmarks.bench_construction import layered
+from benchmarks.runner import benchmark
+from quantumcat import backends
+from quantumcat.utils import providers
+
+
+@benchmark(provider=[providers.NATIVE_PROVIDER, providers.IBM_PROVIDER, providers.GOOGLE_PROVIDER,
+                     providers.AMAZON_PROVIDER],
+           num_qubits=[4, 8, 12, 16], depth=[10, 50])
+def execute(provider, num_qubits, depth):
+    backends.get_backend(provider)
+    return lambda: layered(num_qubits, depth).execute(provider=provider, repetitions=1024)
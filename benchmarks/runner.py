@@ -0,0 +1,115 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Registry, timing and JSON storage of benchmarks."""
+
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+import numpy as np
+
+BENCHMARKS = []
+
+
+def benchmark(**params):
+    """Registers a benchmark run for every combination of params.
+
+    The decorated function takes one value of each param, prepares what is
+    needed and returns the function to time, so only that function is timed.
+    It raises ImportError when a provider SDK is missing.
+    """
+    def register(setup):
+        names = sorted(params)
+        for values in itertools.product(*(params[name] for name in names)):
+            BENCHMARKS.append((setup.__module__.split('.')[-1], setup.__name__, dict(zip(names, values)), setup))
+        return setup
+    return register
+
+
+def benchmark_name(module, name, params):
+    return '{}.{}({})'.format(module, name, ', '.join('{}={}'.format(key, value) for key, value in params.items()))
+
+
+def measure(function, min_seconds=0.2, max_repeat=10):
+    """Calls function at least once, and again until min_seconds are spent or max_repeat calls are made.
+    :return: list of the seconds taken by each call
+    """
+    timings = []
+    while len(timings) < max_repeat and (not timings or sum(timings) < min_seconds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(pattern=None, min_seconds=0.2, max_repeat=10, log=print):
+    """Runs the registered benchmarks whose name contains pattern.
+    :return: dict with the environment and, for each benchmark, its params and timings
+    """
+    results = {}
+    for module, name, params, setup in BENCHMARKS:
+        full_name = benchmark_name(module, name, params)
+        if pattern is not None and pattern not in full_name:
+            continue
+        try:
+            timings = measure(setup(**params), min_seconds, max_repeat)
+        except ImportError as error:
+            results[full_name] = {'params': params, 'skipped': str(error)}
+            log('{:<70} skipped: {}'.format(full_name, error))
+            continue
+        results[full_name] = {'params': params, 'min': min(timings), 'median': statistics.median(timings),
+                              'repeat': len(timings)}
+        log('{:<70} {:>12.6f} s'.format(full_name, min(timings)))
+    return {
+        'commit': commit(),
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.platform(),
+        'benchmarks': results,
+    }
+
+
+def save(results, path):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(before, after, threshold=1.1):
+    """Returns (name, before seconds, after seconds, ratio) of the benchmarks timed in both runs,
+    and the names of those whose ratio is above threshold."""
+    rows = []
+    for name, result in after['benchmarks'].items():
+        previous = before['benchmarks'].get(name)
+        if previous is None or 'min' not in previous or 'min' not in result:
+            continue
+        rows.append((name, previous['min'], result['min'], result['min'] / previous['min']))
+    return rows, [row[0] for row in rows if row[3] > threshold]
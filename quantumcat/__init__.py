@@ -11,3 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+
+from quantumcat.circuit.execute_circuit import execute_batch
+from quantumcat.circuit.jobs import Job, execute_async
+from quantumcat.circuit.result_cache import ResultCache
@@ -14,3 +14,4 @@
 
 from quantumcat.algorithms.grovers_algorithm import GroversAlgorithm
 from quantumcat.algorithms.deutsch_jozsa import DeutschJozsa
+from quantumcat.algorithms.sat_oracle import SATOracle
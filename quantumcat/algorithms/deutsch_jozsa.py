@@ -13,40 +13,85 @@
 #  limitations under the License.
 
 
-from quantumcat.utils import providers, constants
+from quantumcat.utils import providers, constants, ErrorMessages
 from quantumcat.circuit import QCircuit
+from quantumcat.circuit.execute_circuit import execute_batch
+from quantumcat.exceptions import CircuitError
 import numpy as np
 
+# (name, number of input qubits) -> Block shared by every circuit of that size
+SHARED_BLOCKS = {}
+
+
+def shared_block(name, num_qubits, build):
+    """Returns the Block that build(q_circuit, num_qubits) appends, built once per size."""
+    key = (name, num_qubits)
+    if key not in SHARED_BLOCKS:
+        q_circuit = QCircuit(num_qubits + 1)
+        build(q_circuit, num_qubits)
+        SHARED_BLOCKS[key] = q_circuit.to_block(name)
+    return SHARED_BLOCKS[key]
+
+
+def prepare(q_circuit, n):
+    q_circuit.x_gate(n)
+    q_circuit.h_gate(n)
+
+    # And set up the input register:
+    for qubit in range(n):
+        q_circuit.superposition(qubit)
+
+
+def unprepare(q_circuit, n):
+    # Finally, perform the H-gates again:
+    for qubit in range(n):
+        q_circuit.h_gate(qubit)
+
+
+def parity(q_circuit, n):
+    # Do the controlled-NOT gates for each qubit, using the output qubit
+    # as the target:
+    for qubit in range(n):
+        q_circuit.cx_gate(qubit, n)
+
 
 class DeutschJozsa:
     """Class for implementing Deutsch Jozsa algorithm """
 
-    def __init__(self, case, num_qubits):
+    def __init__(self, case, num_qubits, mask=None, seed=None):
+        """
+        :param case: 'balanced' or 'constant'
+        :param num_qubits: number of input qubits
+        :param mask: oracle to use instead of a random one: for a balanced oracle the non-zero mask b of
+                     the inputs whose bits are flipped before the parity, bit q being qubit q, for a
+                     constant oracle its output, 0 or 1
+        :param seed: seed of the random oracle drawn when no mask is given
+        """
         super(DeutschJozsa, self).__init__()
+        if mask is not None and not (1 <= mask < 2 ** num_qubits if case == 'balanced' else mask in (0, 1)):
+            raise CircuitError(ErrorMessages.MASK_OUT_OF_RANGE, str(mask))
         self.case = case
         self.num_qubits = num_qubits
+        self.mask = mask
+        self.seed = seed
         self.dj_circuit = None
+        # the oracle is drawn once per instance and referenced as a Block by every circuit
+        self.oracle = None
 
     def draw_algorithm(self, provider=providers.DEFAULT_PROVIDER, filename=None, output='text'):
         dj_circuit = self.dj_algorithm()
         dj_circuit.draw_circuit(provider=provider, filename=filename, output=output)
 
     def dj_algorithm(self):
+        """Builds the circuit from the prefix and suffix blocks shared by all circuits of its size."""
         n = self.num_qubits
         dj_circuit = QCircuit(n + 1, n)
         self.dj_circuit = dj_circuit
-        dj_circuit.x_gate(n)
-        dj_circuit.h_gate(n)
-
-        # And set up the input register:
-        for qubit in range(n):
-            dj_circuit.superposition(qubit)
+        dj_circuit.append_block(shared_block('dj_prefix', n, prepare))
 
         self.dj_oracle()
 
-        # Finally, perform the H-gates again and measure:
-        for qubit in range(n):
-            dj_circuit.h_gate(qubit)
+        dj_circuit.append_block(shared_block('dj_suffix', n, unprepare))
 
         for i in range(n):
             dj_circuit.measure(i)
@@ -61,40 +106,74 @@ class DeutschJozsa:
         return dj_circuit.execute(provider=provider, repetitions=repetitions,
                                   api=api, device=device)
 
+    @classmethod
+    def execute_batch(cls, cases, num_qubits, masks=None, seeds=None, provider=providers.DEFAULT_PROVIDER,
+                      repetitions=constants.DEFAULT_REPETITIONS, api=None, device=None):
+        """Classifies many oracles with a single submission.
+        :param cases: case of each oracle, or one case for all the oracles the masks or seeds give
+        :param num_qubits: number of input qubits of every oracle
+        :param masks: mask of each oracle, see DeutschJozsa, None drawing it from the seed
+        :param seeds: seed of each oracle without a mask
+        :return: numpy array with the verdict, 'constant' or 'balanced', for each oracle
+        """
+        if isinstance(cases, str):
+            if masks is None and seeds is None:
+                raise CircuitError(ErrorMessages.ORACLES_NOT_GIVEN, cases)
+            cases = [cases] * (len(masks) if masks is not None else len(seeds))
+        masks = [None] * len(cases) if masks is None else masks
+        seeds = [None] * len(cases) if seeds is None else seeds
+        if len(masks) != len(cases) or len(seeds) != len(cases):
+            raise CircuitError(ErrorMessages.ORACLES_COUNT_MISMATCH)
+        circuits = [cls(case, num_qubits, mask, seed).dj_algorithm() for case, mask, seed in zip(cases, masks, seeds)]
+        results = execute_batch(circuits, provider=provider, repetitions=repetitions, api=api, device=device)
+        return cls.verdicts(results, num_qubits)
+
+    @staticmethod
+    def verdicts(results, num_qubits):
+        """Returns 'constant' for the counts mostly measuring all zeros and 'balanced' for the others."""
+        zeros = np.array([counts.get('0' * num_qubits, 0) for counts in results])
+        shots = np.array([sum(counts.values()) for counts in results])
+        return np.where(2 * zeros > shots, 'constant', 'balanced')
+
     def dj_oracle(self):
-        oracle_qc = self.dj_circuit
+        if self.oracle is None:
+            self.oracle = self.build_oracle()
+        self.dj_circuit.append_block(self.oracle)
+
+    def oracle_mask(self):
+        """Returns the mask of the oracle, drawing it on the first call when none was given."""
+        if self.mask is None:
+            n = self.num_qubits
+            randint = np.random.randint if self.seed is None else np.random.default_rng(self.seed).integers
+            # a balanced oracle needs a non-zero mask, a constant one picks its output
+            self.mask = int(randint(1, 2 ** n)) if self.case == "balanced" else int(randint(2))
+        return self.mask
+
+    def build_oracle(self):
         case = self.case
         n = self.num_qubits
-        # We need to make a QuantumCircuit object to return
+        mask = self.oracle_mask()
         # This circuit has n+1 qubits: the size of the input,
         # plus one output qubit
+        oracle_qc = QCircuit(n + 1)
 
         # First, let's deal with the case in which oracle is balanced
         if case == "balanced":
-            # First generate a random number that tells us which CNOTs to
-            # wrap in X-gates:
-            b = np.random.randint(1, 2 ** n)
-            # Next, format 'b' as a binary string of length 'n', padded with zeros:
-            b_str = format(b, '0' + str(n) + 'b')
-            # Next, we place the first X-gates. Each digit in our binary string
-            # corresponds to a qubit, if the digit is 0, we do nothing, if it's 1
-            # we apply an X-gate to that qubit:
-            for qubit in range(len(b_str)):
-                if b_str[qubit] == '1':
-                    oracle_qc.x_gate(qubit)
-            # Do the controlled-NOT gates for each qubit, using the output qubit
-            # as the target:
-            for qubit in range(n):
-                oracle_qc.cx_gate(qubit, n)
+            # The mask tells us which CNOTs to wrap in X-gates. Each bit of
+            # the mask corresponds to a qubit, if the bit is 0, we do nothing,
+            # if it's 1 we apply an X-gate to that qubit:
+            flipped = [qubit for qubit in range(n) if mask >> qubit & 1]
+            for qubit in flipped:
+                oracle_qc.x_gate(qubit)
+            oracle_qc.append_block(shared_block('dj_parity', n, parity))
             # Next, place the final X-gates
-            for qubit in range(len(b_str)):
-                if b_str[qubit] == '1':
-                    oracle_qc.x_gate(qubit)
+            for qubit in flipped:
+                oracle_qc.x_gate(qubit)
 
-        # Case in which oracle is constant
+        # Case in which oracle is constant, the mask being the fixed output
+        # of the oracle (either always 0 or always 1)
         if case == "constant":
-            # First decide what the fixed output of the oracle will be
-            # (either always 0 or always 1)
-            output = np.random.randint(2)
-            if output == 1:
+            if mask == 1:
                 oracle_qc.x_gate(n)
+
+        return oracle_qc.to_block('dj_oracle')
@@ -13,30 +13,57 @@
 #  limitations under the License.
 
 
-from quantumcat.utils import providers
+from quantumcat.utils import providers, constants, ErrorMessages
 from quantumcat.circuit import QCircuit
+from quantumcat.circuit.execute_circuit import execute_batch
+from quantumcat.algorithms.sat_oracle import SATOracle
+from quantumcat.exceptions import CircuitError
+from quantumcat.simulators import Counts
 import numpy as np
 
+# Basis states evaluated at once when looking for the states marked by the clauses
+CHUNK_STATES = 1 << 20
+
 
 class GroversAlgorithm:
     """docstring for Circuit."""
 
-    def __init__(self, clause_list=[], input_arr=[], search_keyword=None, solution_known='N', flip_output=False, num_of_iterations=None):
+    def __init__(self, clause_list=[], input_arr=[], search_keyword=None, solution_known='N', flip_output=False, num_of_iterations=None,
+                 clause_type=constants.XOR_CLAUSES, num_of_variables=None, group_size=None):
+        """
+        :param clause_list: clauses of the unknown solution, lists of variables for XOR_CLAUSES, satisfied
+                            when their parity differs from input_arr[k], or lists of literals, variable q or ~q
+                            for its negation, for CNF_CLAUSES
+        :param clause_type: XOR_CLAUSES or CNF_CLAUSES
+        :param num_of_variables: number of input qubits of the unknown solution, by default the number of
+                                 clauses for XOR_CLAUSES and the largest variable plus one for CNF_CLAUSES
+        :param group_size: number of clauses computed at once on the reused clause qubits, see SATOracle
+        """
         super(GroversAlgorithm, self).__init__()
         self.clause_list = clause_list
         self.input_arr = input_arr
         self.search_keyword = search_keyword
         self.solution_known = solution_known
         self.flip_output = flip_output
-        self.num_of_qubits = len(self.clause_list) if self.solution_known == 'N' else len(str(search_keyword))
+        self.sat_oracle = None
+        if self.solution_known == 'N':
+            if num_of_variables is None and clause_type == constants.CNF_CLAUSES:
+                num_of_variables = max([~literal if literal < 0 else literal
+                                        for clause in clause_list for literal in clause], default=-1) + 1
+            self.num_of_qubits = len(self.clause_list) if num_of_variables is None else num_of_variables
+            parities = [int(not (index < len(input_arr) and input_arr[index] == 1))
+                        for index in range(len(clause_list))]
+            self.sat_oracle = SATOracle(clause_list, self.num_of_qubits, clause_type, parities, flip_output,
+                                        group_size)
+        else:
+            self.num_of_qubits = len(str(search_keyword))
         self.total_qubits = 0
         self.circuit = None
         self.provider = None
-        if num_of_iterations is None:
-            self.num_of_iterations = self.get_num_of_iterations()
+        self.num_of_iterations = self.get_num_of_iterations() if num_of_iterations is None else num_of_iterations
 
     def initialize(self, provider):
-        self.total_qubits = (2 * self.num_of_qubits) + 1 if self.solution_known == 'N' else (self.num_of_qubits + 1)
+        self.total_qubits = self.sat_oracle.num_qubits if self.solution_known == 'N' else (self.num_of_qubits + 1)
         self.circuit = QCircuit(self.total_qubits,  self.num_of_qubits)
         self.provider = provider
 
@@ -44,37 +71,13 @@ class GroversAlgorithm:
         for qubit in range(self.num_of_qubits):
             self.circuit.h_gate(qubit)
 
-        for index in range(len(self.input_arr)):
-            if self.input_arr[index] == 1:
-                self.circuit.x_gate(self.num_of_qubits + index)
-
         # Initialise output qubit in the |-⟩ state.
         self.circuit.x_gate(self.total_qubits - 1)
         self.circuit.h_gate(self.total_qubits - 1)
 
     def oracle_for_unknown_solution(self):
-        output_qubit = self.total_qubits - 1
-        clause_qubits = []
-
-        for index in range(len(self.clause_list)):
-            clause_qubit = self.num_of_qubits + index
-            self.XOR(self.clause_list[index], clause_qubit)
-            clause_qubits.append(clause_qubit)
-
-        if self.flip_output:
-            for index in range(len(clause_qubits)):
-                self.circuit.x_gate(clause_qubits[index])
-
-        # Flip 'output' bit if all clauses are satisfied
-        self.circuit.mct_gate(clause_qubits, output_qubit)
-
-        if self.flip_output:
-            for index in range(len(clause_qubits)):
-                self.circuit.x_gate(clause_qubits[index])
-
-        for index in range(len(self.clause_list)):
-            clause_qubit = self.num_of_qubits + index
-            self.XOR(self.clause_list[index], clause_qubit)
+        # the clause qubits start and end at zero, input_arr being folded into the clause parities
+        self.circuit.append_block(self.sat_oracle.block())
 
     def oracle_for_known_solution(self):
         output_qubit = self.total_qubits - 1
@@ -115,20 +118,92 @@ class GroversAlgorithm:
         for qubit in range(qubits):
             q_circuit.h_gate(qubit)
 
-    def execute(self, provider=providers.DEFAULT_PROVIDER, repetitions=10):
-        self.initialize(provider)
-
-        for _ in range(self.num_of_iterations):
+    def iteration_block(self):
+        """Returns the oracle followed by the diffuser as a Block, which the circuit
+        references once per iteration instead of copying its gates."""
+        circuit, self.circuit = self.circuit, QCircuit(self.total_qubits)
+        try:
             if self.solution_known == 'N':
                 self.oracle_for_unknown_solution()
             else:
                 self.oracle_for_known_solution()
             self.diffuser()
+            return self.circuit.to_block('grover_iteration')
+        finally:
+            self.circuit = circuit
+
+    def execute(self, provider=providers.DEFAULT_PROVIDER, repetitions=10, mode=constants.GROVER_CIRCUIT, seed=None):
+        """Runs the search and returns the counts of the input qubits.
+        :param mode: GROVER_CIRCUIT to execute the circuit on provider, or GROVER_ANALYTIC to apply the
+                     oracle and the diffuser to the amplitudes of the input qubits with NumPy, without
+                     the clause and output qubits
+        :param seed: seed of the sampling, making the counts reproducible
+        """
+        if mode == constants.GROVER_ANALYTIC:
+            return self.execute_analytic(repetitions, seed)
+        if mode != constants.GROVER_CIRCUIT:
+            raise CircuitError(ErrorMessages.GROVER_MODE_NOT_SUPPORTED, mode)
+        return self.build_circuit(provider).execute(provider=provider, repetitions=repetitions, seed=seed)
+
+    def build_circuit(self, provider=providers.DEFAULT_PROVIDER):
+        """Builds and returns the measured search circuit, referencing the iteration block once."""
+        self.initialize(provider)
+
+        self.circuit.append_block(self.iteration_block(), repetitions=self.num_of_iterations)
 
         for i in range(self.num_of_qubits):
             self.circuit.measure(i)
 
-        return self.circuit.execute(provider=provider, repetitions=repetitions)
+        return self.circuit
+
+    @classmethod
+    def execute_batch(cls, clause_lists, provider=providers.DEFAULT_PROVIDER, repetitions=10,
+                      mode=constants.GROVER_CIRCUIT, seed=None, **settings):
+        """Solves many instances in a single submission, e.g. clause lists of the same shape.
+        :param clause_lists: list of clause_list, one per instance
+        :param settings: other GroversAlgorithm arguments, shared by all instances
+        :return: list with the counts of each instance, in the order of clause_lists
+        """
+        instances = [cls(clause_list=clause_list, **settings) for clause_list in clause_lists]
+        if mode == constants.GROVER_ANALYTIC:
+            return [instance.execute_analytic(repetitions, seed) for instance in instances]
+        if mode != constants.GROVER_CIRCUIT:
+            raise CircuitError(ErrorMessages.GROVER_MODE_NOT_SUPPORTED, mode)
+        circuits = [instance.build_circuit(provider) for instance in instances]
+        return execute_batch(circuits, provider=provider, repetitions=repetitions, seed=seed)
+
+    def marked_states(self):
+        """Returns the sorted basis states whose phase the oracle flips, bit i being input qubit i."""
+        if self.solution_known != 'N':
+            keyword = str(self.search_keyword)
+            return np.array([sum(1 << index for index, digit in enumerate(keyword) if int(digit))], dtype=np.int64)
+        size = 1 << self.num_of_qubits
+        marked = []
+        for start in range(0, size, CHUNK_STATES):
+            states = np.arange(start, min(start + CHUNK_STATES, size), dtype=np.int64)
+            marked.append(states[self.sat_oracle.satisfied(states)])
+        return np.concatenate(marked)
+
+    def execute_analytic(self, repetitions=10, seed=None):
+        """Samples the input qubits after the iterations without building the circuit.
+
+        The oracle flips the sign of the marked amplitudes and the diffuser reflects every
+        amplitude about their mean, so starting from the uniform superposition all marked states
+        keep one amplitude and all other states another. With M of the N states marked and
+        sin(theta) = sqrt(M / N), k iterations leave the marked states a total probability of
+        sin((2k + 1) theta) ** 2, uniform among them, and only the marked states are stored.
+        """
+        rng = np.random.default_rng(seed)
+        marked = self.marked_states()
+        size = 1 << self.num_of_qubits
+        theta = np.arcsin(np.sqrt(len(marked) / size))
+        marked_probability = np.sin((2 * self.num_of_iterations + 1) * theta) ** 2
+        hits = repetitions if len(marked) == size else rng.binomial(repetitions, marked_probability)
+        values = marked[rng.integers(0, len(marked), size=hits)]
+        # the r-th unmarked state is r plus the number of marked states before it
+        others = rng.integers(0, size - len(marked), size=repetitions - hits)
+        others += np.searchsorted(marked - np.arange(len(marked)), others, side='right')
+        return Counts.from_values(np.concatenate([values, others]), [self.num_of_qubits]).to_dict()
 
     def draw_grovers_circuit(self):
         return self.circuit.draw_circuit(provider=self.provider)
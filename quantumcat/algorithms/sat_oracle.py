@@ -0,0 +1,166 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Grover oracles marking the assignments that satisfy every clause of a XOR-SAT or CNF formula.
+
+Clauses are computed onto a few reused work qubits. The clauses are split in
+groups of group_size: the clauses of a group are computed onto the work
+qubits, their AND is written to the qubit of the group and the work qubits
+are uncomputed for the next group. The AND of the group qubits flips the
+output qubit and the groups are then computed again to uncompute their
+qubits. m clauses thus need about 2 sqrt(m) qubits instead of m, for twice
+the clause gates. Multi-controlled gates borrow idle qubits as ancillas.
+"""
+
+import math
+import numpy as np
+from quantumcat.circuit import QCircuit
+from quantumcat.exceptions import CircuitError
+from quantumcat.utils import ErrorMessages, constants
+
+
+def and_gate(q_circuit, control_qubits, target_qubit, clean_qubits=(), dirty_qubits=()):
+    """Flips target_qubit when all control_qubits are 1, with the cheapest multi-controlled X the idle
+    qubits allow: a v-chain on enough clean ancillas, else a recursion on one clean or dirty ancilla."""
+    control_qubits = list(control_qubits)
+    required = len(control_qubits) - 2
+    if required > 0 and len(clean_qubits) >= required:
+        q_circuit.mct_gate(control_qubits, target_qubit, list(clean_qubits[:required]), 'v-chain')
+    elif required > 0 and len(clean_qubits) + len(dirty_qubits) > 0:
+        q_circuit.mct_gate(control_qubits, target_qubit, (list(clean_qubits) + list(dirty_qubits))[:1], 'recursion')
+    else:
+        q_circuit.mct_gate(control_qubits, target_qubit)
+
+
+class SATOracle:
+    """Oracle flipping its output qubit on the assignments that satisfy every clause.
+
+    Qubits 0 to num_variables - 1 hold the variables, followed by the work
+    qubits, the group qubits when there is more than one group, and the output
+    qubit. A XOR clause is a list of variables and is satisfied when their
+    parity is parities[k]. A CNF clause is a list of literals, variable q or
+    ~q for its negation, and is satisfied when any literal is true.
+    """
+
+    def __init__(self, clauses, num_variables, clause_type=constants.XOR_CLAUSES, parities=None, flip=False,
+                 group_size=None):
+        """
+        :param clauses: list of clauses
+        :param num_variables: number of variables
+        :param clause_type: XOR_CLAUSES or CNF_CLAUSES
+        :param parities: parity satisfying each XOR clause, 1 by default
+        :param flip: inverts the value of every clause before their AND
+        :param group_size: number of clauses computed at once, about sqrt(len(clauses)) by default
+                           and all of them when that saves no qubit
+        """
+        super(SATOracle, self).__init__()
+        if clause_type not in (constants.XOR_CLAUSES, constants.CNF_CLAUSES):
+            raise CircuitError(ErrorMessages.CLAUSE_TYPE_NOT_SUPPORTED, clause_type)
+        self.clauses = [list(clause) for clause in clauses]
+        self.num_variables = num_variables
+        self.clause_type = clause_type
+        self.parities = [1] * len(self.clauses) if parities is None else list(parities)
+        self.flip = bool(flip)
+        num_clauses = len(self.clauses)
+        if group_size is None:
+            group_size = max(1, math.ceil(math.sqrt(num_clauses)))
+            if group_size + math.ceil(num_clauses / group_size) >= num_clauses:
+                group_size = num_clauses
+        group_size = max(1, min(group_size, num_clauses))
+        self.groups = [list(range(start, min(start + group_size, num_clauses)))
+                       for start in range(0, num_clauses, group_size)]
+        self.work_qubits = list(range(num_variables, num_variables + group_size))
+        start = num_variables + group_size
+        self.group_qubits = list(range(start, start + len(self.groups))) if len(self.groups) > 1 else []
+        self.output_qubit = start + len(self.group_qubits)
+        self.num_qubits = self.output_qubit + 1
+        self.cached_block = None
+
+    def compute_clauses(self, q_circuit, group):
+        """Sets work qubit i to the value of the i-th clause of group, from all zeros."""
+        variables = range(self.num_variables)
+        for clause_index, work_qubit in zip(group, self.work_qubits):
+            clause = self.clauses[clause_index]
+            if self.clause_type == constants.XOR_CLAUSES:
+                for qubit in clause:
+                    q_circuit.cx_gate(qubit, work_qubit)
+                value = 1 - self.parities[clause_index]
+            else:
+                literals = {}
+                for literal in clause:
+                    qubit, negated = (~literal, True) if literal < 0 else (literal, False)
+                    literals[qubit] = None if literals.get(qubit, negated) != negated else negated
+                if None in literals.values():
+                    # q or not q always holds
+                    value = 1
+                elif literals:
+                    # the clause is false when every literal is, i.e. not (all qubits at their false value)
+                    positive = [qubit for qubit, negated in literals.items() if not negated]
+                    for qubit in positive:
+                        q_circuit.x_gate(qubit)
+                    and_gate(q_circuit, list(literals), work_qubit,
+                             dirty_qubits=[qubit for qubit in variables if qubit not in literals])
+                    for qubit in positive:
+                        q_circuit.x_gate(qubit)
+                    value = 1
+                else:
+                    value = 0
+            if value ^ self.flip:
+                q_circuit.x_gate(work_qubit)
+
+    def group_block(self, group, target_qubit):
+        """Block writing the AND of the clauses of group to target_qubit, leaving the work qubits at zero."""
+        compute = QCircuit(self.num_qubits)
+        self.compute_clauses(compute, group)
+        compute = compute.to_block('clauses')
+        q_circuit = QCircuit(self.num_qubits)
+        q_circuit.append_block(compute)
+        and_gate(q_circuit, self.work_qubits[:len(group)], target_qubit,
+                 clean_qubits=self.work_qubits[len(group):], dirty_qubits=list(range(self.num_variables)))
+        q_circuit.append_block(compute.inverse())
+        return q_circuit.to_block('clause_group')
+
+    def block(self):
+        """Returns the oracle as a Block, built on the first call."""
+        if self.cached_block is None:
+            q_circuit = QCircuit(self.num_qubits)
+            if len(self.group_qubits) == 0:
+                q_circuit.append_block(self.group_block(self.groups[0] if self.groups else [], self.output_qubit))
+            else:
+                group_blocks = [self.group_block(group, qubit) for group, qubit in zip(self.groups,
+                                                                                        self.group_qubits)]
+                for group_block in group_blocks:
+                    q_circuit.append_block(group_block)
+                and_gate(q_circuit, self.group_qubits, self.output_qubit, clean_qubits=self.work_qubits)
+                for group_block in reversed(group_blocks):
+                    q_circuit.append_block(group_block)
+            self.cached_block = q_circuit.to_block('sat_oracle')
+        return self.cached_block
+
+    def satisfied(self, states):
+        """Returns whether each basis state of the variables, bit q being variable q, satisfies every clause."""
+        states = np.asarray(states, dtype=np.int64)
+        satisfied = np.ones(len(states), dtype=bool)
+        for clause, parity in zip(self.clauses, self.parities):
+            if self.clause_type == constants.XOR_CLAUSES:
+                value = np.full(len(states), parity ^ 1, dtype=np.int64)
+                for qubit in clause:
+                    value ^= states >> qubit & 1
+                value = value == 1
+            else:
+                value = np.zeros(len(states), dtype=bool)
+                for literal in clause:
+                    value |= (states >> (~literal if literal < 0 else literal) & 1) == (literal >= 0)
+            satisfied &= value ^ self.flip
+        return satisfied
@@ -0,0 +1,78 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Registry of provider backends.
+
+A backend is a module exposing convert(q_circuit), extend(q_circuit,
+converted_circuit, start), execute(q_circuit, converted_circuit,
+simulator_name, repetitions, **options) and draw(converted_circuit, filename,
+output). extend translates the operations appended since converted_circuit
+was built, starting at index start, and returns the updated circuit.
+Backends may also expose execute_batch(q_circuits, converted_circuits,
+simulator_name, repetitions, **options) to run many circuits in one
+submission; otherwise execute is called for each circuit. Backends of remote
+providers may expose submit, job_statuses, job_result and cancel_job to run
+circuits as jobs, see quantumcat.circuit.jobs. Backend modules import their
+provider SDK at module level, so they are only imported the first time the
+provider is used and `import quantumcat` stays free of any SDK.
+"""
+
+import time
+from importlib import import_module
+from quantumcat.exceptions import ProviderNotFoundError
+from quantumcat.utils import providers, ErrorMessages
+
+BACKENDS = {
+    providers.IBM_PROVIDER: 'quantumcat.backends.qiskit_backend',
+    providers.GOOGLE_PROVIDER: 'quantumcat.backends.cirq_backend',
+    providers.IONQ_PROVIDER: 'quantumcat.backends.ionq_backend',
+    providers.AMAZON_PROVIDER: 'quantumcat.backends.braket_backend',
+    providers.NATIVE_PROVIDER: 'quantumcat.backends.native_backend',
+}
+
+_loaded = {}
+_load_seconds = {}
+
+
+def register_backend(provider, module_name):
+    """Registers (or replaces) the backend module used for a provider.
+    :param provider: provider name passed to QCircuit.execute
+    :param module_name: importable module implementing the backend functions
+    """
+    BACKENDS[provider] = module_name
+    _loaded.pop(provider, None)
+    _load_seconds.pop(provider, None)
+
+
+def get_backend(provider):
+    """Returns the backend module of a provider, importing it on first use."""
+    backend = _loaded.get(provider)
+    if backend is None:
+        if provider not in BACKENDS:
+            raise ProviderNotFoundError(ErrorMessages.PROVIDER_NOT_SUPPORTED, str(provider))
+        start = time.perf_counter()
+        backend = import_module(BACKENDS[provider])
+        _load_seconds[provider] = time.perf_counter() - start
+        _loaded[provider] = backend
+    return backend
+
+
+def loaded_backends():
+    """Returns the providers whose backend has been imported so far."""
+    return list(_loaded)
+
+
+def load_times():
+    """Returns the seconds spent importing each loaded backend, SDK included."""
+    return dict(_load_seconds)
@@ -0,0 +1,278 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from functools import partial
+from braket.circuits import Circuit, Instruction
+from braket.circuits.result_type import ResultType
+from braket.devices import LocalSimulator
+from braket.aws import AwsDevice
+from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.parameter import is_parameterized, bind_params
+from quantumcat.simulators import StatevectorSimulator, sampling, as_statevector
+from quantumcat.utils import constants, gates_map, helper, instrumentation
+
+
+class ParameterizedCircuit:
+    """Braket circuit with unbound quantumcat Parameters.
+
+    The supported braket SDK has no free parameters, so runs of operations
+    without Parameters are converted once into fixed circuits and only the
+    parameterized operations are converted when the circuit is bound.
+    """
+
+    def __init__(self):
+        super(ParameterizedCircuit, self).__init__()
+        self.segments = []
+
+    def add_operation(self, op_type, qargs, params, extra=None):
+        if is_parameterized(params):
+            self.segments.append((op_type, qargs, params))
+        else:
+            if len(self.segments) == 0 or not isinstance(self.segments[-1], Circuit):
+                self.segments.append(Circuit())
+            add_operation(self.segments[-1], op_type, qargs, params, extra)
+
+    def bind(self, values):
+        braket_qc = Circuit()
+        for segment in self.segments:
+            if isinstance(segment, Circuit):
+                braket_qc.add_circuit(segment)
+            else:
+                op_type, qargs, params = segment
+                add_operation(braket_qc, op_type, qargs, bind_params(params, values))
+        return braket_qc
+
+    def __str__(self):
+        return '\n'.join(str(segment) for segment in self.segments)
+
+
+def to_braket(q_circuit, qubits):
+    braket_qc = ParameterizedCircuit() if q_circuit.parameters else Circuit()
+    return add_to_braket(braket_qc, q_circuit.operations)
+
+
+def add_to_braket(braket_qc, operations, start=0):
+    """Translates operations[start:] onto an existing braket circuit."""
+    extras = operations.extras
+    for index, (op_type, qargs, params) in enumerate(operations.iterate(start), start):
+        if isinstance(braket_qc, ParameterizedCircuit):
+            braket_qc.add_operation(op_type, qargs, params, extras.get(index))
+        else:
+            add_operation(braket_qc, op_type, qargs, params, extras.get(index))
+
+    return braket_qc
+
+
+def add_operation(braket_qc, op_type, qargs, params, extra=None):
+    if op_type == OpType.block:
+        emit_block(braket_qc, qargs, params, extra)
+    else:
+        EMITTERS[op_type](braket_qc, qargs, params)
+
+
+def emit_block(braket_qc, qargs, params, block):
+    """Adds the braket circuit of a block, converted once per block, mapped onto qargs."""
+    block_qc = block.converted(__name__, lambda block: to_braket(block, block.qubits))
+    target_mapping = {qubit: qargs[int(qubit)] for qubit in block_qc.qubits}
+    for _ in range(params[0]):
+        braket_qc.add_circuit(block_qc, target_mapping=target_mapping)
+
+
+def emit_measure(braket_qc, qargs, params):
+    braket_qc.add(ResultType.Probability(target=[qargs[0]]))
+
+
+def emit_measure_all(braket_qc, qargs, params):
+    braket_qc.add(ResultType.Probability)
+
+
+def emit_gate(gate, braket_qc, qargs, params):
+    braket_qc.add([Instruction(gate(*params), qargs)])
+
+
+def emit_custom_gate(name, matrix, braket_qc, qargs, params):
+    """Adds a quantumcat custom gate as a unitary, labelled with its name and params."""
+    angles = '('+','.join(str(x) for x in params)+')' if len(params) > 0 else ''
+    braket_qc.unitary(display_name=name+angles, matrix=matrix(*params), targets=[*qargs])
+
+
+def emitters():
+    """Builds the table from OpType to the function adding it to a braket circuit.
+    Each emitter takes (braket_qc, qargs, params)."""
+    table = {OpType.measure: emit_measure, OpType.measure_all: emit_measure_all}
+    for op_type, gate in gates_map.quantumcat_to_braket.items():
+        if op_type not in table:
+            # only the quantumcat custom gates have a display name
+            name = helper.display_name(op_type)
+            table[op_type] = partial(emit_gate, gate) if name is None else partial(emit_custom_gate, name, gate)
+    return table
+
+
+EMITTERS = emitters()
+
+
+def braket_counts(results, counts_format=constants.COUNTS_DICT, operations=(), num_qubits=None, num_cbits=0):
+    """Returns the measurement counts of braket for COUNTS_DICT. The measured qubits are laid out as
+    the classical bits of the native simulator for COUNTS_SHOTS and COUNTS_ARRAY: measuring qubit q
+    sets classical bit q and measure_all a separate register.
+    :param operations: Operations of the circuit, measuring all qubits when empty
+    :param num_qubits: number of qubits of the circuit, by default inferred from the measured qubits
+    :param num_cbits: number of classical bits of the circuit
+    """
+    if counts_format == constants.COUNTS_DICT:
+        return dict(results.measurement_counts)
+    # results.measurements only has a column for each qubit the circuit uses
+    column = {qubit: index for index, qubit in enumerate(results.measured_qubits)}
+    num_qubits = max(column) + 1 if num_qubits is None else num_qubits
+    measured, measure_all, cbits_width, register_widths = \
+        StatevectorSimulator.registers(operations, num_qubits, num_cbits)
+    qubits = [qubit for qubit in measured if qubit in column]
+    positions = list(qubits)
+    if measure_all:
+        used = [qubit for qubit in range(num_qubits) if qubit in column]
+        qubits.extend(used)
+        positions.extend(cbits_width + qubit for qubit in used)
+    bits = sampling.place_bits(results.measurements[:, [column[qubit] for qubit in qubits]], positions,
+                               sum(register_widths))
+    return sampling.format_bits(bits, register_widths, counts_format)
+
+
+def on_braket(q_circuit, simulator_name, repetitions, device, bucket, directory,
+              poll_timeout_seconds, poll_interval_seconds, counts_format=constants.COUNTS_DICT,
+              precision=constants.PRECISION_DOUBLE, operations=(), num_qubits=None, num_cbits=0):
+    if device is None:
+        with instrumentation.span(instrumentation.BACKEND, simulator=simulator_name):
+            simulator = LocalSimulator()
+        if simulator_name == constants.DEFAULT_SIMULATOR:
+            with instrumentation.span(instrumentation.SIMULATE, shots=repetitions):
+                results = simulator.run(q_circuit, shots=repetitions).result()
+            with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+                counts = braket_counts(results, counts_format, operations, num_qubits, num_cbits)
+                phase.count_result(counts)
+            return counts
+        elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+            with instrumentation.span(instrumentation.SIMULATE) as phase:
+                # the local simulator always computes in double precision
+                state = as_statevector(simulator.run(q_circuit.state_vector(), shots=repetitions).result().values[0],
+                                       precision)
+                phase.count_result(state)
+            return state
+    else:
+        s3_location = (bucket, directory)
+        aws_real_device = AwsDevice(device)
+        return aws_real_device.run(q_circuit, s3_location, shots=repetitions,
+                                   poll_timeout_seconds=poll_timeout_seconds,
+                                   poll_interval_seconds=poll_interval_seconds)
+
+
+def on_braket_batch(q_circuits, simulator_name, repetitions, device, bucket, directory,
+                    poll_timeout_seconds, poll_interval_seconds, counts_format=constants.COUNTS_DICT,
+                    precision=constants.PRECISION_DOUBLE, operations_list=None, sizes=None):
+    """Runs all circuits, as a single task batch on an AWS device.
+    :param operations_list: Operations of each circuit
+    :param sizes: (number of qubits, number of classical bits) of each circuit, by default inferred
+    :return: list with the result of each circuit, in order
+    """
+    if device is None:
+        # the local simulator has no batch API in the supported SDK version, reuse one instance
+        simulator = LocalSimulator()
+        if simulator_name == constants.DEFAULT_SIMULATOR:
+            operations_list = [()] * len(q_circuits) if operations_list is None else operations_list
+            sizes = [(None, 0)] * len(q_circuits) if sizes is None else sizes
+            return [braket_counts(simulator.run(q_circuit, shots=repetitions).result(), counts_format, operations,
+                                  *size)
+                    for q_circuit, operations, size in zip(q_circuits, operations_list, sizes)]
+        elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+            return [as_statevector(simulator.run(q_circuit.state_vector(), shots=repetitions).result().values[0],
+                                   precision)
+                    for q_circuit in q_circuits]
+    else:
+        s3_location = (bucket, directory)
+        aws_real_device = AwsDevice(device)
+        return aws_real_device.run_batch(q_circuits, s3_location, shots=repetitions,
+                                         poll_timeout_seconds=poll_timeout_seconds,
+                                         poll_interval_seconds=poll_interval_seconds).tasks
+
+
+# braket task states, CREATED and QUEUED being queued
+JOB_STATUSES = {
+    'RUNNING': constants.JOB_RUNNING,
+    'CANCELLING': constants.JOB_RUNNING,
+    'COMPLETED': constants.JOB_DONE,
+    'CANCELLED': constants.JOB_CANCELLED,
+    'FAILED': constants.JOB_FAILED,
+}
+
+
+def submit(q_circuit, converted_circuit, simulator_name, repetitions, device=None, bucket=None,
+           directory=None, poll_timeout_seconds=100, poll_interval_seconds=10, **options):
+    """Creates the task on the AWS device and returns it without waiting for it.
+    Circuits for the local simulator are left to the local job pool."""
+    if device is None:
+        return None
+    return AwsDevice(device).run(converted_circuit, (bucket, directory), shots=repetitions,
+                                 poll_timeout_seconds=poll_timeout_seconds,
+                                 poll_interval_seconds=poll_interval_seconds)
+
+
+def job_statuses(handles):
+    return [JOB_STATUSES.get(task.state(), constants.JOB_QUEUED) for task in handles]
+
+
+def job_result(q_circuit, handle, simulator_name, counts_format=constants.COUNTS_DICT):
+    return braket_counts(handle.result(), counts_format, q_circuit.operations, q_circuit.qubits, q_circuit.cbits)
+
+
+def cancel_job(handle):
+    handle.cancel()
+
+
+def convert(q_circuit):
+    return to_braket(q_circuit, q_circuit.qubits)
+
+
+def extend(q_circuit, converted_circuit, start):
+    operations = q_circuit.operations
+    if isinstance(converted_circuit, Circuit) and is_parameterized(operations.params[operations.param_offsets[start]:]):
+        return convert(q_circuit)
+    return add_to_braket(converted_circuit, operations, start)
+
+
+def bind(q_circuit, converted_circuit, values):
+    if isinstance(converted_circuit, ParameterizedCircuit):
+        return converted_circuit.bind(values)
+    return converted_circuit
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, device=None, bucket=None,
+            directory=None, poll_timeout_seconds=100, poll_interval_seconds=10,
+            counts_format=constants.COUNTS_DICT, precision=constants.PRECISION_DOUBLE, **options):
+    return on_braket(converted_circuit, simulator_name, repetitions, device, bucket, directory,
+                     poll_timeout_seconds=poll_timeout_seconds,
+                     poll_interval_seconds=poll_interval_seconds, counts_format=counts_format, precision=precision,
+                     operations=q_circuit.operations, num_qubits=q_circuit.qubits, num_cbits=q_circuit.cbits)
+
+
+def execute_batch(q_circuits, converted_circuits, simulator_name, repetitions, device=None, bucket=None,
+                  directory=None, poll_timeout_seconds=100, poll_interval_seconds=10,
+                  counts_format=constants.COUNTS_DICT, precision=constants.PRECISION_DOUBLE, **options):
+    return on_braket_batch(converted_circuits, simulator_name, repetitions, device, bucket, directory,
+                           poll_timeout_seconds=poll_timeout_seconds,
+                           poll_interval_seconds=poll_interval_seconds, counts_format=counts_format,
+                           precision=precision, operations_list=[q_circuit.operations for q_circuit in q_circuits],
+                           sizes=[(q_circuit.qubits, q_circuit.cbits) for q_circuit in q_circuits])
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    print(converted_circuit)
@@ -0,0 +1,258 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import cirq
+import numpy
+from functools import partial
+import sympy
+from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.parameter import Parameter, is_parameterized
+from quantumcat.simulators import Counts, StatevectorSimulator, sampling, as_statevector, precision_dtype
+from quantumcat.utils import constants, gates_map, helper, instrumentation
+
+
+class SymbolicGate(cirq.Gate):
+    """Gate with sympy symbols among its params. cirq resolves it to the quantumcat
+    custom gate built from the bound values, so the circuit can be swept without
+    converting it again."""
+
+    def __init__(self, gate, params, num_qubits):
+        super(SymbolicGate, self).__init__()
+        self.gate = gate
+        self.params = params
+        self.num_qubits = num_qubits
+
+    def _num_qubits_(self):
+        return self.num_qubits
+
+    def _is_parameterized_(self):
+        return True
+
+    def _parameter_names_(self):
+        return {param.name for param in self.params if isinstance(param, sympy.Symbol)}
+
+    def _resolve_parameters_(self, resolver, recursive=True):
+        return self.gate(*[resolver.value_of(param, recursive) for param in self.params])
+
+    def _circuit_diagram_info_(self, args):
+        label = '{}({})'.format(self.gate.__name__, ','.join(str(param) for param in self.params))
+        return cirq.CircuitDiagramInfo(wire_symbols=(label,) * self.num_qubits)
+
+
+def to_cirq(q_circuit, qubits):
+    """This function converts quantumcat circuit into cirq circuit.
+    :param q_circuit: quantumcat circuit object that needs to be converted to cirq circuit object
+    :param qubits: number of qubits to create cirq circuit
+    :return: cirq circuit object
+    """
+    return add_to_cirq(cirq.Circuit(), q_circuit.operations, qubits)
+
+
+def add_to_cirq(cirq_qc, operations, qubits, start=0):
+    """Translates operations[start:] onto an existing cirq circuit.
+    :param cirq_qc: cirq circuit object built from operations[:start]
+    :param operations: Operations of the quantumcat circuit
+    :param qubits: number of qubits of the circuit
+    :param start: index of the first operation to translate
+    :return: cirq circuit object
+    """
+    # named_qubits[i] is the NamedQubit of qubit i
+    named_qubits = cirq.NamedQubit.range(qubits, prefix='q')
+    extras = operations.extras
+    cirq_ops = [emit_block(named_qubits, qargs, params, extras[index]) if op_type == OpType.block
+                else EMITTERS[op_type](named_qubits, qargs, params)
+                for index, (op_type, qargs, params) in enumerate(operations.iterate(start), start)]
+    return with_operations(cirq_qc, cirq_ops)
+
+
+def emit_block(named_qubits, qargs, params, block):
+    """Emits a block as a CircuitOperation of its cirq circuit, converted once per block."""
+    frozen_circuit = block.converted(__name__, lambda block: cirq.FrozenCircuit(to_cirq(block, block.qubits)))
+    block_qubits = cirq.NamedQubit.range(block.qubits, prefix='q')
+    qubit_map = {block_qubits[index]: named_qubits[qubit] for index, qubit in enumerate(qargs)
+                 if block_qubits[index] in frozen_circuit.all_qubits()}
+    return cirq.CircuitOperation(frozen_circuit, repetitions=params[0], qubit_map=qubit_map)
+
+
+def emit_measure(named_qubits, qargs, params):
+    return cirq.ops.measure(named_qubits[qargs[0]])
+
+
+def emit_measure_all(named_qubits, qargs, params):
+    return cirq.ops.measure(*named_qubits, key='result')
+
+
+def emit_mct(named_qubits, qargs, params):
+    controls, target = helper.named_qubits_for_multi_controlled_op(named_qubits, qargs)
+    return cirq.ops.X(target).controlled_by(*controls)
+
+
+def emit_gate(gate, named_qubits, qargs, params):
+    """Emits a cirq gate instance such as cirq.X, which takes no params."""
+    return gate.on(*helper.named_qubits_for_ops(named_qubits, qargs))
+
+
+def emit_custom_gate(gate, named_qubits, qargs, params):
+    """Emits a quantumcat custom gate class, instantiated with the params of the operation."""
+    if is_parameterized(params):
+        symbols = [sympy.Symbol(param.name) if isinstance(param, Parameter) else param for param in params]
+        return SymbolicGate(gate, symbols, len(qargs)).on(*helper.named_qubits_for_ops(named_qubits, qargs))
+    return gate(*params).on(*helper.named_qubits_for_ops(named_qubits, qargs))
+
+
+def emitters():
+    """Builds the table from OpType to the function emitting its cirq operation.
+    Each emitter takes (named_qubits, qargs, params) and returns the cirq operation."""
+    table = {OpType.measure: emit_measure, OpType.measure_all: emit_measure_all, OpType.mct_gate: emit_mct}
+    for op_type, gate in gates_map.quantumcat_to_cirq.items():
+        if op_type not in table:
+            # the map holds cirq gate instances and quantumcat custom gate classes
+            table[op_type] = partial(emit_custom_gate if isinstance(gate, type) else emit_gate, gate)
+    return table
+
+
+EMITTERS = emitters()
+
+
+def with_operations(cirq_qc, cirq_ops):
+    """Returns a circuit with cirq_ops appended to cirq_qc as cirq's EARLIEST insert strategy would.
+    Each operation goes in the moment after the last one using any of its qubits, tracked per
+    qubit, and the circuit is built from the complete list of moments at once."""
+    moments = [list(moment.operations) for moment in cirq_qc]
+    frontier = {}
+    for index, moment in enumerate(moments):
+        for cirq_operation in moment:
+            for qubit in cirq_operation.qubits:
+                frontier[qubit] = index
+    for cirq_operation in cirq_ops:
+        index = max((frontier.get(qubit, -1) for qubit in cirq_operation.qubits), default=-1) + 1
+        if index == len(moments):
+            moments.append([])
+        moments[index].append(cirq_operation)
+        for qubit in cirq_operation.qubits:
+            frontier[qubit] = index
+    return cirq.Circuit(cirq.Moment(moment) for moment in moments)
+
+
+def cirq_counts(result, operations, counts_format=constants.COUNTS_DICT, num_qubits=None, num_cbits=0):
+    """Counts the measurements of a cirq result from its measurement arrays. For COUNTS_DICT the
+    measured qubits are read in reverse order, the first measured qubit being the last character.
+    COUNTS_SHOTS and COUNTS_ARRAY are laid out as the classical bits of the native simulator: measuring
+    qubit q sets classical bit q and measure_all a separate register.
+    :param num_qubits: number of qubits of the circuit, by default inferred from the measurements
+    :param num_cbits: number of classical bits of the circuit
+    """
+    measurements = result.measurements
+    if counts_format == constants.COUNTS_DICT:
+        keys = helper.measure_qubits_index(operations) or ['result']
+        return Counts.from_bits(numpy.hstack([measurements[key] for key in keys])).to_dict()
+    if num_qubits is None:
+        num_qubits = measurements['result'].shape[1] if 'result' in measurements else \
+            max(int(key[1:]) for key in measurements) + 1
+    measured, measure_all, cbits_width, register_widths = \
+        StatevectorSimulator.registers(operations, num_qubits, num_cbits)
+    # the measurement of qubit q has key 'q<q>', measure_all has key 'result'
+    columns = [measurements[key] for key in helper.measure_qubits_index(operations)]
+    positions = list(measured)
+    if measure_all and 'result' in measurements:
+        columns.append(measurements['result'])
+        positions.extend(range(cbits_width, cbits_width + num_qubits))
+    bits = sampling.place_bits(numpy.hstack(columns), positions, sum(register_widths))
+    return sampling.format_bits(bits, register_widths, counts_format)
+
+
+def on_cirq(q_circuit, simulator_name, repetitions, api, operations, counts_format=constants.COUNTS_DICT,
+            seed=None, precision=constants.PRECISION_DOUBLE, num_qubits=None, num_cbits=0):
+    with instrumentation.span(instrumentation.BACKEND, simulator=simulator_name):
+        simulator = cirq.Simulator(dtype=precision_dtype(precision), seed=seed)
+    if simulator_name == constants.DEFAULT_SIMULATOR:
+        with instrumentation.span(instrumentation.SIMULATE, shots=repetitions):
+            result = simulator.run(q_circuit, repetitions=repetitions)
+        with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+            counts = cirq_counts(result, operations, counts_format, num_qubits, num_cbits)
+            phase.count_result(counts)
+        return counts
+    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+        with instrumentation.span(instrumentation.SIMULATE) as phase:
+            state = as_statevector(simulator.simulate(q_circuit).final_state_vector, precision)
+            phase.count_result(state)
+        return state
+
+
+def on_cirq_batch(q_circuits, simulator_name, repetitions, api, operations_list,
+                  counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, sizes=None):
+    """Runs all circuits with a single cirq simulator, sampling them through run_batch.
+    :param sizes: (number of qubits, number of classical bits) of each circuit, by default inferred
+    :return: list with the result of each circuit, in order
+    """
+    simulator = cirq.Simulator(dtype=precision_dtype(precision), seed=seed)
+    if simulator_name == constants.DEFAULT_SIMULATOR:
+        results = simulator.run_batch(q_circuits, repetitions=repetitions)
+        sizes = [(None, 0)] * len(operations_list) if sizes is None else sizes
+        return [cirq_counts(result[0], operations, counts_format, *size)
+                for result, operations, size in zip(results, operations_list, sizes)]
+    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+        return [as_statevector(simulator.simulate(q_circuit).final_state_vector, precision)
+                for q_circuit in q_circuits]
+
+
+def on_cirq_sweep(q_circuit, bindings, simulator_name, repetitions, operations,
+                  counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE,
+                  num_qubits=None, num_cbits=0):
+    """Sweeps a parameterized circuit over all bindings with a single cirq simulator call.
+    :return: list with the result of each binding, in order
+    """
+    simulator = cirq.Simulator(dtype=precision_dtype(precision), seed=seed)
+    resolvers = [cirq.ParamResolver(values) for values in bindings]
+    if simulator_name == constants.DEFAULT_SIMULATOR:
+        results = simulator.run_sweep(q_circuit, params=resolvers, repetitions=repetitions)
+        return [cirq_counts(result, operations, counts_format, num_qubits, num_cbits) for result in results]
+    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+        return [as_statevector(result.final_state_vector, precision)
+                for result in simulator.simulate_sweep(q_circuit, params=resolvers)]
+
+
+def convert(q_circuit):
+    return to_cirq(q_circuit, q_circuit.qubits)
+
+
+def extend(q_circuit, converted_circuit, start):
+    return add_to_cirq(converted_circuit, q_circuit.operations, q_circuit.qubits, start)
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, api=None,
+            counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, **options):
+    return on_cirq(converted_circuit, simulator_name, repetitions, api, q_circuit.operations, counts_format, seed,
+                   precision, q_circuit.qubits, q_circuit.cbits)
+
+
+def bind(q_circuit, converted_circuit, values):
+    return cirq.resolve_parameters(converted_circuit, cirq.ParamResolver(values))
+
+
+def execute_bindings(q_circuit, converted_circuit, bindings, simulator_name, repetitions,
+                     counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, **options):
+    return on_cirq_sweep(converted_circuit, bindings, simulator_name, repetitions, q_circuit.operations,
+                         counts_format, seed, precision, q_circuit.qubits, q_circuit.cbits)
+
+
+def execute_batch(q_circuits, converted_circuits, simulator_name, repetitions, api=None,
+                  counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, **options):
+    return on_cirq_batch(converted_circuits, simulator_name, repetitions, api,
+                         [q_circuit.operations for q_circuit in q_circuits], counts_format, seed, precision,
+                         [(q_circuit.qubits, q_circuit.cbits) for q_circuit in q_circuits])
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    print(converted_circuit)
@@ -0,0 +1,88 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import cirq.ionq as ionq
+from quantumcat.backends.cirq_backend import convert, extend, bind, draw, cirq_counts
+from quantumcat.exceptions import APIDetailsNotFoundError
+from quantumcat.utils import ErrorMessages, constants, instrumentation
+
+
+# Need testing on actual ionq device
+def on_ionq(q_circuit, repetitions, api, default_target, operations, counts_format=constants.COUNTS_DICT,
+            num_qubits=None, num_cbits=0):
+    with instrumentation.span(instrumentation.BACKEND, target=default_target):
+        service = ionq.Service(api_key=api, default_target=default_target)
+    with instrumentation.span(instrumentation.SIMULATE, shots=repetitions):
+        result = service.run(q_circuit, repetitions=repetitions)
+    with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+        counts = cirq_counts(result, operations, counts_format, num_qubits, num_cbits)
+        phase.count_result(counts)
+    return counts
+
+
+def on_ionq_batch(q_circuits, repetitions, api, default_target, operations_list,
+                  counts_format=constants.COUNTS_DICT, sizes=None):
+    service = ionq.Service(api_key=api, default_target=default_target)
+    sizes = [(None, 0)] * len(operations_list) if sizes is None else sizes
+    return [cirq_counts(service.run(q_circuit, repetitions=repetitions), operations, counts_format, *size)
+            for q_circuit, operations, size in zip(q_circuits, operations_list, sizes)]
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, api=None,
+            default_target='simulator', counts_format=constants.COUNTS_DICT, **options):
+    if api is None:
+        raise APIDetailsNotFoundError(ErrorMessages.IONQ_API_DETAILS_NOT_PROVIDED)
+    return on_ionq(converted_circuit, repetitions, api, default_target, q_circuit.operations, counts_format,
+                   q_circuit.qubits, q_circuit.cbits)
+
+
+def execute_batch(q_circuits, converted_circuits, simulator_name, repetitions, api=None,
+                  default_target='simulator', counts_format=constants.COUNTS_DICT, **options):
+    if api is None:
+        raise APIDetailsNotFoundError(ErrorMessages.IONQ_API_DETAILS_NOT_PROVIDED)
+    return on_ionq_batch(converted_circuits, repetitions, api, default_target,
+                         [q_circuit.operations for q_circuit in q_circuits], counts_format,
+                         [(q_circuit.qubits, q_circuit.cbits) for q_circuit in q_circuits])
+
+
+# ionq job statuses, ready and submitted being queued
+JOB_STATUSES = {
+    'running': constants.JOB_RUNNING,
+    'completed': constants.JOB_DONE,
+    'canceled': constants.JOB_CANCELLED,
+    'failed': constants.JOB_FAILED,
+    'deleted': constants.JOB_CANCELLED,
+}
+
+
+def submit(q_circuit, converted_circuit, simulator_name, repetitions, api=None, default_target='simulator',
+           **options):
+    """Creates the ionq job and returns it without waiting for it."""
+    if api is None:
+        raise APIDetailsNotFoundError(ErrorMessages.IONQ_API_DETAILS_NOT_PROVIDED)
+    service = ionq.Service(api_key=api, default_target=default_target)
+    return service.create_job(converted_circuit, repetitions=repetitions)
+
+
+def job_statuses(handles):
+    return [JOB_STATUSES.get(job.status(), constants.JOB_QUEUED) for job in handles]
+
+
+def job_result(q_circuit, handle, simulator_name, counts_format=constants.COUNTS_DICT):
+    return cirq_counts(handle.results().to_cirq_result(), q_circuit.operations, counts_format, q_circuit.qubits,
+                       q_circuit.cbits)
+
+
+def cancel_job(handle):
+    handle.cancel()
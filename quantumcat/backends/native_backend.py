@@ -0,0 +1,139 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from quantumcat.circuit.block import expand
+from quantumcat.simulators import StatevectorSimulator, StabilizerSimulator, MPSSimulator, is_clifford, sampling
+from quantumcat.utils import constants, instrumentation
+
+
+def native_simulator(simulator_name, seed=None, precision=constants.PRECISION_DOUBLE, max_bond_dimension=None,
+                     truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD):
+    """Returns the MPSSimulator for MPS_SIMULATOR and the StatevectorSimulator otherwise."""
+    if simulator_name == constants.MPS_SIMULATOR:
+        return MPSSimulator(seed, precision, max_bond_dimension, truncation_threshold)
+    return StatevectorSimulator(seed, precision)
+
+
+def on_native(q_circuit, simulator_name, repetitions, operations=None, simulator=None,
+              counts_format=constants.COUNTS_DICT):
+    """Runs the quantumcat operations directly on the built-in NumPy statevector simulator.
+    Counts of circuits of Clifford gates and measurements are sampled by the stabilizer simulator.
+    :param q_circuit: quantumcat circuit object
+    :param simulator_name: DEFAULT_SIMULATOR for counts, STATEVECTOR_SIMULATOR for the statevector,
+                           STABILIZER_SIMULATOR for counts from the stabilizer simulator only or
+                           MPS_SIMULATOR for counts from the matrix product state simulator
+    :param repetitions: number of shots
+    :param operations: operations to run instead of the expanded q_circuit.operations, e.g. with bound parameters
+    :param simulator: StatevectorSimulator, or MPSSimulator for MPS_SIMULATOR, to reuse
+    :param counts_format: COUNTS_DICT for qiskit style counts, COUNTS_ARRAY for Counts or
+                          COUNTS_SHOTS for the packed shots
+    :return: counts or statevector
+    """
+    operations = expand(q_circuit.operations) if operations is None else operations
+    simulator = native_simulator(simulator_name) if simulator is None else simulator
+    if simulator_name == constants.MPS_SIMULATOR:
+        return on_mps(q_circuit, repetitions, operations, simulator, counts_format)
+    if simulator_name == constants.STABILIZER_SIMULATOR or \
+            (simulator_name == constants.DEFAULT_SIMULATOR and is_clifford(operations)):
+        return on_stabilizer(q_circuit, repetitions, operations, StabilizerSimulator(simulator.rng), counts_format)
+    if simulator_name == constants.DEFAULT_SIMULATOR:
+        with instrumentation.span(instrumentation.SIMULATE, shots=repetitions):
+            counts = simulator.run_counts(operations, q_circuit.qubits, q_circuit.cbits, repetitions)
+        with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+            result = sampling.format_counts(counts, counts_format, simulator.rng)
+            phase.count_result(result)
+        return result
+    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+        with instrumentation.span(instrumentation.SIMULATE) as phase:
+            state = simulator.statevector(operations, q_circuit.qubits)
+            phase.count_result(state)
+        return state
+
+
+def on_stabilizer(q_circuit, repetitions, operations, simulator, counts_format=constants.COUNTS_DICT):
+    """Samples a circuit of Clifford gates and measurements in polynomial time.
+    :param simulator: StabilizerSimulator
+    :return: counts
+    """
+    with instrumentation.span(instrumentation.SIMULATE, shots=repetitions):
+        bits, register_widths = simulator.run_bits(operations, q_circuit.qubits, q_circuit.cbits, repetitions)
+    with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+        result = sampling.format_bits(bits, register_widths, counts_format)
+        phase.count_result(result)
+    return result
+
+
+def on_mps(q_circuit, repetitions, operations, simulator, counts_format=constants.COUNTS_DICT):
+    """Samples a circuit on the matrix product state simulator, recording the fidelity left by the
+    truncations and the largest bond dimension in the SIMULATE span.
+    :param simulator: MPSSimulator
+    :return: counts
+    """
+    with instrumentation.span(instrumentation.SIMULATE, shots=repetitions) as phase:
+        bits, register_widths = simulator.run_bits(operations, q_circuit.qubits, q_circuit.cbits, repetitions)
+        phase.count(fidelity=simulator.fidelity, bond_dimension=simulator.bond_dimension)
+    with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+        result = sampling.format_bits(bits, register_widths, counts_format)
+        phase.count_result(result)
+    return result
+
+
+def on_native_batch(q_circuits, simulator_name, repetitions, counts_format=constants.COUNTS_DICT, seed=None,
+                    precision=constants.PRECISION_DOUBLE, max_bond_dimension=None,
+                    truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD):
+    simulator = native_simulator(simulator_name, seed, precision, max_bond_dimension, truncation_threshold)
+    return [on_native(q_circuit, simulator_name, repetitions, simulator=simulator, counts_format=counts_format)
+            for q_circuit in q_circuits]
+
+
+def convert(q_circuit):
+    # the native simulator reads the operations directly, blocks expanded
+    return expand(q_circuit.operations)
+
+
+def extend(q_circuit, converted_circuit, start):
+    if converted_circuit is q_circuit.operations:
+        return convert(q_circuit)
+    return expand(q_circuit.operations, start, converted_circuit)
+
+
+def bind(q_circuit, converted_circuit, values):
+    return converted_circuit.bind(values)
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, counts_format=constants.COUNTS_DICT,
+            seed=None, precision=constants.PRECISION_DOUBLE, max_bond_dimension=None,
+            truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD, **options):
+    simulator = native_simulator(simulator_name, seed, precision, max_bond_dimension, truncation_threshold)
+    return on_native(q_circuit, simulator_name, repetitions, converted_circuit, simulator, counts_format)
+
+
+def execute_bindings(q_circuit, converted_circuit, bindings, simulator_name, repetitions,
+                     counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE,
+                     max_bond_dimension=None, truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD, **options):
+    simulator = native_simulator(simulator_name, seed, precision, max_bond_dimension, truncation_threshold)
+    return [on_native(q_circuit, simulator_name, repetitions, converted_circuit.bind(values), simulator,
+                      counts_format) for values in bindings]
+
+
+def execute_batch(q_circuits, converted_circuits, simulator_name, repetitions,
+                  counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE,
+                  max_bond_dimension=None, truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD, **options):
+    return on_native_batch(q_circuits, simulator_name, repetitions, counts_format, seed, precision,
+                           max_bond_dimension, truncation_threshold)
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    for op_type, qargs, params in converted_circuit:
+        print(op_type.name, qargs, params if params else '')
@@ -0,0 +1,249 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from functools import partial
+from qiskit import QuantumCircuit, ClassicalRegister, Aer, execute as qiskit_execute, IBMQ
+from qiskit.circuit import Parameter as QiskitParameter
+from qiskit.providers.ibmq import least_busy
+from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.parameter import Parameter, is_parameterized
+from quantumcat.simulators import sampling, as_statevector
+from quantumcat.utils import constants, gates_map, helper, instrumentation
+
+
+def to_qiskit(q_circuit, qubits, cbits):
+    """This function converts quantumcat circuit into qiskit circuit.
+    :param q_circuit: quantumcat circuit object that needs to be converted to qiskit circuit object
+    :param qubits: number of qubits to create qiskit circuit
+    :param cbits: number of classical bits for measurement
+    :return: qiskit quantumcircuit object
+    """
+    operations = q_circuit.operations
+    num_of_measurements = helper.num_of_measurements(operations)
+    if cbits > 0:
+        qiskit_qc = QuantumCircuit(qubits, cbits)
+    elif num_of_measurements > 0:
+        qiskit_qc = QuantumCircuit(qubits, qubits)
+    else:
+        qiskit_qc = QuantumCircuit(qubits)
+    # qiskit_qc = QuantumCircuit(qubits, qubits) if num_of_measurements > 0 else QuantumCircuit(qubits)
+    return add_to_qiskit(qiskit_qc, operations)
+
+
+def add_to_qiskit(qiskit_qc, operations, start=0):
+    """Translates operations[start:] onto an existing qiskit circuit.
+    :param qiskit_qc: qiskit quantumcircuit object built from operations[:start]
+    :param operations: Operations of the quantumcat circuit
+    :param start: index of the first operation to translate
+    :return: qiskit quantumcircuit object
+    """
+    # qiskit parameters are distinct objects even with the same name, so reuse the circuit's own
+    qiskit_params = {param.name: param for param in qiskit_qc.parameters}
+    for index, (op_type, qargs, params) in enumerate(operations.iterate(start), start):
+        if is_parameterized(params):
+            params = [qiskit_params.setdefault(param.name, QiskitParameter(param.name))
+                      if isinstance(param, Parameter) else param for param in params]
+        EMITTERS[op_type](qiskit_qc, qargs, params, operations.extras.get(index))
+
+    return qiskit_qc
+
+
+def emit_measure(qiskit_qc, qargs, params, extras):
+    qiskit_qc.measure(qargs, qargs[0])
+
+
+def emit_measure_all(qiskit_qc, qargs, params, extras):
+    qiskit_qc.measure_all()
+
+
+def emit_mct(qiskit_qc, qargs, params, extras):
+    ancilla_qubits, mode = extras
+    qiskit_qc.mcx(control_qubits=qargs[:-1], target_qubit=qargs[-1], ancilla_qubits=ancilla_qubits, mode=mode)
+
+
+def emit_block(qiskit_qc, qargs, params, block):
+    gate = block.converted(__name__, qiskit_gate)
+    for _ in range(params[0]):
+        qiskit_qc.append(gate, qargs)
+
+
+def qiskit_gate(block):
+    """Converts a block once into a qiskit gate that every reference appends."""
+    qiskit_qc = to_qiskit(block, block.qubits, 0)
+    qiskit_qc.name = block.name
+    return qiskit_qc.to_gate()
+
+
+def emit_gate(gate, qiskit_qc, qargs, params, extras):
+    qiskit_qc.append(gate(*params), qargs)
+
+
+def emitters():
+    """Builds the table from OpType to the function appending it to a qiskit circuit.
+    Each emitter takes (qiskit_qc, qargs, params, extras)."""
+    table = {OpType.measure: emit_measure, OpType.measure_all: emit_measure_all, OpType.mct_gate: emit_mct,
+             OpType.block: emit_block}
+    for op_type, gate in gates_map.quantumcat_to_qiskit.items():
+        if op_type not in table:
+            table[op_type] = partial(emit_gate, gate)
+    return table
+
+
+EMITTERS = emitters()
+
+
+def qiskit_backend(simulator_name, api, device_name, hub='ibm-q', group=None, project=None):
+    if api is None:
+        return Aer.get_backend(simulator_name)
+    IBMQ.save_account(api, overwrite=True)
+    IBMQ.load_account()
+    provider = IBMQ.get_provider(hub=hub, group=group, project=project)
+    return least_busy(provider.backends(simulator=False)) if device_name is None \
+        else provider.get_backend(device_name)
+
+
+def simulator_options(api, seed, precision):
+    """Run options of the job, the precision being an Aer option that devices do not accept."""
+    options = {'seed_simulator': seed}
+    if api is None:
+        options['precision'] = precision
+    return options
+
+
+def qiskit_result(results, simulator_name, experiment=None, counts_format=constants.COUNTS_DICT,
+                  precision=constants.PRECISION_DOUBLE):
+    if simulator_name == constants.DEFAULT_SIMULATOR:
+        if counts_format == constants.COUNTS_SHOTS:
+            return sampling.pack_bits(sampling.bits_from_strings(results.get_memory(experiment)))
+        return results.get_counts(experiment)
+    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
+        return as_statevector(results.get_statevector(experiment), precision)
+
+
+def on_qiskit(q_circuit, simulator_name, repetitions, api, device_name,
+              hub='ibm-q', group=None, project=None, counts_format=constants.COUNTS_DICT, seed=None,
+              precision=constants.PRECISION_DOUBLE):
+    with instrumentation.span(instrumentation.BACKEND, simulator=simulator_name):
+        backend = qiskit_backend(simulator_name, api, device_name, hub=hub, group=group, project=project)
+    memory = counts_format == constants.COUNTS_SHOTS
+    with instrumentation.span(instrumentation.SIMULATE, shots=repetitions):
+        results = qiskit_execute(q_circuit, backend, shots=repetitions, memory=memory,
+                                 **simulator_options(api, seed, precision)).result()
+    with instrumentation.span(instrumentation.POSTPROCESS) as phase:
+        result = qiskit_result(results, simulator_name, counts_format=counts_format, precision=precision)
+        phase.count_result(result)
+    return result
+
+
+def on_qiskit_batch(q_circuits, simulator_name, repetitions, api, device_name,
+                    hub='ibm-q', group=None, project=None, counts_format=constants.COUNTS_DICT, seed=None,
+                    precision=constants.PRECISION_DOUBLE):
+    """Submits all circuits as the experiments of a single qiskit job.
+    :return: list with the result of each circuit, in order
+    """
+    backend = qiskit_backend(simulator_name, api, device_name, hub=hub, group=group, project=project)
+    memory = counts_format == constants.COUNTS_SHOTS
+    results = qiskit_execute(q_circuits, backend, shots=repetitions, memory=memory,
+                             **simulator_options(api, seed, precision)).result()
+    return [qiskit_result(results, simulator_name, experiment, counts_format, precision)
+            for experiment in range(len(q_circuits))]
+
+
+def on_qiskit_bindings(q_circuit, bindings, simulator_name, repetitions, api, device_name,
+                       hub='ibm-q', group=None, project=None, counts_format=constants.COUNTS_DICT,
+                       seed=None, precision=constants.PRECISION_DOUBLE):
+    """Runs one experiment per binding of a parameterized circuit in a single qiskit job.
+    :return: list with the result of each binding, in order
+    """
+    backend = qiskit_backend(simulator_name, api, device_name, hub=hub, group=group, project=project)
+    parameter_binds = [{param: values[param.name] for param in q_circuit.parameters} for values in bindings]
+    memory = counts_format == constants.COUNTS_SHOTS
+    results = qiskit_execute(q_circuit, backend, shots=repetitions, memory=memory,
+                             parameter_binds=parameter_binds, **simulator_options(api, seed, precision)).result()
+    return [qiskit_result(results, simulator_name, experiment, counts_format, precision)
+            for experiment in range(len(bindings))]
+
+
+# qiskit JobStatus names, INITIALIZING and VALIDATING being queued
+JOB_STATUSES = {
+    'RUNNING': constants.JOB_RUNNING,
+    'DONE': constants.JOB_DONE,
+    'CANCELLED': constants.JOB_CANCELLED,
+    'ERROR': constants.JOB_FAILED,
+}
+
+
+def submit(q_circuit, converted_circuit, simulator_name, repetitions, api=None, device=None,
+           counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, **options):
+    """Submits the circuit and returns the qiskit job without waiting for it."""
+    backend = qiskit_backend(simulator_name, api, device)
+    return qiskit_execute(converted_circuit, backend, shots=repetitions,
+                          memory=counts_format == constants.COUNTS_SHOTS, **simulator_options(api, seed, precision))
+
+
+def job_statuses(handles):
+    return [JOB_STATUSES.get(job.status().name, constants.JOB_QUEUED) for job in handles]
+
+
+def job_result(q_circuit, handle, simulator_name, counts_format=constants.COUNTS_DICT):
+    return qiskit_result(handle.result(), simulator_name, counts_format=counts_format)
+
+
+def cancel_job(handle):
+    handle.cancel()
+
+
+def convert(q_circuit):
+    return to_qiskit(q_circuit, q_circuit.qubits, q_circuit.cbits)
+
+
+def extend(q_circuit, converted_circuit, start):
+    operations = q_circuit.operations
+    if q_circuit.cbits == 0 and operations.count(OpType.measure, stop=start) == 0 \
+            and operations.count(OpType.measure, start=start) > 0:
+        # to_qiskit creates this register before the one added by measure_all
+        if operations.count(OpType.measure_all, stop=start) > 0:
+            return convert(q_circuit)
+        converted_circuit.add_register(ClassicalRegister(q_circuit.qubits, 'c'))
+    return add_to_qiskit(converted_circuit, operations, start)
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, api=None, device=None,
+            counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, **options):
+    return on_qiskit(converted_circuit, simulator_name, repetitions, api, device, counts_format=counts_format,
+                     seed=seed, precision=precision)
+
+
+def bind(q_circuit, converted_circuit, values):
+    return converted_circuit.assign_parameters({param: values[param.name] for param in converted_circuit.parameters})
+
+
+def execute_bindings(q_circuit, converted_circuit, bindings, simulator_name, repetitions,
+                     api=None, device=None, counts_format=constants.COUNTS_DICT, seed=None,
+                     precision=constants.PRECISION_DOUBLE, **options):
+    return on_qiskit_bindings(converted_circuit, bindings, simulator_name, repetitions, api, device,
+                              counts_format=counts_format, seed=seed, precision=precision)
+
+
+def execute_batch(q_circuits, converted_circuits, simulator_name, repetitions, api=None, device=None,
+                  counts_format=constants.COUNTS_DICT, seed=None, precision=constants.PRECISION_DOUBLE, **options):
+    return on_qiskit_batch(converted_circuits, simulator_name, repetitions, api, device,
+                           counts_format=counts_format, seed=seed, precision=precision)
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    if output == 'mpl':
+        converted_circuit.draw(filename=filename, output=output)
+    else:
+        print(converted_circuit.draw(filename=filename, output=output))
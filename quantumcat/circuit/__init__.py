@@ -14,3 +14,6 @@
 
 from quantumcat.circuit.circuit import QCircuit
 from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.operations import Operations
+from quantumcat.circuit.block import Block
+from quantumcat.circuit.parameter import Parameter
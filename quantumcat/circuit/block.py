@@ -0,0 +1,192 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Immutable subcircuits that circuits reference by handle.
+
+Appending a Block to a circuit adds a single OpType.block operation: its
+qubits are the circuit qubits the block qubits act on, its only param is the
+number of repetitions and its extra is the Block itself. Building a circuit
+that repeats a block k times therefore costs O(block size) once, when the
+block is built, instead of O(k * block size). Backends convert each block once
+and reuse the conversion for every reference, and the native simulators run
+the operations expanded by expand(), each block being expanded once.
+"""
+
+import hashlib
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.operations import Operations
+from quantumcat.circuit.metrics import CircuitMetrics
+from quantumcat.circuit.parameter import is_parameterized
+from quantumcat.exceptions import CircuitError
+from quantumcat.utils import ErrorMessages, constants
+
+SELF_INVERSE_OPS = frozenset([
+    OpType.i_gate, OpType.x_gate, OpType.y_gate, OpType.z_gate, OpType.h_gate, OpType.swap_gate,
+    OpType.ecr_gate, OpType.cx_gate, OpType.cy_gate, OpType.cz_gate, OpType.ch_gate, OpType.cswap_gate,
+    OpType.ccx_gate, OpType.rccx_gate, OpType.c3x_gate, OpType.c4x_gate, OpType.mct_gate, OpType.mcx_gate,
+    OpType.mcxgc_gate, OpType.mcxrec_gate, OpType.mcxvchain_gate,
+])
+
+ADJOINT_OPS = {
+    OpType.s_gate: OpType.sdg_gate,
+    OpType.sdg_gate: OpType.s_gate,
+    OpType.t_gate: OpType.td_gate,
+    OpType.td_gate: OpType.t_gate,
+    OpType.sx_gate: OpType.sxd_gate,
+    OpType.sxd_gate: OpType.sx_gate,
+}
+
+# Rotations inverted by negating their angle, the first param
+ROTATION_OPS = frozenset([
+    OpType.rx_gate, OpType.ry_gate, OpType.rz_gate, OpType.p_gate, OpType.u1_gate, OpType.rxx_gate,
+    OpType.ryy_gate, OpType.rzz_gate, OpType.rzx_gate, OpType.crx_gate, OpType.cry_gate, OpType.crz_gate,
+    OpType.cphase_gate, OpType.cu1_gate, OpType.mcp_gate,
+])
+
+# Gates whose fourth power is the identity, inverted by applying them three times
+ORDER_FOUR_OPS = frozenset([OpType.iswap_gate, OpType.csx_gate, OpType.c3sx_gate, OpType.rc3x_gate])
+
+
+def inverse_operation(op_type, qargs, params, extra):
+    """Returns the list of (op_type, qargs, params, extra) operations undoing an operation."""
+    if op_type == OpType.block:
+        return [(op_type, qargs, params, extra.inverse())]
+    if op_type in SELF_INVERSE_OPS:
+        return [(op_type, qargs, params, extra)]
+    if op_type in ADJOINT_OPS:
+        return [(ADJOINT_OPS[op_type], qargs, params, extra)]
+    if op_type in ROTATION_OPS:
+        return [(op_type, qargs, [-params[0]] + params[1:], extra)]
+    if op_type in (OpType.u_gate, OpType.u3_gate, OpType.cu3_gate):
+        theta, phi, lam = params
+        return [(op_type, qargs, [-theta, -lam, -phi], extra)]
+    if op_type == OpType.cu_gate:
+        theta, phi, lam, gamma = params
+        return [(op_type, qargs, [-theta, -lam, -phi, -gamma], extra)]
+    if op_type == OpType.u2_gate:
+        phi, lam = params
+        return [(OpType.u3_gate, qargs, [-np.pi / 2, -lam, -phi], extra)]
+    if op_type == OpType.r_gate:
+        theta, phi = params
+        return [(op_type, qargs, [-theta, phi], extra)]
+    if op_type == OpType.dcx_gate:
+        return [(op_type, qargs[::-1], params, extra)]
+    if op_type in ORDER_FOUR_OPS:
+        return [(op_type, qargs, params, extra)] * 3
+    raise CircuitError(ErrorMessages.GATE_NOT_INVERTIBLE, op_type.name)
+
+
+class Block:
+    """Immutable subcircuit of gates with numeric params, without measurements.
+
+    The block keeps its own copy of the operations it is built from, so later
+    changes to the source circuit do not reach circuits referencing the block.
+    Its expansion, metrics, inverse and provider conversions are built on first
+    use and shared by every reference.
+    """
+
+    # blocks stand in for a QCircuit in the provider converters
+    cbits = 0
+    parameters = ()
+
+    def __init__(self, operations, qubits, name=constants.BLOCK_NAME):
+        """
+        :param operations: Operations of the block, copied
+        :param qubits: number of qubits of the block
+        :param name: label of the block in the converted circuits
+        """
+        super(Block, self).__init__()
+        for op_type, _, params in operations:
+            if op_type in (OpType.measure, OpType.measure_all) or is_parameterized(params):
+                raise CircuitError(ErrorMessages.BLOCK_NOT_UNITARY, op_type.name)
+        self.operations = Operations()
+        self.operations.extend(operations)
+        self.qubits = qubits
+        self.name = name
+        self.cached_expansion = None
+        self.cached_metrics = None
+        self.cached_inverse = None
+        self.cached_digest = None
+        # converter key -> converted block
+        self.conversions = {}
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __repr__(self):
+        return 'Block({!r}, {}, {})'.format(self.name, self.qubits, self.digest())
+
+    def digest(self):
+        """sha256 hex digest of the block, the same for equal blocks in any process."""
+        if self.cached_digest is None:
+            canonical = repr((self.name, self.qubits, self.operations.digest()))
+            self.cached_digest = hashlib.sha256(canonical.encode()).hexdigest()
+        return self.cached_digest
+
+    def expanded(self):
+        """Returns the operations of the block with the nested blocks expanded."""
+        if self.cached_expansion is None:
+            self.cached_expansion = expand(self.operations)
+        return self.cached_expansion
+
+    @property
+    def metrics(self):
+        """CircuitMetrics of the operations of the block."""
+        if self.cached_metrics is None:
+            self.cached_metrics = CircuitMetrics(self.qubits).update(self.operations)
+        return self.cached_metrics
+
+    def inverse(self):
+        """Returns the block undoing this one, whose operations are the inverses in reverse order."""
+        if self.cached_inverse is None:
+            operations = self.operations
+            inverted = Operations()
+            for index in range(len(operations) - 1, -1, -1):
+                op_type, qargs, params = operations[index]
+                for inverse in inverse_operation(op_type, qargs, params, operations.extras.get(index)):
+                    inverted.append(*inverse)
+            self.cached_inverse = Block(inverted, self.qubits, self.name + '_dg')
+            self.cached_inverse.cached_inverse = self
+        return self.cached_inverse
+
+    def converted(self, key, convert):
+        """Returns convert(self), called once per key, e.g. the converter module name."""
+        if key not in self.conversions:
+            self.conversions[key] = convert(self)
+        return self.conversions[key]
+
+
+def expand(operations, start=0, expanded=None):
+    """Appends operations[start:] to expanded with the blocks replaced by their operations.
+    :param operations: Operations, possibly with OpType.block operations
+    :param start: index of the first operation to expand
+    :param expanded: Operations to append to, a new one by default
+    :return: expanded, or operations itself when it holds no blocks
+    """
+    if start == 0 and expanded is None and OpType.block.value not in operations.opcodes:
+        return operations
+    expanded = Operations() if expanded is None else expanded
+    extras = operations.extras
+    for index, (op_type, qargs, params) in enumerate(operations.iterate(start), start):
+        if op_type != OpType.block:
+            expanded.append(op_type, qargs, params, extras.get(index))
+            continue
+        body = extras[index].expanded()
+        if qargs != list(range(len(qargs))):
+            mapped, body = body, Operations()
+            body.extend(mapped, qargs)
+        for _ in range(params[0]):
+            expanded.extend(body)
+    return expanded
@@ -13,14 +13,21 @@
 #  limitations under the License.
 
 
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from quantumcat.circuit.op_type import OpType
-from quantumcat.exceptions import CircuitError, APIDetailsNotFoundError
+from quantumcat.circuit.operations import Operations
+from quantumcat.circuit.metrics import CircuitMetrics
+from quantumcat.circuit.block import Block, expand
+from quantumcat.circuit.parameter import Parameter
+from quantumcat.circuit import optimization, jobs, result_cache
+from quantumcat.simulators import sampling, is_clifford
+from quantumcat.exceptions import CircuitError
 from quantumcat.utils import ErrorMessages
-from quantumcat.circuit import convert
+from quantumcat import backends
 from quantumcat.utils import providers
-from quantumcat.utils import constants
-from quantumcat.circuit import execute_circuit
-from qiskit.visualization import plot_histogram, plot_bloch_multivector, plot_state_qsphere
+from quantumcat.utils import constants, instrumentation
 
 
 class QCircuit:
@@ -30,168 +37,166 @@ class QCircuit:
         super(QCircuit, self).__init__()
         self.qubits = qubits
         self.cbits = cbits
-        self.operations = []
+        self.operations = Operations()
+        self.metrics = CircuitMetrics(qubits)
         self.converted_q_circuit = None
         self.provider = provider
+        # provider -> (operations version, converted circuit)
+        self.converted_circuits = {}
+        # guards the conversions of executions running in other threads
+        self.conversion_lock = threading.Lock()
+        # (operations version, name, Block) of the last to_block call
+        self.cached_block = None
 
     def x_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.x_gate: [qubit]})
+        self.operations.append(OpType.x_gate, [qubit])
         return self
 
     def y_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.y_gate: [qubit]})
+        self.operations.append(OpType.y_gate, [qubit])
         return self
 
     def z_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.z_gate: [qubit]})
+        self.operations.append(OpType.z_gate, [qubit])
         return self
 
     def h_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.h_gate: [qubit]})
+        self.operations.append(OpType.h_gate, [qubit])
         return self
 
     def cx_gate(self, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.cx_gate: [[control_qubit], [target_qubit]]})
+        self.operations.append(OpType.cx_gate, [control_qubit, target_qubit])
         return self
 
     def cz_gate(self, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
-        self.operations.append({OpType.cz_gate: [[control_qubit], [target_qubit]]})
+        self.operations.append(OpType.cz_gate, [control_qubit, target_qubit])
         return self
 
     def ccx_gate(self, control_qubit1, control_qubit2, target_qubit):
         self.check_qubit_boundary(control_qubit1)
         self.check_qubit_boundary(control_qubit2)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.ccx_gate: [[control_qubit1], [control_qubit2], [target_qubit]]})
+        self.operations.append(OpType.ccx_gate, [control_qubit1, control_qubit2, target_qubit])
         return self
 
     def ry_gate(self, theta, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.ry_gate: [qubit],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.ry_gate, [qubit], [theta])
         return self
 
     def ryy_gate(self, theta, qubit1, qubit2):
         self.check_qubit_boundary(qubit1)
         self.check_qubit_boundary(qubit2)
-        self.operations.append({OpType.ryy_gate: [[qubit1], [qubit2]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.ryy_gate, [qubit1, qubit2], [theta])
         return self
 
     def rzz_gate(self, theta, qubit1, qubit2):
         self.check_qubit_boundary(qubit1)
         self.check_qubit_boundary(qubit2)
-        self.operations.append({OpType.rzz_gate: [[qubit1], [qubit2]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.rzz_gate, [qubit1, qubit2], [theta])
         return self
 
     def rzx_gate(self, theta, qubit1, qubit2):
         self.check_qubit_boundary(qubit1)
         self.check_qubit_boundary(qubit2)
-        self.operations.append({OpType.rzx_gate: [[qubit1], [qubit2]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.rzx_gate, [qubit1, qubit2], [theta])
         return self
 
     def rz_gate(self, phi, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.rz_gate: [qubit],
-                                constants.PARAMS: [phi]})
+        self.operations.append(OpType.rz_gate, [qubit], [phi])
         return self
 
     # Couldn't file class to map ecr gates in gates_map.py
     # def ecr_gate(self, qubit1, qubit2):
     #     self.check_qubit_boundary(qubit1)
     #     self.check_qubit_boundary(qubit2)
-    #     self.operations.append({OpType.ecr_gate: [[qubit1], [qubit2]]})
+    #     self.operations.append(OpType.ecr_gate, [qubit1, qubit2])
 
     def s_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.s_gate: [qubit]})
+        self.operations.append(OpType.s_gate, [qubit])
         return self
 
     def sdg_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.sdg_gate: [qubit]})
+        self.operations.append(OpType.sdg_gate, [qubit])
         return self
 
     def swap_gate(self, qubit1, qubit2):
         self.check_qubit_boundary(qubit1)
         self.check_qubit_boundary(qubit2)
-        self.operations.append(({OpType.swap_gate: [[qubit1], [qubit2]]}))
+        self.operations.append(OpType.swap_gate, [qubit1, qubit2])
         return self
 
     def iswap_gate(self, qubit_a, qubit_b):
         self.check_qubit_boundary(qubit_a)
         self.check_qubit_boundary(qubit_b)
-        self.operations.append(({OpType.iswap_gate: [[qubit_a], [qubit_b]]}))
+        self.operations.append(OpType.iswap_gate, [qubit_a, qubit_b])
         return self
 
     def sx_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.sx_gate: [qubit]})
+        self.operations.append(OpType.sx_gate, [qubit])
         return self
 
     def sxd_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.sxd_gate: [qubit]})
+        self.operations.append(OpType.sxd_gate, [qubit])
         return self
 
     def t_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.t_gate: [qubit]})
+        self.operations.append(OpType.t_gate, [qubit])
         return self
 
     def td_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.td_gate: [qubit]})
+        self.operations.append(OpType.td_gate, [qubit])
         return self
 
     def u_gate(self, theta, phi, lam, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.u_gate: [qubit],
-                                constants.PARAMS: [theta, phi, lam]})
+        self.operations.append(OpType.u_gate, [qubit], [theta, phi, lam])
         return self
 
     def u1_gate(self, theta, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.u1_gate: [qubit],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.u1_gate, [qubit], [theta])
         return self
 
     def u2_gate(self, phi, lam, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.u2_gate: [qubit],
-                                constants.PARAMS: [phi, lam]})
+        self.operations.append(OpType.u2_gate, [qubit], [phi, lam])
         return self
 
     def u3_gate(self, theta, phi, lam, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append(({OpType.u3_gate: [qubit],
-                                 constants.PARAMS: [theta, phi, lam]}))
+        self.operations.append(OpType.u3_gate, [qubit], [theta, phi, lam])
         return self
 
     def cy_gate(self, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
-        self.operations.append({OpType.cy_gate: [[control_qubit], [target_qubit]]})
+        self.operations.append(OpType.cy_gate, [control_qubit, target_qubit])
         return self
 
     def i_gate(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.i_gate: [qubit]})
+        self.operations.append(OpType.i_gate, [qubit])
         return self
 
     def rccx_gate(self, control_qubit1, control_qubit2, target_qubit):
         self.check_qubit_boundary(control_qubit1)
         self.check_qubit_boundary(control_qubit2)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.rccx_gate: [[control_qubit1], [control_qubit2], [target_qubit]]})
+        self.operations.append(OpType.rccx_gate, [control_qubit1, control_qubit2, target_qubit])
         return self
 
     def rc3x_gate(self, control_qubit1, control_qubit2, control_qubit3, target_qubit):
@@ -199,29 +204,28 @@ class QCircuit:
         self.check_qubit_boundary(control_qubit2)
         self.check_qubit_boundary(control_qubit3)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append(
-            {OpType.rc3x_gate: [[control_qubit1], [control_qubit2], [control_qubit3], [target_qubit]]})
+        self.operations.append(OpType.rc3x_gate, [control_qubit1, control_qubit2, control_qubit3, target_qubit])
         return self
 
     def rxx_gate(self, theta, qubit1, qubit2):
         self.check_qubit_boundary(qubit1)
         self.check_qubit_boundary(qubit2)
-        self.operations.append({OpType.rxx_gate: [[qubit1], [qubit2]], constants.PARAMS: [theta]})
+        self.operations.append(OpType.rxx_gate, [qubit1, qubit2], [theta])
         return self
 
     def rx_gate(self, theta, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.rx_gate: [qubit], constants.PARAMS: [theta]})
+        self.operations.append(OpType.rx_gate, [qubit], [theta])
         return self
 
     def r_gate(self, theta, phi, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.r_gate: [qubit], constants.PARAMS: [theta, phi]})
+        self.operations.append(OpType.r_gate, [qubit], [theta, phi])
         return self
 
     def p_gate(self, theta, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.p_gate: [qubit], constants.PARAMS: [theta]})
+        self.operations.append(OpType.p_gate, [qubit], [theta])
         return self
 
     def c3x_gate(self, control_qubit1, control_qubit2, control_qubit3, target_qubit):
@@ -229,8 +233,7 @@ class QCircuit:
         self.check_qubit_boundary(control_qubit2)
         self.check_qubit_boundary(control_qubit3)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append(
-            {OpType.c3x_gate: [[control_qubit1], [control_qubit2], [control_qubit3], [target_qubit]]})
+        self.operations.append(OpType.c3x_gate, [control_qubit1, control_qubit2, control_qubit3, target_qubit])
         return self
 
     def c3sx_gate(self, control_qubit1, control_qubit2, control_qubit3, target_qubit):
@@ -238,8 +241,7 @@ class QCircuit:
         self.check_qubit_boundary(control_qubit2)
         self.check_qubit_boundary(control_qubit3)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append(
-            {OpType.c3sx_gate: [[control_qubit1], [control_qubit2], [control_qubit3], [target_qubit]]})
+        self.operations.append(OpType.c3sx_gate, [control_qubit1, control_qubit2, control_qubit3, target_qubit])
         return self
 
     def c4x_gate(self, control_qubit1, control_qubit2, control_qubit3, control_qubit4, target_qubit):
@@ -248,172 +250,212 @@ class QCircuit:
         self.check_qubit_boundary(control_qubit3)
         self.check_qubit_boundary(control_qubit4)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append(
-            {OpType.c4x_gate: [[control_qubit1], [control_qubit2], [control_qubit3], [control_qubit4], [target_qubit]]})
+        self.operations.append(OpType.c4x_gate,
+                               [control_qubit1, control_qubit2, control_qubit3, control_qubit4, target_qubit])
         return self
 
     def dcx_gate(self, control_qubit1, control_qubit2):
         self.check_qubit_boundary(control_qubit1)
         self.check_qubit_boundary(control_qubit2)
-        self.operations.append({OpType.dcx_gate: [[control_qubit1], [control_qubit2]]})
+        self.operations.append(OpType.dcx_gate, [control_qubit1, control_qubit2])
         return self
 
     def ch_gate(self, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.ch_gate: [[control_qubit], [target_qubit]]})
+        self.operations.append(OpType.ch_gate, [control_qubit, target_qubit])
         return self
 
     def csx_gate(self, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.csx_gate: [[control_qubit], [target_qubit]]})
+        self.operations.append(OpType.csx_gate, [control_qubit, target_qubit])
         return self
 
     def cswap_gate(self, control_qubit, target_qubit1, target_qubit2):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit1)
         self.check_qubit_boundary(target_qubit2)
-        self.operations.append({OpType.cswap_gate: [[control_qubit], [target_qubit1], [target_qubit2]]})
+        self.operations.append(OpType.cswap_gate, [control_qubit, target_qubit1, target_qubit2])
         return self
 
     def cphase_gate(self, theta, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.cphase_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.cphase_gate, [control_qubit, target_qubit], [theta])
         return self
 
     def crx_gate(self, theta, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.crx_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.crx_gate, [control_qubit, target_qubit], [theta])
         return self
 
     def cry_gate(self, theta, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.cry_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.cry_gate, [control_qubit, target_qubit], [theta])
         return self
 
     def crz_gate(self, theta, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.crz_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.crz_gate, [control_qubit, target_qubit], [theta])
         return self
 
     def cu_gate(self, theta, phi, lam, gamma, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.cu_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta, phi, lam, gamma]})
+        self.operations.append(OpType.cu_gate, [control_qubit, target_qubit], [theta, phi, lam, gamma])
         return self
 
     def cu1_gate(self, theta, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.cu1_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta]})
+        self.operations.append(OpType.cu1_gate, [control_qubit, target_qubit], [theta])
         return self
 
     def cu3_gate(self, theta, phi, lam, control_qubit, target_qubit):
         self.check_qubit_boundary(control_qubit)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.cu3_gate: [[control_qubit], [target_qubit]],
-                                constants.PARAMS: [theta, phi, lam]})
+        self.operations.append(OpType.cu3_gate, [control_qubit, target_qubit], [theta, phi, lam])
         return self
 
     def mcx_gate(self, control_qubits, target_qubit, ancilla_qubits=[], mode='nonancilla'):
         self.check_qubit_boundary(target_qubit)
         for qubit in control_qubits:
             self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.mcx_gate: control_qubits[:] + [target_qubit] + ancilla_qubits[:],
-                                constants.PARAMS: [len(control_qubits)]})
+        self.operations.append(OpType.mcx_gate, control_qubits[:] + [target_qubit], [len(control_qubits)],
+                               extra=ancilla_qubits[:] if ancilla_qubits else None)
         return self
 
     def mcxgc_gate(self, control_qubits, target_qubit):
         self.check_qubit_boundary(target_qubit)
         for qubit in control_qubits:
             self.check_qubit_boundary(qubit)
-        self.operations.append(
-            {OpType.mcxgc_gate: control_qubits[:] + [target_qubit], constants.PARAMS: [len(control_qubits)]})
+        self.operations.append(OpType.mcxgc_gate, control_qubits[:] + [target_qubit], [len(control_qubits)])
         return self
 
     def mcxvchain_gate(self, control_qubits, target_qubit, dirty_ancilla):
         self.check_qubit_boundary(target_qubit)
         for qubit in control_qubits:
             self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.mcxvchain_gate: control_qubits[:] + [target_qubit],
-                                constants.PARAMS: [len(control_qubits), dirty_ancilla]})
+        self.operations.append(OpType.mcxvchain_gate, control_qubits[:] + [target_qubit],
+                               [len(control_qubits), dirty_ancilla])
         return self
 
     def mcxrec_gate(self, control_qubits, target_qubit):
         self.check_qubit_boundary(target_qubit)
         for qubit in control_qubits:
             self.check_qubit_boundary(qubit)
-        self.operations.append(
-            {OpType.mcxrec_gate: control_qubits[:] + [target_qubit], constants.PARAMS: [len(control_qubits)]})
+        self.operations.append(OpType.mcxrec_gate, control_qubits[:] + [target_qubit], [len(control_qubits)])
         return self
 
     def mcp_gate(self, lam, control_qubits, target_qubit):
         self.check_qubit_boundary(target_qubit)
         for qubit in control_qubits:
             self.check_qubit_boundary(qubit)
-        self.operations.append(
-            {OpType.mcp_gate: control_qubits[:] + [target_qubit], constants.PARAMS: [lam, len(control_qubits)]})
+        self.operations.append(OpType.mcp_gate, control_qubits[:] + [target_qubit], [lam, len(control_qubits)])
         return self
 
     def mct_gate(self, control_qubits, target_qubit, ancilla_qubits=None, mode='noancilla'):
         # self.check_qubit_boundary(control_qubit1)
         self.check_qubit_boundary(target_qubit)
-        self.operations.append({OpType.mct_gate: [control_qubits, [target_qubit], ancilla_qubits, mode]})
+        self.operations.append(OpType.mct_gate, list(control_qubits) + [target_qubit],
+                               extra=(ancilla_qubits, mode))
         return self
 
     def measure(self, qubit):
         self.check_qubit_boundary(qubit)
-        self.operations.append({OpType.measure: [qubit]})
+        self.operations.append(OpType.measure, [qubit])
 
     def measure_all(self):
-        self.operations.append({OpType.measure_all: OpType.measure_all})
+        self.operations.append(OpType.measure_all, [])
+
+    def to_block(self, name=constants.BLOCK_NAME):
+        """Returns an immutable Block of the operations, built again only after they change.
+        :param name: label of the block in the converted circuits
+        """
+        version = self.operations.version
+        if self.cached_block is None or self.cached_block[:2] != (version, name):
+            self.cached_block = (version, name, Block(self.operations, self.qubits, name))
+        return self.cached_block[2]
+
+    def append_block(self, block, qubits=None, repetitions=1):
+        """Appends a reference to block, whatever its size, as a single operation.
+        :param block: Block, e.g. from to_block
+        :param qubits: circuit qubits that the block qubits act on, the first ones by default
+        :param repetitions: number of times the block is applied
+        """
+        qubits = list(range(block.qubits)) if qubits is None else list(qubits)
+        if len(qubits) != block.qubits:
+            raise CircuitError(ErrorMessages.BLOCK_QUBITS_MISMATCH)
+        for qubit in qubits:
+            self.check_qubit_boundary(qubit)
+        if len(block) > 0 and repetitions > 0:
+            self.operations.append(OpType.block, qubits, [repetitions], block)
+        return self
+
+    def compose(self, other, qubits=None):
+        """Appends the operations of other, a QCircuit or a Block, acting on qubits.
+        Circuits without measurements or Parameters are appended as a reference to their block,
+        which is shared by every compose until the circuit changes, others are copied.
+        :param qubits: circuit qubits that the qubits of other act on, the first ones by default
+        """
+        if isinstance(other, Block):
+            return self.append_block(other, qubits)
+        operations = other.operations
+        if operations.count(OpType.measure) + operations.count(OpType.measure_all) == 0 and not other.parameters:
+            return self.append_block(other.to_block(), qubits)
+        qubits = list(range(other.qubits)) if qubits is None else list(qubits)
+        if len(qubits) != other.qubits:
+            raise CircuitError(ErrorMessages.BLOCK_QUBITS_MISMATCH)
+        for qubit in qubits:
+            self.check_qubit_boundary(qubit)
+        self.operations.extend(operations, qubits)
+        return self
+
+    def repeat(self, repetitions):
+        """Returns a new circuit applying this one repetitions times, referencing its block."""
+        return QCircuit(self.qubits, self.cbits, self.provider).append_block(self.to_block(), repetitions=repetitions)
+
+    def inverse(self):
+        """Returns a new circuit undoing this one, which must have no measurements."""
+        return QCircuit(self.qubits, self.cbits, self.provider).append_block(self.to_block().inverse())
 
     def get_operations(self):
-        return self.operations
+        """Returns the operations in the legacy list of {OpType: qargs, 'params': [...]} dicts.
+        The circuit itself stores them in self.operations, an Operations instance."""
+        return self.operations.to_dicts()
+
+    def depth(self):
+        """Number of layers of the circuit, measurements included, without converting it."""
+        return self.metrics.update(self.operations).depth
+
+    def count_ops(self):
+        """Returns the number of operations of each OpType, most frequent first."""
+        counts = self.metrics.update(self.operations).counts
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def two_qubit_gates(self):
+        """Number of gates acting on exactly two qubits."""
+        return self.metrics.update(self.operations).two_qubit_gates
+
+    def layers(self):
+        """Returns the operations scheduled as soon as possible, as a list of layers of
+        (op_type, qubits, params) tuples. Operations of a layer act on different qubits."""
+        return [[self.operations[index] for index in layer] for layer in self.metrics.update(self.operations).layers()]
 
     def check_qubit_boundary(self, qubit):
         if qubit > (self.qubits - 1):
             raise CircuitError(ErrorMessages.QUBIT_OUT_OF_BOUND)
 
     def draw_circuit(self, provider=providers.DEFAULT_PROVIDER, filename=None, output='text'):
-        self.check_and_convert(provider)
-
-        if self.provider == providers.IBM_PROVIDER:
-            if output == 'mpl':
-                self.converted_q_circuit.draw(filename=filename, output=output)
-            else:
-                print(self.converted_q_circuit.draw(filename=filename, output=output))
-        elif self.provider == providers.GOOGLE_PROVIDER:
-            print(self.converted_q_circuit)
-        elif self.provider == providers.MICROSOFT_PROVIDER:
-            pass
-        elif self.provider == providers.AMAZON_PROVIDER:
-            print(self.converted_q_circuit)
+        converted_q_circuit = self.check_and_convert(provider)
+        backends.get_backend(provider).draw(converted_q_circuit, filename=filename, output=output)
 
     def convert_circuit(self):
-        converted_q_circuit = None
-        if self.provider == providers.IBM_PROVIDER:
-            converted_q_circuit = convert.to_qiskit(self, self.qubits, self.cbits)
-        elif self.provider == providers.GOOGLE_PROVIDER:
-            converted_q_circuit = convert.to_cirq(self, self.qubits)
-        elif self.provider == providers.IONQ_PROVIDER:
-            converted_q_circuit = convert.to_cirq(self, self.qubits)
-        elif self.provider == providers.MICROSOFT_PROVIDER:
-            converted_q_circuit = convert.to_q_sharp(self, self.qubits)
-        elif self.provider == providers.AMAZON_PROVIDER:
-            converted_q_circuit = convert.to_braket(self, self.qubits)
-        return converted_q_circuit
+        return backends.get_backend(self.provider).convert(self)
 
     def execute(self, provider=providers.DEFAULT_PROVIDER,
                 simulator_name=constants.DEFAULT_SIMULATOR,
@@ -421,31 +463,193 @@ class QCircuit:
                 api=None, device=None,
                 default_target='simulator', bucket=None,
                 poll_timeout_seconds=100, poll_interval_seconds=10,
-                directory=None):
-        self.check_and_convert(provider)
-        if self.provider == providers.IBM_PROVIDER:
-            return execute_circuit.on_qiskit(self.converted_q_circuit,
-                                             simulator_name, repetitions,
-                                             api, device)
-        elif self.provider == providers.GOOGLE_PROVIDER:
-            return execute_circuit.on_cirq(self.converted_q_circuit,
-                                           simulator_name, repetitions, api, self.get_operations())
-        elif self.provider == providers.AMAZON_PROVIDER:
-            return execute_circuit.on_braket(self.converted_q_circuit,
-                                             simulator_name, repetitions, device, bucket, directory,
-                                             poll_timeout_seconds=poll_timeout_seconds,
-                                             poll_interval_seconds=poll_interval_seconds)
-        elif self.provider == providers.IONQ_PROVIDER:
-            if api is None:
-                raise APIDetailsNotFoundError(ErrorMessages.IONQ_API_DETAILS_NOT_PROVIDED)
-            return execute_circuit.on_ionq(self.converted_q_circuit,
-                                           default_target, repetitions, api, self.get_operations())
+                directory=None, parameter_values=None, counts_format=constants.COUNTS_DICT, seed=None,
+                precision=constants.PRECISION_DOUBLE, max_bond_dimension=None,
+                truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD, cache=None):
+        """Executes the circuit on a provider.
+        Counts of circuits of Clifford gates and measurements are sampled in polynomial time by the
+        stabilizer simulator of the native provider.
+        :param simulator_name: DEFAULT_SIMULATOR, STATEVECTOR_SIMULATOR, STABILIZER_SIMULATOR to run a
+                               Clifford circuit on the stabilizer simulator or MPS_SIMULATOR to sample
+                               on the matrix product state simulator, both native whatever the provider
+        :param parameter_values: values of the circuit Parameters, either one binding (a dict of
+                                 Parameter or name to value, or the values in the order of
+                                 self.parameters) or a list of bindings. The circuit is converted
+                                 once and every binding reuses the converted circuit.
+        :param counts_format: COUNTS_DICT for qiskit style counts, COUNTS_ARRAY for Counts
+                              holding the integer outcomes and their counts in numpy arrays, or
+                              COUNTS_SHOTS for the shots as a packed uint8 array of shape
+                              (shots, ceil(bits / 8)), bit j of a shot being classical bit j
+                              for every provider. sampling.unpack_bits, sampling.shot_values
+                              and Counts.from_shots turn them into bits, integers or counts.
+        :param seed: seed of the native, qiskit Aer and cirq simulators, making their results reproducible
+        :param precision: PRECISION_DOUBLE or PRECISION_SINGLE, the complex128 or complex64 amplitudes of the
+                          native, qiskit Aer and cirq simulators. Statevectors are returned as contiguous
+                          numpy arrays of that dtype.
+        :param max_bond_dimension: largest bond dimension kept by MPS_SIMULATOR, unlimited by default
+        :param truncation_threshold: largest squared weight of the singular values MPS_SIMULATOR drops at
+                                     each split. The fidelity left by the truncations is recorded in the
+                                     simulate span of instrumentation.
+        :param cache: ResultCache storing the results of local executions without parameter_values, by
+                      default the cache enabled with result_cache.enable, if any. Executions given an api
+                      or a device run on a remote service and are not cached, counts are only cached for
+                      executions given a seed.
+        :return: the result, or the list of results when a list of bindings is given
+        """
+        if simulator_name in (constants.STABILIZER_SIMULATOR, constants.MPS_SIMULATOR):
+            provider = providers.NATIVE_PROVIDER
+        with instrumentation.span(instrumentation.EXECUTE, provider=provider, gates=len(self.operations),
+                                  qubits=self.qubits, shots=repetitions):
+            backend = backends.get_backend(provider)
+            options = dict(api=api, device=device, default_target=default_target, bucket=bucket,
+                           poll_timeout_seconds=poll_timeout_seconds,
+                           poll_interval_seconds=poll_interval_seconds, directory=directory,
+                           counts_format=counts_format, seed=seed, precision=precision,
+                           max_bond_dimension=max_bond_dimension, truncation_threshold=truncation_threshold)
+            if parameter_values is None:
+                parameters = self.parameters
+                if parameters:
+                    raise CircuitError(ErrorMessages.PARAMETERS_NOT_BOUND, ', '.join(map(str, parameters)))
+
+                def run():
+                    return backend.execute(self, self.check_and_convert(provider), simulator_name, repetitions,
+                                           **options)
+
+                # a cached result needs no conversion, runs on remote services and devices are never cached
+                cache = result_cache.active_cache() if cache is None else cache
+                if cache is None or api is not None or device is not None:
+                    result = run()
+                else:
+                    settings = result_cache.simulator_settings(simulator_name, max_bond_dimension, truncation_threshold)
+                    result = cache.execute(self, provider, simulator_name, repetitions, run, seed, counts_format,
+                                           device, precision, settings)
+                return sampling.format_counts(result, counts_format)
+
+            converted_q_circuit = self.check_and_convert(provider)
+            bindings, single = self.parameter_bindings(parameter_values)
+            if hasattr(backend, 'execute_bindings'):
+                results = backend.execute_bindings(self, converted_q_circuit, bindings, simulator_name,
+                                                   repetitions, **options)
+            else:
+                results = [backend.execute(self, backend.bind(self, converted_q_circuit, values),
+                                           simulator_name, repetitions, **options) for values in bindings]
+            results = [sampling.format_counts(result, counts_format) for result in results]
+            return results[0] if single else results
+
+    def execute_async(self, provider=providers.DEFAULT_PROVIDER,
+                      simulator_name=constants.DEFAULT_SIMULATOR,
+                      repetitions=constants.DEFAULT_REPETITIONS,
+                      api=None, device=None,
+                      default_target='simulator', bucket=None,
+                      poll_timeout_seconds=100, poll_interval_seconds=10,
+                      directory=None, parameter_values=None, counts_format=constants.COUNTS_DICT, seed=None,
+                      precision=constants.PRECISION_DOUBLE, max_bond_dimension=None,
+                      truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD, cache=None):
+        """Submits the circuit without waiting for the result. Takes the arguments of execute,
+        the cache being used by the jobs that run in the local thread pool.
+        :return: Job, whose result is given by job.result() or `await job`, or the list of
+                 Jobs when a list of bindings is given
+        """
+        if simulator_name in (constants.STABILIZER_SIMULATOR, constants.MPS_SIMULATOR):
+            provider = providers.NATIVE_PROVIDER
+        converted_q_circuit = self.check_and_convert(provider)
+        options = dict(api=api, device=device, default_target=default_target, bucket=bucket,
+                       poll_timeout_seconds=poll_timeout_seconds,
+                       poll_interval_seconds=poll_interval_seconds, directory=directory, seed=seed,
+                       precision=precision, max_bond_dimension=max_bond_dimension,
+                       truncation_threshold=truncation_threshold)
+        if parameter_values is None:
+            parameters = self.parameters
+            if parameters:
+                raise CircuitError(ErrorMessages.PARAMETERS_NOT_BOUND, ', '.join(map(str, parameters)))
+            # as in execute, runs on remote services and devices are never cached
+            cache = result_cache.active_cache() if cache is None else cache
+            if api is not None or device is not None:
+                cache = None
+            return jobs.submit(self, provider, simulator_name, repetitions, counts_format, converted_q_circuit,
+                               cache=cache, **options)
+
+        backend = backends.get_backend(provider)
+        bindings, single = self.parameter_bindings(parameter_values)
+        submitted = [jobs.submit(self, provider, simulator_name, repetitions, counts_format,
+                                 backend.bind(self, converted_q_circuit, values), **options)
+                     for values in bindings]
+        return submitted[0] if single else submitted
+
+    def is_clifford(self):
+        """Whether the circuit only has Clifford gates and measurements, which the stabilizer simulator runs."""
+        return is_clifford(expand(self.operations))
+
+    @property
+    def parameters(self):
+        """Symbolic Parameters of the circuit in order of first use."""
+        return self.operations.parameters()
+
+    def bind(self, parameter_values, provider=providers.DEFAULT_PROVIDER):
+        """Returns the provider circuit with the Parameters bound to parameter_values.
+        The parameterized conversion is cached, so binding many values only converts once.
+        :param parameter_values: dict of Parameter or name to value, or the values in the order of self.parameters
+        :param provider: provider of the returned circuit
+        :return: provider circuit object
+        """
+        converted_q_circuit = self.check_and_convert(provider)
+        bindings, _ = self.parameter_bindings(parameter_values)
+        return backends.get_backend(provider).bind(self, converted_q_circuit, bindings[0])
+
+    def parameter_bindings(self, parameter_values):
+        """Normalizes parameter_values to a list of dicts of parameter name to value.
+        :return: (bindings, whether parameter_values was a single binding)
+        """
+        single = isinstance(parameter_values, dict) or \
+            not any(isinstance(values, dict) or hasattr(values, '__len__') for values in parameter_values)
+        if single:
+            parameter_values = [parameter_values]
+        parameters = self.parameters
+        names = set(parameter.name for parameter in parameters)
+        bindings = []
+        for values in parameter_values:
+            if isinstance(values, dict):
+                values = {(name.name if isinstance(name, Parameter) else name): value
+                          for name, value in values.items()}
+            else:
+                if len(values) != len(parameters):
+                    raise CircuitError(ErrorMessages.PARAMETER_VALUES_MISMATCH)
+                values = {parameter.name: value for parameter, value in zip(parameters, values)}
+            if not names.issubset(values):
+                raise CircuitError(ErrorMessages.PARAMETERS_NOT_BOUND,
+                                   ', '.join(sorted(names.difference(values))))
+            bindings.append(values)
+        return bindings, single
+
+    def optimize(self):
+        """Cancels adjacent inverse gate pairs and fuses runs of single-qubit gates into u3 gates.
+        Call it before converting or executing the circuit.
+        :return: dict with the gate count before and after the optimization
+        """
+        before = optimization.gate_count(self.operations)
+        self.operations.replace(optimization.optimize(self.operations, self.qubits))
+        return {constants.BEFORE: before, constants.AFTER: optimization.gate_count(self.operations)}
 
     def check_and_convert(self, provider):
-        if self.converted_q_circuit is None or self.provider != provider:
+        """Returns the circuit converted for provider, reusing the cached conversion.
+        Operations appended since the last conversion are translated onto the cached
+        circuit; any other change to the operations converts the circuit again."""
+        backend = backends.get_backend(provider)
+        with self.conversion_lock:
+            rewrites, length = self.operations.version
+            cached = self.converted_circuits.get(provider)
+            if cached is None or cached[0][0] != rewrites or cached[0][1] > length:
+                with instrumentation.span(instrumentation.CONVERT, provider=provider, gates=length):
+                    converted_q_circuit = backend.convert(self)
+            elif cached[0][1] < length:
+                with instrumentation.span(instrumentation.CONVERT, provider=provider, gates=length - cached[0][1]):
+                    converted_q_circuit = backend.extend(self, cached[1], cached[0][1])
+            else:
+                converted_q_circuit = cached[1]
+            self.converted_circuits[provider] = ((rewrites, length), converted_q_circuit)
             self.provider = provider
-            converted_q_circuit = self.convert_circuit()
             self.converted_q_circuit = converted_q_circuit
+        return converted_q_circuit
 
     def superposition(self, qubit):
         self.h_gate(qubit)
@@ -458,13 +662,27 @@ class QCircuit:
         self.x_gate(qubit)
         self.h_gate(qubit)
 
-    def compare_results(self, providers_list=None, plot=False, repetitions=constants.DEFAULT_REPETITIONS):
-        output_dict = {}
+    def compare_results(self, providers_list=None, plot=False, repetitions=constants.DEFAULT_REPETITIONS,
+                        concurrent=False, timeout=None, max_workers=None):
+        """Executes the circuit on several providers and returns the results keyed by provider.
+        :param providers_list: list of dicts with the provider and its execute options,
+                               Google, IBM and Amazon simulators by default
+        :param plot: plots the counts of all providers in one histogram
+        :param repetitions: number of shots for the default providers
+        :param concurrent: executes all providers at once in a thread pool. Each provider
+                           then maps to {'result': ..., 'time': seconds, 'error': message or None}
+                           and a failing provider does not stop the others
+        :param timeout: seconds each provider may run in concurrent mode, counted from when it starts.
+                        Providers still running then are reported with a timeout error
+        :param max_workers: size of the thread pool in concurrent mode, one thread per provider by default
+        :return: dict of provider to results
+        """
+        runs = []
         if providers_list is None:
             providers_list = [providers.GOOGLE_PROVIDER, providers.IBM_PROVIDER, providers.AMAZON_PROVIDER]
             for provider in range(len(providers_list)):
-                results = self.execute(provider=providers_list[provider], repetitions=repetitions)
-                output_dict[providers_list[provider]] = results
+                runs.append((providers_list[provider], {'provider': providers_list[provider],
+                                                        'repetitions': repetitions}))
         else:
             for provider_json in providers_list:
                 provider = provider_json['provider']
@@ -474,41 +692,105 @@ class QCircuit:
                 directory = None if 'directory' not in provider_json else provider_json['directory']
                 simulator = constants.DEFAULT_SIMULATOR if 'simulator' not in provider_json \
                     else provider_json['simulator']
-                repetitions = constants.DEFAULT_REPETITIONS if 'repetitions' not in provider_json \
+                provider_repetitions = constants.DEFAULT_REPETITIONS if 'repetitions' not in provider_json \
                     else provider_json['repetitions']
                 poll_timeout_seconds = 100 if 'poll_timeout_seconds' not in provider_json \
                     else provider_json['poll_timeout_seconds']
                 poll_interval_seconds = 10 if 'poll_interval_seconds' not in provider_json \
                     else provider_json['poll_interval_seconds']
 
-                results = self.execute(provider=provider, simulator_name=simulator,
-                                       repetitions=repetitions, api=api, device=device,
-                                       bucket=bucket, poll_timeout_seconds=poll_timeout_seconds,
-                                       poll_interval_seconds=poll_interval_seconds, directory=directory)
-                output_dict[provider_json['provider']] = results
+                runs.append((provider, {'provider': provider, 'simulator_name': simulator,
+                                        'repetitions': provider_repetitions, 'api': api, 'device': device,
+                                        'bucket': bucket, 'poll_timeout_seconds': poll_timeout_seconds,
+                                        'poll_interval_seconds': poll_interval_seconds,
+                                        'directory': directory}))
+
+        if concurrent:
+            output_dict = self.execute_concurrently(runs, timeout, max_workers)
+            all_counts = [output_dict[key][constants.RESULT] for key in output_dict
+                          if output_dict[key][constants.ERROR] is None]
+        else:
+            output_dict = {}
+            for provider, options in runs:
+                output_dict[provider] = self.execute(**options)
+            all_counts = list(output_dict.values())
 
         if plot:
-            all_counts = []
-            for key in output_dict:
-                all_counts.append(output_dict[key])
+            from qiskit.visualization import plot_histogram
             plot_histogram(all_counts)
 
         return output_dict
 
+    def execute_concurrently(self, runs, timeout=None, max_workers=None):
+        """Runs execute for every (provider, options) run in a thread pool. The circuit is converted
+        for every provider in the calling thread first.
+        :param timeout: seconds each run may take from when it starts, unlimited by default
+        :return: dict of provider to {'result': ..., 'time': seconds, 'error': message or None}
+        """
+        # perf_counter value at which each run started, by provider
+        starts = {}
+
+        def timed_execute(provider, options):
+            starts[provider] = start = time.perf_counter()
+            try:
+                result, error = self.execute(**options), None
+            except Exception as exception:
+                result, error = None, repr(exception)
+            return {constants.RESULT: result, constants.TIME: time.perf_counter() - start, constants.ERROR: error}
+
+        output_dict = {provider: None for provider, _ in runs}
+        pool = ThreadPoolExecutor(max_workers=max_workers or max(len(runs), 1))
+        pending = {}
+        for provider, options in runs:
+            simulator_name = options.get('simulator_name', constants.DEFAULT_SIMULATOR)
+            try:
+                if simulator_name not in (constants.STABILIZER_SIMULATOR, constants.MPS_SIMULATOR):
+                    self.check_and_convert(options.get('provider', providers.DEFAULT_PROVIDER))
+            except Exception as exception:
+                output_dict[provider] = {constants.RESULT: None, constants.TIME: 0, constants.ERROR: repr(exception)}
+                continue
+            pending[provider] = pool.submit(timed_execute, provider, options)
+
+        while pending:
+            now = time.perf_counter()
+            for provider, future in list(pending.items()):
+                if future.done():
+                    output_dict[provider] = future.result()
+                elif timeout is not None and provider in starts and now - starts[provider] >= timeout:
+                    output_dict[provider] = {constants.RESULT: None, constants.TIME: now - starts[provider],
+                                             constants.ERROR: ErrorMessages.PROVIDER_TIMED_OUT}
+                else:
+                    continue
+                del pending[provider]
+            if not pending:
+                break
+            wait_seconds = None
+            if timeout is not None:
+                # wake up at the earliest deadline, or soon to see when queued runs start
+                deadlines = [starts[provider] + timeout - now for provider in pending if provider in starts]
+                wait_seconds = max(min(deadlines if len(deadlines) == len(pending) else deadlines + [0.05]), 0)
+            wait(list(pending.values()), timeout=wait_seconds, return_when=FIRST_COMPLETED)
+        # threads cannot be interrupted, a timed out provider finishes in the background
+        pool.shutdown(wait=False)
+        return output_dict
+
     @staticmethod
     def histogram(counts, color=constants.DEFAULT_COLOR, bar_labels=True, title=None, filename=None):
+        from qiskit.visualization import plot_histogram
         fig = plot_histogram(counts, color=color, bar_labels=bar_labels, title=title)
         if filename is not None:
             fig.savefig(filename)
 
     @staticmethod
     def bloch_multivector(state, title='', filename=None):
+        from qiskit.visualization import plot_bloch_multivector
         fig =plot_bloch_multivector(state=state, title=title)
         if filename is not None:
             fig.savefig(filename)
 
     @staticmethod
     def state_qsphere(state, filename=None):
+        from qiskit.visualization import plot_state_qsphere
         fig = plot_state_qsphere(state=state)
         if filename is not None:
             fig.savefig(filename)
\ No newline at end of file
@@ -12,73 +12,67 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from quantumcat.utils import constants, helper
-from qiskit import Aer, execute, IBMQ
-from qiskit.providers.ibmq import least_busy
-import cirq
-import cirq.ionq as ionq
-from braket.devices import LocalSimulator
-from braket.aws import AwsDevice
+"""Execution of converted circuits. The provider SDK is imported on first call
+through the provider's backend module."""
+
+from quantumcat.backends import get_backend
+from quantumcat.simulators import sampling
+from quantumcat.utils import providers, constants
 
 
 def on_qiskit(q_circuit, simulator_name, repetitions, api, device_name,
               hub='ibm-q', group=None, project=None):
-    if api is None:
-        backend = Aer.get_backend(simulator_name)
-    else:
-        IBMQ.save_account(api, overwrite=True)
-        IBMQ.load_account()
-        provider = IBMQ.get_provider(hub=hub, group=group, project=project)
-        backend = least_busy(provider.backends(simulator=False)) if device_name is None \
-            else provider.get_backend(device_name)
-
-    results = execute(q_circuit, backend, shots=repetitions).result()
-
-    if simulator_name == constants.DEFAULT_SIMULATOR:
-        return results.get_counts()
-    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
-        return results.get_statevector()
+    return get_backend(providers.IBM_PROVIDER).on_qiskit(q_circuit, simulator_name, repetitions, api,
+                                                         device_name, hub=hub, group=group, project=project)
 
 
 def on_cirq(q_circuit, simulator_name, repetitions, api, operations):
-    simulator = cirq.Simulator()
-    if simulator_name == constants.DEFAULT_SIMULATOR:
-        result = simulator.run(q_circuit, repetitions=repetitions)
-        qubits_index = helper.measure_qubits_index(operations)
-        if len(qubits_index) > 0:
-            return helper.cirq_measurment_in_reverse(result.multi_measurement_histogram
-                                              (keys=qubits_index, fold_func=helper.bitstring))
-        else:
-            return helper.cirq_measurment_in_reverse(result.histogram(key='result', fold_func=helper.bitstring))
-    elif simulator_name == constants.STATEVECTOR_SIMULATOR:
-        return simulator.simulate(q_circuit).final_state_vector
+    return get_backend(providers.GOOGLE_PROVIDER).on_cirq(q_circuit, simulator_name, repetitions, api, operations)
 
 
 # Need testing on actual ionq device
 def on_ionq(q_circuit, repetitions, api, default_target, operations):
-    service = ionq.Service(api_key=api, default_target=default_target)
-    result = service.run(q_circuit, repetitions=repetitions)
-    qubits_index = helper.measure_qubits_index(operations)
-    if len(qubits_index) > 0:
-        return helper.cirq_measurment_in_reverse(result.multi_measurement_histogram
-                                              (keys=qubits_index, fold_func=helper.bitstring))
-    else:
-        return helper.cirq_measurment_in_reverse(result.histogram(key='result', fold_func=helper.bitstring))
+    return get_backend(providers.IONQ_PROVIDER).on_ionq(q_circuit, repetitions, api, default_target, operations)
 
 
 def on_braket(q_circuit, simulator_name, repetitions, device, bucket, directory,
               poll_timeout_seconds, poll_interval_seconds):
-    if device is None:
-        if simulator_name == constants.DEFAULT_SIMULATOR:
-            results = LocalSimulator().run(q_circuit, shots=repetitions).result()
-            return dict(results.measurement_counts)
-        elif simulator_name == constants.STATEVECTOR_SIMULATOR:
-            return LocalSimulator().run(q_circuit.state_vector(), shots=repetitions).result().values[0]
-    else:
-        s3_location = (bucket, directory)
-        aws_real_device = AwsDevice(device)
-        return aws_real_device.run(q_circuit, s3_location, shots=repetitions,
-                                   poll_timeout_seconds=poll_timeout_seconds,
-                                   poll_interval_seconds=poll_interval_seconds)
+    return get_backend(providers.AMAZON_PROVIDER).on_braket(q_circuit, simulator_name, repetitions, device,
+                                                            bucket, directory,
+                                                            poll_timeout_seconds=poll_timeout_seconds,
+                                                            poll_interval_seconds=poll_interval_seconds)
+
 
+def on_native(q_circuit, simulator_name, repetitions):
+    """Runs the quantumcat operations directly on the built-in NumPy statevector simulator.
+    :param q_circuit: quantumcat circuit object
+    :param simulator_name: DEFAULT_SIMULATOR for counts or STATEVECTOR_SIMULATOR for the statevector
+    :param repetitions: number of shots
+    :return: qiskit style counts or statevector
+    """
+    return get_backend(providers.NATIVE_PROVIDER).on_native(q_circuit, simulator_name, repetitions)
 
+
+def execute_batch(circuits, provider=providers.DEFAULT_PROVIDER,
+                  simulator_name=constants.DEFAULT_SIMULATOR,
+                  repetitions=constants.DEFAULT_REPETITIONS, counts_format=constants.COUNTS_DICT, **options):
+    """Executes many quantumcat circuits with a single backend submission where the provider allows it.
+    :param circuits: list of QCircuit objects
+    :param provider: provider to execute the circuits on
+    :param simulator_name: DEFAULT_SIMULATOR for counts or STATEVECTOR_SIMULATOR for statevectors
+    :param repetitions: number of shots for every circuit
+    :param counts_format: COUNTS_DICT for qiskit style counts, COUNTS_ARRAY for Counts or COUNTS_SHOTS
+                          for the packed shots, as in QCircuit.execute
+    :param options: provider options accepted by QCircuit.execute, such as api or device
+    :return: list with the result of each circuit, in the order of circuits
+    """
+    backend = get_backend(provider)
+    converted_circuits = [circuit.check_and_convert(provider) for circuit in circuits]
+    if hasattr(backend, 'execute_batch'):
+        results = backend.execute_batch(circuits, converted_circuits, simulator_name, repetitions,
+                                        counts_format=counts_format, **options)
+    else:
+        results = [backend.execute(circuit, converted_circuit, simulator_name, repetitions,
+                                   counts_format=counts_format, **options)
+                   for circuit, converted_circuit in zip(circuits, converted_circuits)]
+    return [sampling.format_counts(result, counts_format) for result in results]
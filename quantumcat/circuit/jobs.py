@@ -0,0 +1,234 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Asynchronous execution through job handles.
+
+execute_async submits circuits and returns Job handles right away. Backends of
+remote providers may expose
+
+    submit(q_circuit, converted_circuit, simulator_name, repetitions, **options)
+    job_statuses(handles)
+    job_result(q_circuit, handle, simulator_name, counts_format)
+    cancel_job(handle)
+
+where submit returns the provider's own job object, or None to run the circuit
+locally, and job_statuses returns one of the JOB_* statuses of constants for
+every handle. Circuits of other backends run execute in a shared thread pool
+and their handle is the Future.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from quantumcat import backends
+from quantumcat.circuit import result_cache
+from quantumcat.exceptions import JobError
+from quantumcat.simulators import sampling
+from quantumcat.utils import ErrorMessages, constants, providers
+
+FINAL_STATUSES = (constants.JOB_DONE, constants.JOB_CANCELLED, constants.JOB_FAILED)
+
+_executor = None
+
+
+def executor():
+    """Returns the thread pool running local jobs, created on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix='quantumcat-job')
+    return _executor
+
+
+class Job:
+    """Handle of a submitted circuit. A job can be polled, cancelled and awaited,
+    `await job` giving the same result as job.result()."""
+
+    def __init__(self, provider, handle, q_circuit, simulator_name, counts_format=constants.COUNTS_DICT):
+        super(Job, self).__init__()
+        self.provider = provider
+        self.handle = handle
+        self.q_circuit = q_circuit
+        self.simulator_name = simulator_name
+        self.counts_format = counts_format
+
+    @property
+    def local(self):
+        return isinstance(self.handle, Future)
+
+    def status(self):
+        return statuses([self])[0]
+
+    def done(self):
+        return self.status() in FINAL_STATUSES
+
+    def cancel(self):
+        """Requests the cancellation of the job. A local job that already started runs to the end."""
+        if self.local:
+            self.handle.cancel()
+        else:
+            backends.get_backend(self.provider).cancel_job(self.handle)
+
+    def result(self, timeout=None, **polling):
+        """Waits for the job and returns its result.
+        :param timeout: seconds to wait, JobError is raised when the job is still running after it
+        :param polling: interval, max_interval and backoff of wait
+        """
+        _, pending = wait([self], timeout, **polling)
+        if pending:
+            raise JobError(ErrorMessages.JOB_TIMED_OUT)
+        return self.fetch()
+
+    def fetch(self):
+        """Returns the result of a finished job."""
+        status = self.status()
+        if status == constants.JOB_CANCELLED:
+            raise JobError(ErrorMessages.JOB_CANCELLED)
+        if self.local:
+            result = self.handle.result()
+        elif status == constants.JOB_FAILED:
+            raise JobError(ErrorMessages.JOB_FAILED, str(self.handle))
+        else:
+            result = backends.get_backend(self.provider).job_result(self.q_circuit, self.handle,
+                                                                     self.simulator_name, self.counts_format)
+        return sampling.format_counts(result, self.counts_format)
+
+    def __await__(self):
+        return result_async(self).__await__()
+
+    def __repr__(self):
+        return 'Job({}, {})'.format(self.provider, self.handle)
+
+
+def future_status(future):
+    if future.cancelled():
+        return constants.JOB_CANCELLED
+    if future.done():
+        return constants.JOB_FAILED if future.exception() is not None else constants.JOB_DONE
+    return constants.JOB_RUNNING if future.running() else constants.JOB_QUEUED
+
+
+def statuses(jobs):
+    """Returns the status of every job, with one job_statuses call per provider."""
+    results = [None] * len(jobs)
+    remote = {}
+    for index, job in enumerate(jobs):
+        if job.local:
+            results[index] = future_status(job.handle)
+        else:
+            remote.setdefault(job.provider, []).append(index)
+    for provider, indices in remote.items():
+        handles = [jobs[index].handle for index in indices]
+        for index, status in zip(indices, backends.get_backend(provider).job_statuses(handles)):
+            results[index] = status
+    return results
+
+
+def polling_intervals(interval, max_interval, backoff):
+    while True:
+        yield interval
+        interval = min(interval * backoff, max_interval)
+
+
+def wait(jobs, timeout=None, interval=0.1, max_interval=10, backoff=2):
+    """Polls the status of all jobs at once until they finish. The pause between two
+    polls starts at interval seconds and is multiplied by backoff up to max_interval.
+    :param timeout: seconds to wait, all jobs by default
+    :return: (done, pending) lists of jobs
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = list(jobs)
+    for pause in polling_intervals(interval, max_interval, backoff):
+        pending = [job for job, status in zip(pending, statuses(pending)) if status not in FINAL_STATUSES]
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if not pending or (remaining is not None and remaining <= 0):
+            break
+        time.sleep(pause if remaining is None else min(pause, remaining))
+    return [job for job in jobs if job not in pending], pending
+
+
+async def wait_async(jobs, timeout=None, interval=0.1, max_interval=10, backoff=2):
+    """Same as wait, without blocking the event loop. Statuses are requested in the loop's executor."""
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    pending = list(jobs)
+    for pause in polling_intervals(interval, max_interval, backoff):
+        pending_statuses = await loop.run_in_executor(None, statuses, pending)
+        pending = [job for job, status in zip(pending, pending_statuses) if status not in FINAL_STATUSES]
+        remaining = None if deadline is None else deadline - loop.time()
+        if not pending or (remaining is not None and remaining <= 0):
+            break
+        await asyncio.sleep(pause if remaining is None else min(pause, remaining))
+    return [job for job in jobs if job not in pending], pending
+
+
+async def result_async(job, timeout=None, **polling):
+    return (await results_async([job], timeout, **polling))[0]
+
+
+async def results_async(jobs, timeout=None, **polling):
+    """Awaits all jobs, polled together, and returns their results in order."""
+    _, pending = await wait_async(jobs, timeout, **polling)
+    if pending:
+        raise JobError(ErrorMessages.JOB_TIMED_OUT)
+    loop = asyncio.get_running_loop()
+    return [await loop.run_in_executor(None, job.fetch) for job in jobs]
+
+
+def submit(q_circuit, provider, simulator_name, repetitions, counts_format=constants.COUNTS_DICT,
+           converted_circuit=None, cache=None, **options):
+    """Submits one circuit without waiting for its result.
+    :param converted_circuit: circuit to run instead of the cached conversion of q_circuit,
+                              e.g. with bound parameters
+    :param cache: ResultCache of the job when it runs in the local thread pool
+    :return: Job
+    """
+    backend = backends.get_backend(provider)
+    if converted_circuit is None:
+        converted_circuit = q_circuit.check_and_convert(provider)
+    handle = None
+    if hasattr(backend, 'submit'):
+        handle = backend.submit(q_circuit, converted_circuit, simulator_name, repetitions,
+                                counts_format=counts_format, **options)
+    if handle is None:
+        run = partial(backend.execute, q_circuit, converted_circuit, simulator_name, repetitions,
+                      counts_format=counts_format, **options)
+        if cache is None:
+            handle = executor().submit(run)
+        else:
+            settings = result_cache.simulator_settings(
+                simulator_name, options.get('max_bond_dimension'),
+                options.get('truncation_threshold', constants.DEFAULT_TRUNCATION_THRESHOLD))
+            handle = executor().submit(cache.execute, q_circuit, provider, simulator_name, repetitions, run,
+                                       options.get('seed'), counts_format, options.get('device'),
+                                       options.get('precision', constants.PRECISION_DOUBLE), settings)
+    return Job(provider, handle, q_circuit, simulator_name, counts_format)
+
+
+def execute_async(circuits, provider=providers.DEFAULT_PROVIDER, simulator_name=constants.DEFAULT_SIMULATOR,
+                  repetitions=constants.DEFAULT_REPETITIONS, counts_format=constants.COUNTS_DICT,
+                  max_workers=None, **options):
+    """Submits many circuits concurrently, each submission being a separate request to the provider.
+    :param circuits: list of QCircuit objects
+    :param max_workers: number of concurrent submissions, one per circuit by default
+    :param options: provider options accepted by QCircuit.execute, such as api or device
+    :return: list with the Job of each circuit, in the order of circuits
+    """
+    # conversions are cached on the circuits, do them before sharing circuits between threads
+    converted_circuits = [circuit.check_and_convert(provider) for circuit in circuits]
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(circuits), 1)) as pool:
+        futures = [pool.submit(submit, circuit, provider, simulator_name, repetitions, counts_format,
+                               converted_circuit, **options)
+                   for circuit, converted_circuit in zip(circuits, converted_circuits)]
+        return [future.result() for future in futures]
@@ -0,0 +1,147 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Circuit metrics kept up to date as operations are appended.
+
+Each qubit has a frontier, the number of layers already used on it. An
+operation goes in the first layer after the frontiers of its qubits (as soon
+as possible scheduling) and moves them past that layer, so depth, gate counts
+and the layer of every operation cost O(number of its qubits) per appended
+operation. measure_all acts on all qubits, and the ancilla qubits of
+multi-controlled gates count as qubits of the gate. The frontiers move through
+a block as through its expanded operations, so depth is that of the expanded
+circuit, and its gates are counted as if expanded. layers() lists a block as
+one operation in the layer where it starts. Any change to the operations
+other than appending rebuilds the metrics on the next query.
+"""
+
+from array import array
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+
+
+def ancilla_qubits(extra):
+    """Returns the ancilla qubits held in the extras of an operation, a list or an (ancillas, mode) tuple."""
+    if isinstance(extra, tuple):
+        extra = extra[0]
+    return list(extra) if extra else []
+
+
+def advance(frontier, operations, num_qubits):
+    """Moves frontier, a float array of the layers used on each qubit, past operations in place."""
+    extras = operations.extras
+    for index, (op_type, qargs, params) in enumerate(operations):
+        if op_type == OpType.block:
+            frontier[qargs] = extras[index].metrics.advance_block(frontier[qargs], params[0])
+            continue
+        if op_type == OpType.measure_all:
+            qubits = list(range(num_qubits))
+        else:
+            qubits = qargs + ancilla_qubits(extras[index]) if index in extras else qargs
+        frontier[qubits] = frontier[qubits].max(initial=-np.inf) + 1
+    return frontier
+
+
+class CircuitMetrics:
+    """Depth, gate counts and ASAP layers of the Operations of a circuit of num_qubits qubits."""
+
+    def __init__(self, num_qubits):
+        super(CircuitMetrics, self).__init__()
+        self.num_qubits = num_qubits
+        self.operations = None
+        self.reset(None, None)
+
+    def reset(self, operations, rewrites):
+        self.operations = operations
+        self.rewrites = rewrites
+        self.length = 0
+        self.frontier = [0] * self.num_qubits
+        self.depth = 0
+        self.counts = {}
+        self.two_qubit_gates = 0
+        self.layer_of = array('l')
+        self.cached_layers = None
+        self.cached_transfer = None
+
+    def update(self, operations):
+        """Adds the operations appended since the last update, rebuilding after any other change."""
+        rewrites, length = operations.version
+        if operations is not self.operations or rewrites != self.rewrites or length < self.length:
+            self.reset(operations, rewrites)
+        extras = operations.extras
+        for index, (op_type, qargs, params) in enumerate(operations.iterate(self.length), self.length):
+            if op_type == OpType.block:
+                self.add_block(qargs, params[0], extras[index])
+            else:
+                self.add(op_type, qargs, ancilla_qubits(extras.get(index)) if index in extras else ())
+        self.length = length
+        return self
+
+    def add(self, op_type, qargs, ancillas=()):
+        if op_type == OpType.measure_all:
+            qubits = range(self.num_qubits)
+        else:
+            qubits = qargs + ancillas if ancillas else qargs
+        frontier = self.frontier
+        layer = max([frontier[qubit] for qubit in qubits], default=0)
+        for qubit in qubits:
+            frontier[qubit] = layer + 1
+        if layer >= self.depth:
+            self.depth = layer + 1
+        self.layer_of.append(layer)
+        self.counts[op_type] = self.counts.get(op_type, 0) + 1
+        if len(qargs) == 2:
+            self.two_qubit_gates += 1
+
+    def add_block(self, qargs, repetitions, block):
+        metrics = block.metrics
+        frontier = self.frontier
+        layer = max([frontier[qubit] for qubit in qargs], default=0)
+        ends = metrics.advance_block(np.array([frontier[qubit] for qubit in qargs], dtype=float), repetitions)
+        for qubit, end in zip(qargs, ends.tolist()):
+            frontier[qubit] = int(end)
+        self.depth = max(self.depth, int(ends.max(initial=0)))
+        self.layer_of.append(layer)
+        for op_type, count in metrics.counts.items():
+            self.counts[op_type] = self.counts.get(op_type, 0) + count * repetitions
+        self.two_qubit_gates += metrics.two_qubit_gates * repetitions
+
+    def transfer(self):
+        """Returns the (num_qubits, num_qubits) array whose entry i, j is the number of layers the operations
+        take from qubit i at their start to qubit j at their end, -inf when qubit j does not depend on qubit i."""
+        if self.cached_transfer is None:
+            transfer = np.full((self.num_qubits, self.num_qubits), -np.inf)
+            for qubit in range(self.num_qubits):
+                transfer[qubit, qubit] = 0
+                advance(transfer[qubit], self.operations, self.num_qubits)
+            self.cached_transfer = transfer
+        return self.cached_transfer
+
+    def advance_block(self, frontier, repetitions):
+        """Returns the frontier of the qubits of a block of these operations repeated repetitions times
+        that starts at frontier."""
+        transfer = self.transfer()
+        for _ in range(repetitions):
+            frontier = (frontier[:, None] + transfer).max(axis=0)
+        return frontier
+
+    def layers(self):
+        """Returns the operation indices of each layer. The list is built on the first call
+        and extended with the operations appended since the previous call."""
+        start, layers = (0, []) if self.cached_layers is None else self.cached_layers
+        layers.extend([] for _ in range(self.depth - len(layers)))
+        for index in range(start, self.length):
+            layers[self.layer_of[index]].append(index)
+        self.cached_layers = (self.length, layers)
+        return layers
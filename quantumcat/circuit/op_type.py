@@ -73,3 +73,4 @@ class OpType(Enum):
     u3_gate = 53
     measure = 100
     measure_all = 101
+    block = 102
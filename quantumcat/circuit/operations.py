@@ -0,0 +1,212 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import numbers
+from array import array
+from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.parameter import Parameter, bind_params
+from quantumcat.utils import constants
+
+OP_TYPES = {op_type.value: op_type for op_type in OpType}
+
+# Operations whose legacy qargs are a single qubit, e.g. {OpType.x_gate: [0]}
+SINGLE_QUBIT_OPS = frozenset([
+    OpType.x_gate, OpType.y_gate, OpType.z_gate, OpType.h_gate, OpType.i_gate,
+    OpType.s_gate, OpType.sdg_gate, OpType.t_gate, OpType.td_gate, OpType.sx_gate,
+    OpType.sxd_gate, OpType.rx_gate, OpType.ry_gate, OpType.rz_gate, OpType.r_gate,
+    OpType.p_gate, OpType.u_gate, OpType.u1_gate, OpType.u2_gate, OpType.u3_gate,
+    OpType.measure,
+])
+
+# Operations whose legacy qargs are a flat list, e.g. {OpType.mcx_gate: [0, 1, 2]}
+FLAT_QUBIT_OPS = frozenset([
+    OpType.mcx_gate, OpType.mcxgc_gate, OpType.mcxrec_gate, OpType.mcxvchain_gate, OpType.mcp_gate,
+])
+
+
+def map_extra(extra, qubit_map):
+    """Returns the extras of an operation with ancilla qubit q replaced by qubit_map[q]."""
+    if isinstance(extra, tuple):
+        ancilla_qubits, mode = extra
+        return [qubit_map[qubit] for qubit in ancilla_qubits] if ancilla_qubits else ancilla_qubits, mode
+    if isinstance(extra, list):
+        return [qubit_map[qubit] for qubit in extra]
+    # blocks are referenced by the qubits of the operation itself
+    return extra
+
+
+class Operations:
+    """Struct-of-arrays storage for the operations of a QCircuit.
+
+    Operation i has opcode opcodes[i] (the OpType value), acts on
+    qubits[qubit_offsets[i]:qubit_offsets[i + 1]] with control qubits first and
+    the target qubits last, and takes params[param_offsets[i]:param_offsets[i + 1]].
+    Ancilla qubits, the mct mode and the Block of OpType.block operations are
+    rarely used and are kept in the sparse extras dict, keyed by operation index.
+
+    Appending is the only mutation that keeps earlier operations intact. Any
+    other in-place change must call rewritten() so that caches built from the
+    operations, such as converted provider circuits, are rebuilt.
+    """
+
+    __slots__ = ('opcodes', 'qubit_offsets', 'qubits', 'param_offsets', 'params', 'extras', 'rewrites')
+
+    def __init__(self):
+        super(Operations, self).__init__()
+        self.opcodes = array('B')
+        self.qubit_offsets = array('l', [0])
+        self.qubits = array('l')
+        self.param_offsets = array('l', [0])
+        self.params = []
+        self.extras = {}
+        self.rewrites = 0
+
+    @property
+    def version(self):
+        """(rewrites, number of operations), changes whenever the operations change."""
+        return self.rewrites, len(self.opcodes)
+
+    def rewritten(self):
+        """Marks the operations as changed other than by appending."""
+        self.rewrites += 1
+
+    def replace(self, operations):
+        """Replaces the content with that of another Operations object, e.g. after an optimization pass."""
+        self.opcodes = operations.opcodes
+        self.qubit_offsets = operations.qubit_offsets
+        self.qubits = operations.qubits
+        self.param_offsets = operations.param_offsets
+        self.params = operations.params
+        self.extras = operations.extras
+        self.rewritten()
+
+    def append(self, op_type, qubits, params=(), extra=None):
+        """Appends an operation and returns its index.
+        :param op_type: OpType of the operation
+        :param qubits: qubits the operation acts on, control qubits first
+        :param params: operation params
+        :param extra: ancilla qubits and mode, or the Block of an OpType.block operation, if any
+        :return: index of the operation
+        """
+        index = len(self.opcodes)
+        self.opcodes.append(op_type.value)
+        self.qubits.extend(qubits)
+        self.qubit_offsets.append(len(self.qubits))
+        if params:
+            self.params.extend(params)
+        self.param_offsets.append(len(self.params))
+        if extra is not None:
+            self.extras[index] = extra
+        return index
+
+    def extend(self, operations, qubit_map=None):
+        """Appends all the operations of another Operations object.
+        :param operations: Operations to append
+        :param qubit_map: qubit_map[q] is the qubit that qubit q of operations acts on, the same qubit by default
+        """
+        start, qubit_start, param_start = len(self.opcodes), len(self.qubits), len(self.params)
+        self.opcodes.extend(operations.opcodes)
+        if qubit_map is None:
+            self.qubits.extend(operations.qubits)
+        else:
+            self.qubits.extend(map(qubit_map.__getitem__, operations.qubits))
+        self.qubit_offsets.extend([qubit_start + offset for offset in operations.qubit_offsets[1:]])
+        self.params.extend(operations.params)
+        self.param_offsets.extend([param_start + offset for offset in operations.param_offsets[1:]])
+        for index, extra in operations.extras.items():
+            self.extras[start + index] = extra if qubit_map is None else map_extra(extra, qubit_map)
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __iter__(self):
+        return self.iterate()
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.opcodes)
+        return (OP_TYPES[self.opcodes[index]],
+                self.qubits[self.qubit_offsets[index]:self.qubit_offsets[index + 1]].tolist(),
+                self.params[self.param_offsets[index]:self.param_offsets[index + 1]])
+
+    def iterate(self, start=0, stop=None):
+        """Yields (op_type, qubits, params) for the operations in [start, stop)."""
+        opcodes, qubits, params = self.opcodes, self.qubits, self.params
+        qubit_offsets, param_offsets = self.qubit_offsets, self.param_offsets
+        stop = len(opcodes) if stop is None else stop
+        for index in range(start, stop):
+            yield (OP_TYPES[opcodes[index]],
+                   qubits[qubit_offsets[index]:qubit_offsets[index + 1]].tolist(),
+                   params[param_offsets[index]:param_offsets[index + 1]])
+
+    def op_type(self, index):
+        return OP_TYPES[self.opcodes[index]]
+
+    def count(self, op_type, start=0, stop=None):
+        opcodes = self.opcodes if start == 0 and stop is None else self.opcodes[start:stop]
+        return opcodes.count(op_type.value)
+
+    def within(self, op_types):
+        """Whether every operation is one of op_types."""
+        return not self.opcodes.tobytes().translate(None, bytes(op_type.value for op_type in op_types))
+
+    def digest(self):
+        """Returns a sha256 hex digest of the operations, the same for equal operations in any process."""
+        params = [param.name if isinstance(param, Parameter) else
+                  float(param) if isinstance(param, numbers.Real) else repr(param) for param in self.params]
+        canonical = repr((self.opcodes.tolist(), self.qubit_offsets.tolist(), self.qubits.tolist(),
+                          self.param_offsets.tolist(), params, sorted(self.extras.items())))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def parameters(self):
+        """Returns the symbolic Parameters of the operations in order of first use."""
+        return list(dict.fromkeys(param for param in self.params if isinstance(param, Parameter)))
+
+    def bind(self, values):
+        """Returns a copy of the operations with the Parameters replaced by their value.
+        :param values: dict of parameter name to value
+        """
+        bound = Operations()
+        bound.opcodes = self.opcodes[:]
+        bound.qubit_offsets = self.qubit_offsets[:]
+        bound.qubits = self.qubits[:]
+        bound.param_offsets = self.param_offsets[:]
+        bound.params = bind_params(self.params, values)
+        bound.extras = dict(self.extras)
+        return bound
+
+    def to_dict(self, index):
+        """Returns operation index in the legacy {OpType: qargs, 'params': [...]} format."""
+        op_type, qubits, params = self[index]
+        if op_type == OpType.measure_all:
+            return {OpType.measure_all: OpType.measure_all}
+        if op_type in SINGLE_QUBIT_OPS:
+            qargs = qubits
+        elif op_type in FLAT_QUBIT_OPS:
+            qargs = qubits + list(self.extras.get(index, ()))
+        elif op_type == OpType.mct_gate:
+            ancilla_qubits, mode = self.extras[index]
+            qargs = [qubits[:-1], qubits[-1:], ancilla_qubits, mode]
+        elif op_type == OpType.block:
+            qargs = [qubits, self.extras[index]]
+        else:
+            qargs = [[qubit] for qubit in qubits]
+        op = {op_type: qargs}
+        if params:
+            op[constants.PARAMS] = params
+        return op
+
+    def to_dicts(self):
+        return [self.to_dict(index) for index in range(len(self.opcodes))]
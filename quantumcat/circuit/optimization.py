@@ -0,0 +1,126 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Peephole optimization of quantumcat operations before conversion.
+
+Consecutive single-qubit gates on the same qubit are collected into runs.
+Adjacent inverse pairs are cancelled inside a run and what remains of a run
+of two or more gates is fused into a single u3_gate. Gates on other qubits do
+not break a run, any operation that acts on the qubit (a multi-qubit gate, a
+measurement or a gate with symbolic params) does. Fused gates drop the global
+phase of the run, which does not change any measurement.
+"""
+
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+from quantumcat.circuit.operations import Operations, SINGLE_QUBIT_OPS
+from quantumcat.circuit.parameter import is_parameterized
+from quantumcat.gates import matrices
+
+FUSABLE_OPS = SINGLE_QUBIT_OPS - {OpType.measure}
+
+INVERSE_PAIRS = {
+    OpType.x_gate: OpType.x_gate,
+    OpType.y_gate: OpType.y_gate,
+    OpType.z_gate: OpType.z_gate,
+    OpType.h_gate: OpType.h_gate,
+    OpType.s_gate: OpType.sdg_gate,
+    OpType.sdg_gate: OpType.s_gate,
+    OpType.t_gate: OpType.td_gate,
+    OpType.td_gate: OpType.t_gate,
+    OpType.sx_gate: OpType.sxd_gate,
+    OpType.sxd_gate: OpType.sx_gate,
+}
+
+TOLERANCE = 1e-10
+
+
+def optimize(operations, num_qubits):
+    """Returns optimized copy of operations.
+    :param operations: Operations of the circuit
+    :param num_qubits: number of qubits of the circuit
+    :return: Operations
+    """
+    # slots hold a single operation, or the list of operations a run reduces to
+    slots = []
+    runs = {}
+
+    def flush(qubit):
+        if qubit in runs:
+            slot, run = runs.pop(qubit)
+            slots[slot] = simplify(run, qubit)
+
+    for index, (op_type, qargs, params) in enumerate(operations):
+        extra = operations.extras.get(index)
+        if op_type in FUSABLE_OPS and not is_parameterized(params):
+            qubit = qargs[0]
+            if qubit not in runs:
+                runs[qubit] = (len(slots), [])
+                slots.append(None)
+            runs[qubit][1].append((op_type, params))
+            continue
+        touched = list(qargs)
+        if op_type == OpType.measure_all:
+            touched = range(num_qubits)
+        elif op_type == OpType.mct_gate:
+            touched += extra[0] or []
+        elif extra is not None and op_type != OpType.block:
+            touched += extra
+        for qubit in touched:
+            flush(qubit)
+        slots.append((op_type, qargs, params, extra))
+    for qubit in list(runs):
+        flush(qubit)
+
+    optimized = Operations()
+    for slot in slots:
+        for op_type, qargs, params, extra in (slot if isinstance(slot, list) else [slot]):
+            optimized.append(op_type, qargs, params, extra)
+    return optimized
+
+
+def simplify(run, qubit):
+    """Cancels the inverse pairs of a run of single-qubit gates and fuses what remains."""
+    stack = []
+    for op_type, params in run:
+        if stack and not params and not stack[-1][1] and INVERSE_PAIRS.get(stack[-1][0]) == op_type:
+            stack.pop()
+        else:
+            stack.append((op_type, params))
+    if len(stack) < 2:
+        return [(op_type, [qubit], params, None) for op_type, params in stack]
+
+    unitary = matrices.I
+    for op_type, params in stack:
+        unitary = matrices.gate(op_type, params, 1)[1] @ unitary
+    if abs(abs(np.trace(unitary)) - 2) < TOLERANCE:
+        return []
+    return [(OpType.u3_gate, [qubit], list(u3_params(unitary)), None)]
+
+
+def u3_params(unitary):
+    """Returns (theta, phi, lam) of the u3 gate equal to unitary up to a global phase."""
+    theta = 2 * np.arctan2(abs(unitary[1, 0]), abs(unitary[0, 0]))
+    if abs(unitary[0, 0]) < TOLERANCE:
+        phase = np.angle(unitary[1, 0])
+        return float(theta), 0.0, float(np.angle(-unitary[0, 1]) - phase)
+    phase = np.angle(unitary[0, 0])
+    if abs(unitary[1, 0]) < TOLERANCE:
+        return float(theta), 0.0, float(np.angle(unitary[1, 1]) - phase)
+    return float(theta), float(np.angle(unitary[1, 0]) - phase), float(np.angle(-unitary[0, 1]) - phase)
+
+
+def gate_count(operations):
+    """Number of gates, measurements excluded."""
+    return len(operations) - operations.count(OpType.measure) - operations.count(OpType.measure_all)
@@ -0,0 +1,47 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+class Parameter:
+    """Symbolic gate parameter that is bound to a value at execution time.
+
+    Parameters are identified by name, so two Parameter objects with the same
+    name are the same parameter of a circuit.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        super(Parameter, self).__init__()
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Parameter) and other.name == self.name
+
+    def __hash__(self):
+        return hash((Parameter, self.name))
+
+    def __repr__(self):
+        return "Parameter({!r})".format(self.name)
+
+    def __str__(self):
+        return self.name
+
+
+def is_parameterized(params):
+    return any(isinstance(param, Parameter) for param in params)
+
+
+def bind_params(params, values):
+    """Replaces the Parameters in params by their value in values, a dict of parameter name to value."""
+    return [values[param.name] if isinstance(param, Parameter) else param for param in params]
@@ -0,0 +1,200 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Opt-in on-disk cache of execution results.
+
+Results are stored in SQLite, keyed by a hash of the circuit operations,
+qubits and classical bits together with the provider, device, simulator_name,
+repetitions, seed, counts_format, precision and simulator settings. Runs with a seed therefore hit the cache
+with the same result they would have computed, counts of runs without a seed
+are never stored. The native statevector of a
+circuit whose measurements are all terminal is cached and sampled again for
+any number of repetitions instead of running the circuit. QCircuit.execute
+does not cache runs given an api or a device, which target remote services.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import numpy as np
+from quantumcat.circuit.block import expand
+from quantumcat.simulators import Counts, StatevectorSimulator, is_clifford, sampling
+from quantumcat.utils import constants, providers
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'quantumcat', 'results.sqlite')
+
+# providers whose counts are sampled from a measurement-free statevector, other simulators such as the
+# statevector_simulator of Aer apply the measurements and return a collapsed statevector
+RESAMPLED_PROVIDERS = (providers.NATIVE_PROVIDER,)
+
+
+class ResultCache:
+    """SQLite store of execution results with size and age based eviction.
+
+    :param path: database file, created with its directory if needed
+    :param max_bytes: total size of the stored results above which the least recently used are evicted
+    :param max_age_seconds: age after which results are evicted, never by default
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=256 * 1024 ** 2, max_age_seconds=None):
+        super(ResultCache, self).__init__()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB, '
+                                'size INTEGER, created REAL, accessed REAL)')
+        self.connection.commit()
+
+    @staticmethod
+    def key(q_circuit, provider, simulator_name, repetitions, seed=None, counts_format=constants.COUNTS_DICT,
+            device=None, precision=constants.PRECISION_DOUBLE, settings=()):
+        """Returns the cache key of an execution. Statevectors do not depend on repetitions,
+        seed or counts_format.
+        :param settings: other options changing the result, e.g. the truncation of MPS_SIMULATOR
+        """
+        if simulator_name == constants.STATEVECTOR_SIMULATOR:
+            repetitions, seed, counts_format = 0, None, constants.COUNTS_DICT
+        canonical = repr((q_circuit.operations.digest(), q_circuit.qubits, q_circuit.cbits, provider,
+                          device, simulator_name, repetitions, seed, counts_format, precision, tuple(settings)))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key):
+        """Returns the result stored under key, or None."""
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute('SELECT value, created FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if self.max_age_seconds is not None and now - row[1] > self.max_age_seconds:
+                self.connection.execute('DELETE FROM results WHERE key = ?', (key,))
+                self.connection.commit()
+                return None
+            self.connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (now, key))
+            self.connection.commit()
+        return pickle.loads(row[0])
+
+    def put(self, key, result):
+        """Stores result under key and evicts old and least recently used results."""
+        value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self.lock:
+            self.connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                                    (key, value, len(value), now, now))
+            self.evict(now)
+            self.connection.commit()
+
+    def evict(self, now):
+        if self.max_age_seconds is not None:
+            self.connection.execute('DELETE FROM results WHERE created < ?', (now - self.max_age_seconds,))
+        total = self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self.connection.execute('SELECT key, size FROM results ORDER BY accessed'):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self.connection.executemany('DELETE FROM results WHERE key = ?', evicted)
+
+    def execute(self, q_circuit, provider, simulator_name, repetitions, run, seed=None,
+                counts_format=constants.COUNTS_DICT, device=None, precision=constants.PRECISION_DOUBLE, settings=()):
+        """Returns the cached result of an execution, computing and storing it on a miss.
+        Counts of runs without a seed are sampled again on every call and never stored.
+        :param run: function executing the circuit and returning its result
+        """
+        reproducible = simulator_name == constants.STATEVECTOR_SIMULATOR or seed is not None
+        key = self.key(q_circuit, provider, simulator_name, repetitions, seed, counts_format, device, precision,
+                       settings)
+        result = self.get(key) if reproducible else None
+        if result is None:
+            if simulator_name == constants.DEFAULT_SIMULATOR:
+                result = self.resample(q_circuit, provider, repetitions, seed, counts_format, device, precision)
+            if result is None:
+                result = run()
+            if reproducible and isinstance(result, (dict, Counts, np.ndarray)):
+                self.put(key, result)
+        return result
+
+    def resample(self, q_circuit, provider, repetitions, seed, counts_format, device,
+                 precision=constants.PRECISION_DOUBLE):
+        """Samples the counts from the cached statevector of the circuit, computing and caching
+        the statevector on the first call. Only native circuits are resampled."""
+        operations = expand(q_circuit.operations)
+        if provider not in RESAMPLED_PROVIDERS or not StatevectorSimulator.measurements_are_terminal(list(operations)):
+            return None
+        if is_clifford(operations):
+            # the stabilizer simulator samples these without a statevector
+            return None
+        state_key = self.key(q_circuit, provider, constants.STATEVECTOR_SIMULATOR, 0, device=device,
+                             precision=precision)
+        state = self.get(state_key)
+        simulator = StatevectorSimulator(seed, precision)
+        if state is None:
+            state = simulator.statevector(operations, q_circuit.qubits)
+            self.put(state_key, state)
+        counts = simulator.sample_counts(state, operations, q_circuit.qubits, q_circuit.cbits, repetitions)
+        return sampling.format_counts(counts, counts_format, simulator.rng)
+
+    def clear(self):
+        with self.lock:
+            self.connection.execute('DELETE FROM results')
+            self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+
+def simulator_settings(simulator_name, max_bond_dimension=None,
+                       truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD):
+    """Returns the settings of ResultCache.key for the options of simulator_name that change its results."""
+    if simulator_name == constants.MPS_SIMULATOR:
+        return max_bond_dimension, truncation_threshold
+    return ()
+
+
+_active = None
+
+
+def enable(path=DEFAULT_PATH, max_bytes=256 * 1024 ** 2, max_age_seconds=None):
+    """Caches the results of every QCircuit.execute call without parameter_values from now on.
+    :return: the ResultCache used
+    """
+    global _active
+    disable()
+    _active = ResultCache(path, max_bytes, max_age_seconds)
+    return _active
+
+
+def disable():
+    global _active
+    if _active is not None:
+        _active.close()
+    _active = None
+
+
+def active_cache():
+    """Returns the ResultCache enabled with enable, or None."""
+    return _active
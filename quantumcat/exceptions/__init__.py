@@ -19,3 +19,5 @@ from quantumcat.exceptions.install_error import InstallNotFoundError
 from quantumcat.exceptions.api_error import APIDetailsNotFoundError
 from quantumcat.exceptions.password_length import PasswordLengthError
 from quantumcat.exceptions.otp_length import OTPLengthError
+from quantumcat.exceptions.provider_error import ProviderNotFoundError
+from quantumcat.exceptions.job_error import JobError
@@ -12,5 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from quantumcat.gates.custom_gates import cirq
-from quantumcat.gates.custom_gates import braket
+from importlib import import_module
+
+# cirq and braket custom gates are imported on first access so that only the
+# SDK of the provider being used is loaded.
+SUBMODULES = ('cirq', 'braket')
+
+
+def __getattr__(name):
+    if name not in SUBMODULES:
+        raise AttributeError("module {} has no attribute {}".format(__name__, name))
+    return import_module(__name__ + '.' + name)
@@ -1,8 +1,9 @@
 import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class C3SXGate(cirq.Gate):
+class C3SXGate(CachedUnitaryGate):
 
     def __init__(self):
         super(C3SXGate, self).__init__()
@@ -10,7 +11,7 @@ class C3SXGate(cirq.Gate):
     def _num_qubits_(self):
         return 4
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         exp1 = (1+1j)/2
         exp2 = (1-1j)/2
         mat = numpy.array([[1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -31,5 +32,8 @@ class C3SXGate(cirq.Gate):
                            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, exp2, exp1]], dtype=dtype)
         return mat
 
+    def _decompose_(self, qubits):
+        yield (cirq.X ** 0.5)(qubits[-1]).controlled_by(*qubits[:-1])
+
     def _circuit_diagram_info_(self, args):
         return ["C3SX_c1", "C3SX_c2", "C3SX_c3", "C3SX_t"]
\ No newline at end of file
@@ -1,8 +1,9 @@
 import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class C3XGate(cirq.Gate):
+class C3XGate(CachedUnitaryGate):
 
     def __init__(self):
         super(C3XGate, self).__init__()
@@ -10,7 +11,7 @@ class C3XGate(cirq.Gate):
     def _num_qubits_(self):
         return 4
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         mat = numpy.array([[1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                            [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                            [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -29,5 +30,8 @@ class C3XGate(cirq.Gate):
                            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0]], dtype=dtype)
         return mat
 
+    def _decompose_(self, qubits):
+        yield cirq.X(qubits[-1]).controlled_by(*qubits[:-1])
+
     def _circuit_diagram_info_(self, args):
         return ["C3X_c1", "C3X_c2", "C3X_c3", "C3X_t"]
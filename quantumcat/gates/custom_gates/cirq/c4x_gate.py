@@ -1,8 +1,9 @@
 import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class C4XGate(cirq.Gate):
+class C4XGate(CachedUnitaryGate):
 
     def __init__(self):
         super(C4XGate, self).__init__()
@@ -10,7 +11,7 @@ class C4XGate(cirq.Gate):
     def _num_qubits_(self):
         return 5
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         mat = numpy.array([[1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                            [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                            [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -47,5 +48,8 @@ class C4XGate(cirq.Gate):
         return mat
     
     
+    def _decompose_(self, qubits):
+        yield cirq.X(qubits[-1]).controlled_by(*qubits[:-1])
+
     def _circuit_diagram_info_(self, args):
         return ["C4X_c1", "C4X_c2", "C4X_c3", "C4X_c4", "C4X_t"]
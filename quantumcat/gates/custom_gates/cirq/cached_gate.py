@@ -0,0 +1,72 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import cirq
+import numpy
+
+# unitaries by gate class and params, cleared when it reaches MAX_CACHED entries
+MATRICES = {}
+MAX_CACHED = 4096
+
+
+class CachedUnitaryGate(cirq.Gate):
+    """Base class of the quantumcat cirq gates.
+
+    Subclasses build their matrix in matrix(). The unitary is built once per
+    gate class and params. When it changes at most half of the basis states, as
+    for the multi-controlled gates, only the slices of the state for those basis
+    states are updated instead of applying the dense matrix.
+    """
+
+    def matrix(self, dtype=None):
+        raise NotImplementedError
+
+    def cached(self):
+        key = (type(self),) + tuple(vars(self).values())
+        cached = MATRICES.get(key)
+        if cached is None:
+            matrix = numpy.asarray(self.matrix(), dtype=complex)
+            cached = matrix, self.sparse_rows(matrix)
+            if len(MATRICES) >= MAX_CACHED:
+                MATRICES.clear()
+            MATRICES[key] = cached
+        return cached
+
+    @staticmethod
+    def sparse_rows(matrix):
+        """Returns [(row, [(column, value), ...]), ...] for the rows of matrix that differ from
+        the identity, or None if they are more than half of the rows."""
+        changed = numpy.flatnonzero(numpy.any(matrix != numpy.eye(len(matrix)), axis=1))
+        if len(changed) > len(matrix) // 2:
+            return None
+        return [(int(row), [(int(column), matrix[row, column]) for column in numpy.flatnonzero(matrix[row])])
+                for row in changed]
+
+    def _unitary_(self):
+        return self.cached()[0]
+
+    def _apply_unitary_(self, args):
+        rows = self.cached()[1]
+        if rows is None:
+            return NotImplemented
+        target, buffer = args.target_tensor, args.available_buffer
+        for row, entries in rows:
+            index = args.subspace_index(big_endian_bits_int=row)
+            column, value = entries[0]
+            buffer[index] = value * target[args.subspace_index(big_endian_bits_int=column)]
+            for column, value in entries[1:]:
+                buffer[index] += value * target[args.subspace_index(big_endian_bits_int=column)]
+        for row, _ in rows:
+            index = args.subspace_index(big_endian_bits_int=row)
+            target[index] = buffer[index]
+        return target
@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CHGate(cirq.Gate):
+class CHGate(CachedUnitaryGate):
 
     def __init__(self):
         super(CHGate, self).__init__()
@@ -10,7 +10,7 @@ class CHGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         _sqrt2o2 = 1 / numpy.sqrt(2)
         return numpy.array([[1, 0, 0, 0],
                             [0, _sqrt2o2, 0, _sqrt2o2],
@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CRXGate(cirq.Gate):
+class CRXGate(CachedUnitaryGate):
 
     def __init__(self, theta):
         super(CRXGate, self).__init__()
@@ -11,7 +11,7 @@ class CRXGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         theta2 = float(self.theta) / 2
         cos = numpy.cos(theta2)
         isin = 1j * numpy.sin(theta2)
@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CRYGate(cirq.Gate):
+class CRYGate(CachedUnitaryGate):
 
     def __init__(self, theta):
         super(CRYGate, self).__init__()
@@ -11,7 +11,7 @@ class CRYGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         theta2 = float(self.theta) / 2
         cos = numpy.cos(theta2)
         sin = numpy.sin(theta2)
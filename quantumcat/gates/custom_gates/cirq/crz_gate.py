@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CRZGate(cirq.Gate):
+class CRZGate(CachedUnitaryGate):
 
     def __init__(self, lam):
         super(CRZGate, self).__init__()
@@ -11,7 +11,7 @@ class CRZGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         lamd = float(self.lam)/2
         lam1 = numpy.exp(-1j * lamd)
         lam2 = numpy.exp(1j * lamd)
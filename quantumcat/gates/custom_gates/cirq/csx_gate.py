@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CSXGate(cirq.Gate):
+class CSXGate(CachedUnitaryGate):
 
     def __init__(self):
         super(CSXGate, self).__init__()
@@ -10,7 +10,7 @@ class CSXGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         par1 = (1+1j)/2
         par2 = (1-1j)/2
         return numpy.array([[1, 0, 0, 0],
@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CU1Gate(cirq.Gate):
+class CU1Gate(CachedUnitaryGate):
 
     def __init__(self, lam):
         super(CU1Gate, self).__init__()
@@ -11,7 +11,7 @@ class CU1Gate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         exp1 = numpy.exp(1j*self.lam)
         return numpy.array([[1, 0, 0, 0],
                             [0, 1, 0, 0],
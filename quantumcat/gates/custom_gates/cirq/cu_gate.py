@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CUGate(cirq.Gate):
+class CUGate(CachedUnitaryGate):
 
     def __init__(self, theta, phi, lam, gam):
         super(CUGate, self).__init__()
@@ -14,7 +14,7 @@ class CUGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         cos = numpy.cos(self.theta/2)
         sin = numpy.sin(self.theta/2)  
         exp1 = numpy.exp(1j*self.gam)
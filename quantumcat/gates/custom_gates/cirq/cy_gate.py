@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class CYGate(cirq.Gate):
+class CYGate(CachedUnitaryGate):
     
     def __init__(self):
         super(CYGate, self).__init__()
@@ -23,7 +23,7 @@ class CYGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         return numpy.array([[1, 0, 0, 0],
                             [0, 1, 0, 0],
                             [0, 0, 0, -1j],
@@ -1,8 +1,8 @@
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class DCXGate(cirq.Gate):
+class DCXGate(CachedUnitaryGate):
 
     def __init__(self):
         super(DCXGate, self).__init__()
@@ -10,7 +10,7 @@ class DCXGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         return numpy.array([[1, 0, 0, 0],
                             [0, 0, 1, 0],
                             [0, 0, 0, 1],
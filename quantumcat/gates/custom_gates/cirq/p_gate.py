@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class PGate(cirq.Gate):
+class PGate(CachedUnitaryGate):
     def __init__(self, theta):
         super(PGate, self).__init__()
         self.theta = theta
@@ -23,7 +23,7 @@ class PGate(cirq.Gate):
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         lam = float(self.theta)
         return numpy.array([[1, 0],
                             [0, numpy.exp(1j * lam)]], dtype=dtype)
@@ -11,12 +11,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
 import math
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RGate(cirq.Gate):
+class RGate(CachedUnitaryGate):
     def __init__(self, theta, phi):
         super(RGate, self).__init__()
         self.theta = theta
@@ -25,7 +25,7 @@ class RGate(cirq.Gate):
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         theta, phi = float(self.theta), float(self.phi)
         cos = math.cos(theta / 2)
         sin = math.sin(theta / 2)
@@ -13,16 +13,17 @@
 #  limitations under the License.
 import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RC3XGate(cirq.Gate):
+class RC3XGate(CachedUnitaryGate):
     def __init__(self):
         super(RC3XGate, self).__init__()
 
     def _num_qubits_(self):
         return 4
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         return numpy.array([[1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                             [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                             [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
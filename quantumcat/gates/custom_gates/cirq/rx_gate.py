@@ -11,12 +11,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
 import math
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RXGate(cirq.Gate):
+class RXGate(CachedUnitaryGate):
     def __init__(self, theta):
         super(RXGate, self).__init__()
         self.theta = theta
@@ -24,7 +24,7 @@ class RXGate(cirq.Gate):
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         cos = math.cos(self.theta / 2)
         sin = math.sin(self.theta / 2)
         return numpy.array([[cos, -1j * sin],
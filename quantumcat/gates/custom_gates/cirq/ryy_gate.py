@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy as np
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RYYGate(cirq.Gate):
+class RYYGate(CachedUnitaryGate):
     def __init__(self, phi):
         super(RYYGate, self).__init__()
         self.phi = phi
@@ -23,7 +23,7 @@ class RYYGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         theta = float(self.phi)
         cos = np.cos(self.phi / 2)
         isin = 1j * np.sin(self.phi / 2)
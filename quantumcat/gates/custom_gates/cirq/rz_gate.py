@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy as np
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RZGate(cirq.Gate):
+class RZGate(CachedUnitaryGate):
     def __init__(self, phi):
         super(RZGate, self).__init__()
         self.phi = phi
@@ -23,7 +23,7 @@ class RZGate(cirq.Gate):
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         ilam2 = 0.5j * float(self.phi)
         return np.array([[np.exp(-ilam2), 0],
                          [0, np.exp(ilam2)]], dtype=dtype)
@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RZXGate(cirq.Gate):
+class RZXGate(CachedUnitaryGate):
     def __init__(self, theta):
         super(RZXGate, self).__init__()
         self.theta = theta
@@ -23,7 +23,7 @@ class RZXGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         half_theta = float(self.theta) / 2
         cos = numpy.cos(half_theta)
         isin = 1j * numpy.sin(half_theta)
@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class RZZGate(cirq.Gate):
+class RZZGate(CachedUnitaryGate):
     def __init__(self, theta):
         super(RZZGate, self).__init__()
         self.theta = theta
@@ -23,7 +23,7 @@ class RZZGate(cirq.Gate):
     def _num_qubits_(self):
         return 2
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         itheta2 = 1j * float(self.theta) / 2
         return numpy.array([[numpy.exp(-itheta2), 0, 0, 0],
                             [0, numpy.exp(itheta2), 0, 0],
@@ -11,18 +11,18 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class SXDGate(cirq.Gate):
+class SXDGate(CachedUnitaryGate):
     def __init__(self):
         super(SXDGate, self).__init__()
 
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         return numpy.array([[1 - 1j, 1 + 1j],
                             [1 + 1j, 1 - 1j]], dtype=dtype) / 2
 
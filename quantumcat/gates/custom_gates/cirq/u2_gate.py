@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class U2Gate(cirq.Gate):
+class U2Gate(CachedUnitaryGate):
     def __init__(self, phi, lam):
         super(U2Gate, self).__init__()
         self.phi = phi
@@ -24,7 +24,7 @@ class U2Gate(cirq.Gate):
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         isqrt2 = 1 / numpy.sqrt(2)
         phi, lam = self.phi, self.lam
         phi, lam = float(phi), float(lam)
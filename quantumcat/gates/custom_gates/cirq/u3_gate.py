@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import cirq
 import numpy
+from quantumcat.gates.custom_gates.cirq.cached_gate import CachedUnitaryGate
 
 
-class U3Gate(cirq.Gate):
+class U3Gate(CachedUnitaryGate):
     def __init__(self, theta, phi, lam):
         super(U3Gate, self).__init__()
         self.theta = theta
@@ -25,7 +25,7 @@ class U3Gate(cirq.Gate):
     def _num_qubits_(self):
         return 1
 
-    def _unitary_(self, dtype=None):
+    def matrix(self, dtype=None):
         theta, phi, lam = self.theta, self.phi, self.lam
         theta, phi, lam = float(theta), float(phi), float(lam)
         cos = numpy.cos(theta / 2)
@@ -0,0 +1,232 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""NumPy unitaries for every quantumcat gate.
+
+Matrices use qiskit's little-endian convention: the first qubit an operation
+acts on is the least significant bit of the matrix index. Controlled gates are
+described by the number of control qubits and the base unitary that acts on
+the remaining (target) qubits, so simulators can apply them without building
+the full controlled matrix.
+"""
+
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+
+SQRT1_2 = 1 / np.sqrt(2)
+
+I = np.eye(2, dtype=complex)
+X = np.array([[0, 1], [1, 0]], dtype=complex)
+Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
+Z = np.array([[1, 0], [0, -1]], dtype=complex)
+H = np.array([[1, 1], [1, -1]], dtype=complex) * SQRT1_2
+S = np.array([[1, 0], [0, 1j]], dtype=complex)
+SDG = np.array([[1, 0], [0, -1j]], dtype=complex)
+T = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex)
+TD = np.array([[1, 0], [0, np.exp(-1j * np.pi / 4)]], dtype=complex)
+SX = np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]], dtype=complex) / 2
+SXD = np.array([[1 - 1j, 1 + 1j], [1 + 1j, 1 - 1j]], dtype=complex) / 2
+SWAP = np.array([[1, 0, 0, 0],
+                 [0, 0, 1, 0],
+                 [0, 1, 0, 0],
+                 [0, 0, 0, 1]], dtype=complex)
+ISWAP = np.array([[1, 0, 0, 0],
+                  [0, 0, 1j, 0],
+                  [0, 1j, 0, 0],
+                  [0, 0, 0, 1]], dtype=complex)
+DCX = np.array([[1, 0, 0, 0],
+                [0, 0, 0, 1],
+                [0, 1, 0, 0],
+                [0, 0, 1, 0]], dtype=complex)
+RCCX = np.array([[1, 0, 0, 0, 0, 0, 0, 0],
+                 [0, 1, 0, 0, 0, 0, 0, 0],
+                 [0, 0, 1, 0, 0, 0, 0, 0],
+                 [0, 0, 0, 0, 0, 0, 0, -1j],
+                 [0, 0, 0, 0, 1, 0, 0, 0],
+                 [0, 0, 0, 0, 0, -1, 0, 0],
+                 [0, 0, 0, 0, 0, 0, 1, 0],
+                 [0, 0, 0, 1j, 0, 0, 0, 0]], dtype=complex)
+
+
+def rx(theta):
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[cos, -1j * sin],
+                     [-1j * sin, cos]], dtype=complex)
+
+
+def ry(theta):
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[cos, -sin],
+                     [sin, cos]], dtype=complex)
+
+
+def rz(phi):
+    return np.array([[np.exp(-0.5j * phi), 0],
+                     [0, np.exp(0.5j * phi)]], dtype=complex)
+
+
+def p(lam):
+    return np.array([[1, 0],
+                     [0, np.exp(1j * lam)]], dtype=complex)
+
+
+def r(theta, phi):
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[cos, -1j * np.exp(-1j * phi) * sin],
+                     [-1j * np.exp(1j * phi) * sin, cos]], dtype=complex)
+
+
+def u2(phi, lam):
+    return np.array([[1, -np.exp(1j * lam)],
+                     [np.exp(1j * phi), np.exp(1j * (phi + lam))]], dtype=complex) * SQRT1_2
+
+
+def u3(theta, phi, lam):
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[cos, -np.exp(1j * lam) * sin],
+                     [np.exp(1j * phi) * sin, np.exp(1j * (phi + lam)) * cos]], dtype=complex)
+
+
+def cu(theta, phi, lam, gamma):
+    return np.exp(1j * gamma) * u3(theta, phi, lam)
+
+
+def rxx(theta):
+    cos, isin = np.cos(theta / 2), 1j * np.sin(theta / 2)
+    return np.array([[cos, 0, 0, -isin],
+                     [0, cos, -isin, 0],
+                     [0, -isin, cos, 0],
+                     [-isin, 0, 0, cos]], dtype=complex)
+
+
+def ryy(theta):
+    cos, isin = np.cos(theta / 2), 1j * np.sin(theta / 2)
+    return np.array([[cos, 0, 0, isin],
+                     [0, cos, -isin, 0],
+                     [0, -isin, cos, 0],
+                     [isin, 0, 0, cos]], dtype=complex)
+
+
+def rzz(theta):
+    minus, plus = np.exp(-0.5j * theta), np.exp(0.5j * theta)
+    return np.diag([minus, plus, plus, minus]).astype(complex)
+
+
+def rzx(theta):
+    cos, isin = np.cos(theta / 2), 1j * np.sin(theta / 2)
+    return np.array([[cos, 0, -isin, 0],
+                     [0, cos, 0, isin],
+                     [-isin, 0, cos, 0],
+                     [0, isin, 0, cos]], dtype=complex)
+
+
+def rc3x():
+    mat = np.eye(16, dtype=complex)
+    mat[3, 3] = 1j
+    mat[11, 11] = -1j
+    mat[7, 7] = 0
+    mat[15, 15] = 0
+    mat[7, 15] = 1
+    mat[15, 7] = -1
+    return mat
+
+
+# Number of control qubits (None: every qubit but the last one) and a factory
+# returning the base unitary from the operation params.
+GATES = {
+    OpType.i_gate: (0, lambda: I),
+    OpType.x_gate: (0, lambda: X),
+    OpType.y_gate: (0, lambda: Y),
+    OpType.z_gate: (0, lambda: Z),
+    OpType.h_gate: (0, lambda: H),
+    OpType.s_gate: (0, lambda: S),
+    OpType.sdg_gate: (0, lambda: SDG),
+    OpType.t_gate: (0, lambda: T),
+    OpType.td_gate: (0, lambda: TD),
+    OpType.sx_gate: (0, lambda: SX),
+    OpType.sxd_gate: (0, lambda: SXD),
+    OpType.rx_gate: (0, rx),
+    OpType.ry_gate: (0, ry),
+    OpType.rz_gate: (0, rz),
+    OpType.p_gate: (0, p),
+    OpType.r_gate: (0, r),
+    OpType.u_gate: (0, u3),
+    OpType.u1_gate: (0, p),
+    OpType.u2_gate: (0, u2),
+    OpType.u3_gate: (0, u3),
+    OpType.swap_gate: (0, lambda: SWAP),
+    OpType.iswap_gate: (0, lambda: ISWAP),
+    OpType.dcx_gate: (0, lambda: DCX),
+    OpType.rxx_gate: (0, rxx),
+    OpType.ryy_gate: (0, ryy),
+    OpType.rzz_gate: (0, rzz),
+    OpType.rzx_gate: (0, rzx),
+    OpType.rccx_gate: (0, lambda: RCCX),
+    OpType.rc3x_gate: (0, rc3x),
+    OpType.cx_gate: (1, lambda: X),
+    OpType.cy_gate: (1, lambda: Y),
+    OpType.cz_gate: (1, lambda: Z),
+    OpType.ch_gate: (1, lambda: H),
+    OpType.csx_gate: (1, lambda: SX),
+    OpType.crx_gate: (1, rx),
+    OpType.cry_gate: (1, ry),
+    OpType.crz_gate: (1, rz),
+    OpType.cphase_gate: (1, p),
+    OpType.cu1_gate: (1, p),
+    OpType.cu3_gate: (1, u3),
+    OpType.cu_gate: (1, cu),
+    OpType.cswap_gate: (1, lambda: SWAP),
+    OpType.ccx_gate: (2, lambda: X),
+    OpType.c3x_gate: (3, lambda: X),
+    OpType.c3sx_gate: (3, lambda: SX),
+    OpType.c4x_gate: (4, lambda: X),
+    OpType.mct_gate: (None, lambda: X),
+    OpType.mcx_gate: (None, lambda num_ctrl: X),
+    OpType.mcxgc_gate: (None, lambda num_ctrl: X),
+    OpType.mcxrec_gate: (None, lambda num_ctrl: X),
+    OpType.mcxvchain_gate: (None, lambda num_ctrl, dirty_ancilla: X),
+    OpType.mcp_gate: (None, lambda lam, num_ctrl: p(lam)),
+}
+
+
+def gate(op_type, params, num_qubits):
+    """Returns the number of control qubits and the base unitary of an operation.
+    :param op_type: OpType of the operation
+    :param params: operation params
+    :param num_qubits: number of qubits the operation acts on
+    :return: (num_controls, base unitary acting on the target qubits)
+    """
+    num_controls, factory = GATES[op_type]
+    if num_controls is None:
+        num_controls = num_qubits - 1
+    return num_controls, factory(*params)
+
+
+def controlled(base, num_controls):
+    """Builds the dense little-endian unitary of base controlled by the
+    num_controls least significant qubits."""
+    if num_controls == 0:
+        return base
+    dim = base.shape[0] << num_controls
+    mat = np.eye(dim, dtype=complex)
+    ctrl = (1 << num_controls) - 1
+    indices = [ctrl | (i << num_controls) for i in range(base.shape[0])]
+    mat[np.ix_(indices, indices)] = base
+    return mat
+
+
+def unitary(op_type, params, num_qubits):
+    """Returns the dense little-endian unitary of an operation."""
+    num_controls, base = gate(op_type, params, num_qubits)
+    return controlled(base, num_controls)
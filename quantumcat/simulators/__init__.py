@@ -0,0 +1,18 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from quantumcat.simulators.statevector import StatevectorSimulator, as_statevector, precision_dtype
+from quantumcat.simulators.stabilizer import StabilizerSimulator, is_clifford
+from quantumcat.simulators.mps import MPSSimulator, MatrixProductState
+from quantumcat.simulators.sampling import Counts
@@ -0,0 +1,256 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+from quantumcat.exceptions import CircuitError
+from quantumcat.gates import matrices
+from quantumcat.simulators.statevector import StatevectorSimulator, precision_dtype
+from quantumcat.utils import ErrorMessages, constants
+
+
+class MatrixProductState:
+    """Matrix product state of num_qubits qubits.
+
+    tensors[i] has shape (left bond, 2, right bond) and holds qubit layout[i],
+    site[q] being the position of qubit q. Qubits are moved next to each other
+    by swaps when a gate needs it and stay where they are afterwards. The state
+    is kept in mixed canonical form around tensors[center], so the singular
+    values of every split are its Schmidt coefficients.
+
+    Splits keep at most max_bond_dimension singular values and drop the
+    smallest ones while their squared weight stays below truncation_threshold.
+    fidelity is the product of the weights kept by all splits.
+    """
+
+    def __init__(self, num_qubits, dtype=np.complex128, max_bond_dimension=None,
+                 truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD):
+        super(MatrixProductState, self).__init__()
+        zero = np.zeros((1, 2, 1), dtype=dtype)
+        zero[0, 0, 0] = 1
+        self.tensors = [zero.copy() for _ in range(num_qubits)]
+        self.layout = list(range(num_qubits))
+        self.site = list(range(num_qubits))
+        self.center = 0
+        self.max_bond_dimension = max_bond_dimension
+        self.truncation_threshold = truncation_threshold
+        self.fidelity = 1.0
+
+    @property
+    def num_qubits(self):
+        return len(self.tensors)
+
+    @property
+    def bond_dimension(self):
+        return max(tensor.shape[2] for tensor in self.tensors)
+
+    def copy(self):
+        state = MatrixProductState.__new__(MatrixProductState)
+        state.__dict__.update(self.__dict__)
+        state.tensors = list(self.tensors)
+        state.layout = list(self.layout)
+        state.site = list(self.site)
+        return state
+
+    def apply(self, op_type, qargs, params):
+        """Applies a single quantumcat operation."""
+        if op_type not in matrices.GATES:
+            raise CircuitError(ErrorMessages.OPERATION_NOT_SUPPORTED)
+        mat = matrices.unitary(op_type, params, len(qargs)).astype(self.tensors[0].dtype, copy=False)
+        if len(qargs) == 1:
+            # a unitary on one site keeps the canonical form
+            site = self.site[qargs[0]]
+            self.tensors[site] = np.einsum('ba,lar->lbr', mat, self.tensors[site])
+            return
+        start = self.gather(qargs)
+        k = len(qargs)
+        # axis m of the reshaped matrix is qargs[k - 1 - m], the matrix being little-endian
+        axes = [k - 1 - qargs.index(self.layout[start + i]) for i in range(k)]
+        theta = self.contract(start, k)
+        theta = np.tensordot(mat.reshape((2,) * (2 * k)), theta, axes=([k + m for m in axes], list(range(1, k + 1))))
+        self.split(np.transpose(theta, [k] + axes + [k + 1]), start)
+
+    def gather(self, qargs):
+        """Swaps the qubits of qargs onto consecutive sites and returns the first one."""
+        sites = sorted(self.site[qubit] for qubit in qargs)
+        start = sites[0]
+        for offset, site in enumerate(sites[1:], 1):
+            for left in range(site - 1, start + offset - 1, -1):
+                self.swap(left)
+        return start
+
+    def swap(self, left):
+        """Exchanges the qubits of sites left and left + 1."""
+        self.split(np.transpose(self.contract(left, 2), (0, 2, 1, 3)), left)
+        self.layout[left], self.layout[left + 1] = self.layout[left + 1], self.layout[left]
+        self.site[self.layout[left]] = left
+        self.site[self.layout[left + 1]] = left + 1
+
+    def contract(self, start, k):
+        """Moves the center into sites start..start + k - 1 and returns their contracted tensor."""
+        self.move_center(min(max(self.center, start), start + k - 1))
+        theta = self.tensors[start]
+        for site in range(start + 1, start + k):
+            theta = np.tensordot(theta, self.tensors[site], axes=(-1, 0))
+        return theta
+
+    def split(self, theta, start):
+        """Splits a (left bond, 2, ..., 2, right bond) tensor back into sites from start on,
+        leaving the center on the last one."""
+        k = theta.ndim - 2
+        for site in range(start, start + k - 1):
+            left = theta.shape[0]
+            u, s, vh = np.linalg.svd(theta.reshape(left * 2, -1), full_matrices=False)
+            keep = self.truncate(s)
+            self.tensors[site] = u[:, :keep].reshape(left, 2, keep)
+            theta = (s[:keep, None] * vh[:keep]).reshape((keep,) + theta.shape[2:])
+        self.tensors[start + k - 1] = theta
+        self.center = start + k - 1
+
+    def truncate(self, s):
+        """Returns the number of singular values to keep, scaling them to keep the norm."""
+        weights = s ** 2
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        keep = int(np.searchsorted(cumulative, total * (1 - self.truncation_threshold))) + 1
+        if self.max_bond_dimension is not None:
+            keep = min(keep, self.max_bond_dimension)
+        keep = max(1, min(keep, len(s)))
+        kept = cumulative[keep - 1]
+        if kept < total:
+            self.fidelity *= float(kept / total)
+            s[:keep] *= np.sqrt(total / kept)
+        return keep
+
+    def move_center(self, site):
+        while self.center < site:
+            tensor = self.tensors[self.center]
+            q, r = np.linalg.qr(tensor.reshape(-1, tensor.shape[2]))
+            self.tensors[self.center] = q.reshape(tensor.shape[0], 2, -1)
+            self.tensors[self.center + 1] = np.tensordot(r, self.tensors[self.center + 1], axes=(1, 0))
+            self.center += 1
+        while self.center > site:
+            tensor = self.tensors[self.center]
+            q, r = np.linalg.qr(tensor.reshape(tensor.shape[0], -1).T)
+            self.tensors[self.center] = q.T.reshape(-1, 2, tensor.shape[2])
+            self.tensors[self.center - 1] = np.tensordot(self.tensors[self.center - 1], r.T, axes=(2, 0))
+            self.center -= 1
+
+    def measure(self, qubit, rng):
+        """Measures qubit, collapsing the state, and returns the outcome."""
+        site = self.site[qubit]
+        self.move_center(site)
+        tensor = self.tensors[site]
+        prob_one = float(np.sum(np.abs(tensor[:, 1]) ** 2) / np.sum(np.abs(tensor) ** 2))
+        bit = int(rng.random() < prob_one)
+        tensor = tensor.copy()
+        tensor[:, 1 - bit] = 0
+        self.tensors[site] = tensor / np.sqrt(prob_one if bit else 1 - prob_one)
+        return bit
+
+    def sample(self, repetitions, rng):
+        """Draws all shots at once, site after site from the conditional probabilities.
+        :return: (repetitions, num_qubits) uint8 array of 0 and 1, column q holding qubit q
+        """
+        self.move_center(0)
+        bits = np.zeros((repetitions, self.num_qubits), dtype=np.uint8)
+        shots = np.arange(repetitions)
+        # the left environment of each shot, the sites on the right being right-canonical
+        environment = np.ones((repetitions, 1), dtype=self.tensors[0].dtype)
+        for site, tensor in enumerate(self.tensors):
+            branches = np.einsum('sl,lbr->sbr', environment, tensor)
+            probabilities = np.sum(np.abs(branches) ** 2, axis=2)
+            outcome = rng.random(repetitions) * probabilities.sum(axis=1) < probabilities[:, 1]
+            environment = branches[shots, outcome.astype(np.intp)]
+            environment /= np.sqrt(probabilities[shots, outcome.astype(np.intp)])[:, None]
+            bits[:, self.layout[site]] = outcome
+        return bits
+
+    def statevector(self):
+        """Returns the little-endian statevector, qubit q being bit q of the index."""
+        theta = self.contract(0, self.num_qubits).reshape((2,) * self.num_qubits)
+        return np.transpose(theta, [self.site[qubit] for qubit in reversed(range(self.num_qubits))]).reshape(-1)
+
+
+class MPSSimulator:
+    """Matrix product state simulator that runs quantumcat operations directly.
+
+    Memory and time grow with the bond dimension, the entanglement across each
+    cut of the qubit chain, rather than exponentially with the number of qubits,
+    so wide circuits with little entanglement fit on a single node.
+    fidelity and bond_dimension describe the last simulated state.
+    """
+
+    def __init__(self, seed=None, precision=constants.PRECISION_DOUBLE, max_bond_dimension=None,
+                 truncation_threshold=constants.DEFAULT_TRUNCATION_THRESHOLD):
+        super(MPSSimulator, self).__init__()
+        self.rng = np.random.default_rng(seed)
+        self.dtype = precision_dtype(precision)
+        self.max_bond_dimension = max_bond_dimension
+        self.truncation_threshold = truncation_threshold
+        self.fidelity = 1.0
+        self.bond_dimension = 1
+
+    def state(self, operations, num_qubits):
+        """Returns the MatrixProductState of the circuit. Measurements are ignored."""
+        state = MatrixProductState(num_qubits, self.dtype, self.max_bond_dimension, self.truncation_threshold)
+        for op_type, qargs, params in operations:
+            if op_type not in (OpType.measure, OpType.measure_all):
+                state.apply(op_type, qargs, params)
+        self.report(state)
+        return state
+
+    def report(self, state):
+        self.fidelity = state.fidelity
+        self.bond_dimension = state.bond_dimension
+
+    def statevector(self, operations, num_qubits):
+        """Returns the final statevector of the circuit, for circuits small enough to hold it."""
+        return self.state(operations, num_qubits).statevector()
+
+    def run_bits(self, operations, num_qubits, num_cbits, repetitions):
+        """Samples the circuit.
+        :return: (bits, register_widths) where bits is a (repetitions, bits) uint8 array of 0 and 1,
+                 column j holding classical bit j, and register_widths those of the counts
+        """
+        operations = list(operations)
+        measured, measure_all, cbits_width, register_widths = \
+            StatevectorSimulator.registers(operations, num_qubits, num_cbits)
+        bits = np.zeros((repetitions, (num_qubits if measure_all else 0) + cbits_width), dtype=np.uint8)
+        if StatevectorSimulator.measurements_are_terminal(operations):
+            qubit_bits = self.state(operations, num_qubits).sample(repetitions, self.rng)
+            for qubit in set(measured):
+                bits[:, qubit] = qubit_bits[:, qubit]
+            if measure_all:
+                bits[:, cbits_width:] = qubit_bits
+            return bits, register_widths
+
+        first = next(index for index, (op_type, _, _) in enumerate(operations)
+                     if op_type in (OpType.measure, OpType.measure_all))
+        prefix = self.state(operations[:first], num_qubits)
+        fidelity = 1.0
+        for shot in range(repetitions):
+            state = prefix.copy()
+            for op_type, qargs, params in operations[first:]:
+                if op_type == OpType.measure:
+                    bits[shot, qargs[0]] = state.measure(qargs[0], self.rng)
+                elif op_type == OpType.measure_all:
+                    for qubit in range(num_qubits):
+                        bits[shot, cbits_width + qubit] = state.measure(qubit, self.rng)
+                else:
+                    state.apply(op_type, qargs, params)
+            fidelity = min(fidelity, state.fidelity)
+            self.bond_dimension = max(self.bond_dimension, state.bond_dimension)
+        self.fidelity = fidelity
+        return bits, register_widths
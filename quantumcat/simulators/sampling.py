@@ -0,0 +1,248 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Vectorized shot sampling and integer-keyed counts.
+
+All shots are drawn at once from a probability vector, and counts are kept as
+NumPy arrays of integer outcomes until bitstring keys are asked for.
+
+Per-shot results are packed uint8 arrays of shape (shots, ceil(bits / 8)),
+where bit j of a shot is classical bit j, i.e. the j-th character from the
+right of a qiskit counts key, stored little-endian across the bytes.
+
+Outcomes of up to 63 bits are int64. Wider outcomes, e.g. of the stabilizer
+and matrix product state simulators, are exact Python ints in object arrays.
+"""
+
+import numpy as np
+from quantumcat.utils import constants
+
+# widest outcome held in an int64
+MAX_INT_BITS = 63
+
+
+def outcome_dtype(num_bits):
+    """Returns int64 for outcomes of up to MAX_INT_BITS bits and object, i.e. Python ints, above."""
+    return np.int64 if num_bits <= MAX_INT_BITS else object
+
+
+class Counts:
+    """Measurement counts with integer outcomes.
+
+    outcomes[i] was measured counts[i] times. Outcomes read as the bits of the
+    classical registers written left to right, as in qiskit's counts keys, with
+    register_widths giving the width of each register in that order. Outcomes
+    wider than MAX_INT_BITS are Python ints.
+    """
+
+    def __init__(self, outcomes, counts, register_widths):
+        super(Counts, self).__init__()
+        self.register_widths = tuple(register_widths)
+        self.outcomes = np.asarray(outcomes, dtype=outcome_dtype(self.num_bits))
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    @property
+    def num_bits(self):
+        return sum(self.register_widths)
+
+    @property
+    def shots(self):
+        return int(self.counts.sum())
+
+    def to_dict(self):
+        """Returns qiskit style counts, a dict of bitstring to count."""
+        results = {}
+        for outcome, count in zip(self.outcomes.tolist(), self.counts.tolist()):
+            results[self.bitstring(outcome)] = count
+        return results
+
+    def bitstring(self, outcome):
+        bits = format(outcome, '0' + str(self.num_bits) + 'b')
+        if len(self.register_widths) < 2:
+            return bits
+        registers = []
+        start = 0
+        for width in self.register_widths:
+            registers.append(bits[start:start + width])
+            start += width
+        return ' '.join(registers)
+
+    def to_shots(self, rng=None):
+        """Returns the shots as a packed uint8 array, in random order.
+        :param rng: numpy Generator used to shuffle the shots
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        values = rng.permutation(np.repeat(self.outcomes, self.counts))
+        if self.outcomes.dtype == object:
+            num_bytes = (self.num_bits + 7) // 8
+            packed = b''.join(value.to_bytes(num_bytes, 'little') for value in values.tolist())
+            return np.frombuffer(packed, dtype=np.uint8).reshape(len(values), num_bytes)
+        return pack_bits((values[:, None] >> np.arange(self.num_bits, dtype=np.int64)) & 1)
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return isinstance(other, Counts) and self.to_dict() == other.to_dict() \
+            and self.register_widths == other.register_widths
+
+    def __repr__(self):
+        return 'Counts({})'.format(self.to_dict())
+
+    @classmethod
+    def from_values(cls, values, register_widths, weights=None):
+        """Counts integer outcomes, each seen once or weights[i] times."""
+        values = np.asarray(values, dtype=outcome_dtype(sum(register_widths)))
+        if weights is None:
+            outcomes, counts = np.unique(values, return_counts=True)
+        else:
+            outcomes, inverse = np.unique(values, return_inverse=True)
+            counts = np.bincount(inverse, weights=weights, minlength=len(outcomes))
+        return cls(outcomes, counts, register_widths)
+
+    @classmethod
+    def from_bits(cls, bits, register_widths=None):
+        """Counts shots given as a (shots, bits) array where column j holds bit j of the outcome."""
+        register_widths = [np.shape(bits)[1]] if register_widths is None else register_widths
+        return cls.from_shots(pack_bits(bits), register_widths)
+
+    @classmethod
+    def from_shots(cls, shots, register_widths):
+        """Counts the shots of a packed uint8 array."""
+        if outcome_dtype(sum(register_widths)) == object:
+            values = [int.from_bytes(shot.tobytes(), 'little') for shot in np.asarray(shots, dtype=np.uint8)]
+            return cls.from_values(np.array(values, dtype=object), register_widths)
+        return cls.from_values(shot_values(shots).astype(np.int64), register_widths)
+
+    @classmethod
+    def from_dict(cls, counts):
+        """Converts qiskit style counts, a dict of bitstring to count."""
+        if len(counts) == 0:
+            return cls([], [], [])
+        register_widths = [len(register) for register in next(iter(counts)).split(' ')]
+        outcomes = [int(key.replace(' ', ''), 2) for key in counts]
+        order = np.argsort(outcomes)
+        return cls(np.asarray(outcomes)[order], np.asarray(list(counts.values()))[order], register_widths)
+
+
+def sample(probabilities, repetitions, rng=None):
+    """Draws all shots at once from a probability vector.
+    :param probabilities: probability of each outcome
+    :param repetitions: number of shots
+    :param rng: numpy Generator, a new unseeded one by default
+    :return: (outcomes, counts) arrays of the outcomes drawn at least once
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    probabilities = np.asarray(probabilities, dtype=float)
+    counts = rng.multinomial(repetitions, probabilities / probabilities.sum())
+    outcomes = np.flatnonzero(counts)
+    return outcomes, counts[outcomes]
+
+
+def marginal_probabilities(state, qubits):
+    """Returns the probabilities of the outcomes of qubits, bit j of an outcome being qubits[j].
+    :param state: statevector, flat or as a tensor with qubit q on axis (num_qubits - 1 - q)
+    :param qubits: measured qubits
+    """
+    num_qubits = state.ndim if state.ndim > 1 else int(np.log2(state.size))
+    probabilities = (np.abs(state) ** 2).reshape((2,) * num_qubits)
+    keep = [num_qubits - 1 - qubit for qubit in qubits]
+    drop = tuple(axis for axis in range(num_qubits) if axis not in keep)
+    if drop:
+        probabilities = probabilities.sum(axis=drop)
+    # order the remaining axes so that qubits[0] is the least significant bit
+    remaining = sorted(keep)
+    return np.transpose(probabilities, [remaining.index(axis) for axis in reversed(keep)]).reshape(-1)
+
+
+def scatter_bits(outcomes, positions):
+    """Moves bit j of every outcome to bit positions[j]."""
+    outcomes = np.asarray(outcomes, dtype=np.int64)
+    values = np.zeros_like(outcomes)
+    for bit, position in enumerate(positions):
+        values |= ((outcomes >> bit) & 1) << position
+    return values
+
+
+def place_bits(columns, positions, width):
+    """Returns the (shots, width) array of 0 and 1 with column j of columns at column positions[j]
+    and 0 elsewhere, e.g. to lay the measured qubits of another provider out as classical bits."""
+    columns = np.asarray(columns, dtype=np.uint8)
+    bits = np.zeros((columns.shape[0], width), dtype=np.uint8)
+    bits[:, list(positions)] = columns
+    return bits
+
+
+def pack_bits(bits):
+    """Packs a (shots, bits) array of 0 and 1, column j holding bit j, into a uint8 array."""
+    return np.packbits(np.asarray(bits, dtype=np.uint8), axis=1, bitorder='little')
+
+
+def unpack_bits(shots, num_bits):
+    """Returns the (shots, num_bits) uint8 array of 0 and 1 of packed shots."""
+    return np.unpackbits(shots, axis=1, count=num_bits, bitorder='little')
+
+
+def shot_values(shots):
+    """Returns the outcome of each packed shot as a uint64 array. At most 64 bits are supported."""
+    shots = np.asarray(shots, dtype=np.uint8)
+    padded = np.zeros((shots.shape[0], 8), dtype=np.uint8)
+    padded[:, :shots.shape[1]] = shots
+    return padded.view('<u8').reshape(-1)
+
+
+def bits_from_strings(bitstrings):
+    """Converts qiskit style bitstrings, one per shot, to a (shots, bits) array, column j holding bit j."""
+    chars = np.char.replace(np.asarray(bitstrings, dtype=str), ' ', '').astype(bytes)
+    bits = np.frombuffer(chars.tobytes(), dtype=np.uint8).reshape(len(chars), -1) - ord('0')
+    return bits[:, ::-1]
+
+
+def counts_from_bits(bits, register_widths):
+    """Returns qiskit style counts of shots given as a (shots, bits) array, column j holding bit j.
+    Unlike Counts, any number of bits is supported."""
+    rows, counts = np.unique(pack_bits(bits), axis=0, return_counts=True)
+    chars = unpack_bits(rows, sum(register_widths))[:, ::-1] + np.uint8(ord('0'))
+    stops = np.cumsum(register_widths).tolist()
+    starts = [0] + stops[:-1]
+    results = {}
+    for row, count in zip(chars, counts.tolist()):
+        bitstring = row.tobytes().decode()
+        if len(register_widths) > 1:
+            bitstring = ' '.join(bitstring[start:stop] for start, stop in zip(starts, stops))
+        results[bitstring] = count
+    return results
+
+
+def format_bits(bits, register_widths, counts_format):
+    """Converts shots given as a (shots, bits) array, column j holding bit j, to counts_format."""
+    if counts_format == constants.COUNTS_SHOTS:
+        return pack_bits(bits)
+    if counts_format == constants.COUNTS_ARRAY:
+        return Counts.from_bits(bits, register_widths)
+    return counts_from_bits(bits, register_widths)
+
+
+def format_counts(result, counts_format, rng=None):
+    """Converts a counts dict or Counts result to counts_format.
+    :param counts_format: COUNTS_DICT, COUNTS_ARRAY for Counts or COUNTS_SHOTS for packed shots
+    :return: result in counts_format, or unchanged when it is not counts, e.g. a statevector
+    """
+    if isinstance(result, dict) and counts_format != constants.COUNTS_DICT:
+        result = Counts.from_dict(result)
+    if isinstance(result, Counts):
+        if counts_format == constants.COUNTS_DICT:
+            return result.to_dict()
+        if counts_format == constants.COUNTS_SHOTS:
+            return result.to_shots(rng)
+    return result
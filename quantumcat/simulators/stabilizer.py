@@ -0,0 +1,260 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+from quantumcat.exceptions import CircuitError
+from quantumcat.simulators.statevector import StatevectorSimulator
+from quantumcat.utils import ErrorMessages
+
+# Operations the stabilizer simulator runs, i.e. Clifford gates and measurements
+CLIFFORD_OPS = frozenset([
+    OpType.i_gate, OpType.x_gate, OpType.y_gate, OpType.z_gate, OpType.h_gate, OpType.s_gate,
+    OpType.sdg_gate, OpType.cx_gate, OpType.cy_gate, OpType.cz_gate, OpType.swap_gate,
+    OpType.measure, OpType.measure_all,
+])
+
+
+def is_clifford(operations):
+    """Whether the Operations only hold Clifford gates and measurements."""
+    return operations.within(CLIFFORD_OPS)
+
+
+def words(num_bits):
+    return (num_bits + 63) // 64
+
+
+if hasattr(np, 'bitwise_count'):
+    def popcount(array):
+        """Returns the number of set bits of a uint64 array along its last axis."""
+        return np.bitwise_count(array).sum(axis=-1, dtype=np.int64)
+else:
+    def popcount(array):
+        """Returns the number of set bits of a uint64 array along its last axis."""
+        array = array - ((array >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        array = (array & np.uint64(0x3333333333333333)) + ((array >> np.uint64(2)) & np.uint64(0x3333333333333333))
+        array = (array + (array >> np.uint64(4))) & np.uint64(0x0f0f0f0f0f0f0f0f)
+        return ((array * np.uint64(0x0101010101010101)) >> np.uint64(56)).sum(axis=-1, dtype=np.int64)
+
+
+class Tableau:
+    """Stabilizer tableau of Aaronson and Gottesman (CHP).
+
+    Generator g of the 2n generators is the Pauli product with x[g] and z[g] as
+    its X and Z bits, bit q of the uint64 words being qubit q. Generators
+    0..n-1 are the destabilizers and n..2n-1 the stabilizers. The sign of a
+    generator is kept as an affine function of the random measurement outcomes:
+    bit 0 of r[g] is the constant term and bit k says whether random outcome k
+    flips it. Gates are the methods named after their OpType.
+    """
+
+    def __init__(self, num_qubits, num_random_bits):
+        super(Tableau, self).__init__()
+        n = num_qubits
+        self.num_qubits = n
+        self.x = np.zeros((2 * n, words(n)), dtype=np.uint64)
+        self.z = np.zeros((2 * n, words(n)), dtype=np.uint64)
+        qubits = np.arange(n)
+        self.x[qubits, qubits >> 6] = np.uint64(1) << (qubits & 63).astype(np.uint64)
+        self.z[n + qubits, qubits >> 6] = np.uint64(1) << (qubits & 63).astype(np.uint64)
+        self.r = np.zeros((2 * n, words(1 + num_random_bits)), dtype='<u8')
+        self.random_bits = 0
+
+    @staticmethod
+    def column(bits, qubit):
+        """Returns (word index, shift, bit of qubit of every generator as 0 or 1)."""
+        word, shift = qubit >> 6, np.uint64(qubit & 63)
+        return word, shift, (bits[:, word] >> shift) & np.uint64(1)
+
+    def flip_signs(self, flips):
+        self.r[:, 0] ^= flips
+
+    def apply(self, op_type, qargs):
+        getattr(self, op_type.name)(*qargs)
+
+    def i_gate(self, a):
+        pass
+
+    def h_gate(self, a):
+        word, shift, xa = self.column(self.x, a)
+        _, _, za = self.column(self.z, a)
+        self.flip_signs(xa & za)
+        swapped = (xa ^ za) << shift
+        self.x[:, word] ^= swapped
+        self.z[:, word] ^= swapped
+
+    def s_gate(self, a):
+        word, shift, xa = self.column(self.x, a)
+        _, _, za = self.column(self.z, a)
+        self.flip_signs(xa & za)
+        self.z[:, word] ^= xa << shift
+
+    def sdg_gate(self, a):
+        word, shift, xa = self.column(self.x, a)
+        _, _, za = self.column(self.z, a)
+        self.flip_signs(xa & (za ^ np.uint64(1)))
+        self.z[:, word] ^= xa << shift
+
+    def x_gate(self, a):
+        self.flip_signs(self.column(self.z, a)[2])
+
+    def y_gate(self, a):
+        self.flip_signs(self.column(self.x, a)[2] ^ self.column(self.z, a)[2])
+
+    def z_gate(self, a):
+        self.flip_signs(self.column(self.x, a)[2])
+
+    def cx_gate(self, a, b):
+        word_a, shift_a, xa = self.column(self.x, a)
+        word_b, shift_b, xb = self.column(self.x, b)
+        _, _, za = self.column(self.z, a)
+        _, _, zb = self.column(self.z, b)
+        self.flip_signs(xa & zb & (xb ^ za ^ np.uint64(1)))
+        self.x[:, word_b] ^= xa << shift_b
+        self.z[:, word_a] ^= zb << shift_a
+
+    def cz_gate(self, a, b):
+        word_a, shift_a, xa = self.column(self.x, a)
+        word_b, shift_b, xb = self.column(self.x, b)
+        _, _, za = self.column(self.z, a)
+        _, _, zb = self.column(self.z, b)
+        self.flip_signs(xa & xb & (za ^ zb))
+        self.z[:, word_a] ^= xb << shift_a
+        self.z[:, word_b] ^= xa << shift_b
+
+    def cy_gate(self, a, b):
+        self.sdg_gate(b)
+        self.cx_gate(a, b)
+        self.s_gate(b)
+
+    def swap_gate(self, a, b):
+        for bits in (self.x, self.z):
+            word_a, shift_a, bits_a = self.column(bits, a)
+            word_b, shift_b, bits_b = self.column(bits, b)
+            bits[:, word_a] ^= (bits_a ^ bits_b) << shift_a
+            bits[:, word_b] ^= (bits_a ^ bits_b) << shift_b
+
+    def measure(self, a):
+        """Measures qubit a in the Z basis.
+        :return: the outcome as an affine function of the random outcomes, packed like the rows of r
+        """
+        n = self.num_qubits
+        word, shift, xa = self.column(self.x, a)
+        anticommuting = np.flatnonzero(xa[n:])
+        if anticommuting.size == 0:
+            # the outcome is the sign of the product of the stabilizers that give Z_a
+            rows = n + np.flatnonzero(xa[:n])
+            x, z = self.x[rows], self.z[rows]
+            # the product is accumulated generator after generator, starting from the identity
+            prefix_x = np.bitwise_xor.accumulate(x, axis=0)
+            prefix_z = np.bitwise_xor.accumulate(z, axis=0)
+            phase = self.phase_exponents(x[1:], z[1:], prefix_x[:-1], prefix_z[:-1]).sum()
+            outcome = np.bitwise_xor.reduce(self.r[rows], axis=0)
+            outcome[0] ^= np.uint64(phase % 4 == 2)
+            return outcome
+
+        p = n + anticommuting[0]
+        rows = np.flatnonzero(xa)
+        self.rowsum(rows[rows != p], p)
+        self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+        self.x[p] = 0
+        self.z[p] = 0
+        self.z[p, word] = np.uint64(1) << shift
+        self.random_bits += 1
+        self.r[p] = 0
+        self.r[p, self.random_bits >> 6] = np.uint64(1) << np.uint64(self.random_bits & 63)
+        return self.r[p].copy()
+
+    def rowsum(self, rows, p):
+        """Multiplies each generator of rows by generator p."""
+        x, z = self.x[rows], self.z[rows]
+        phase = self.phase_exponents(self.x[p], self.z[p], x, z)
+        self.r[rows] ^= self.r[p]
+        self.r[rows, 0] ^= (phase % 4 == 2).astype(np.uint64)
+        self.x[rows] = x ^ self.x[p]
+        self.z[rows] = z ^ self.z[p]
+
+    @staticmethod
+    def phase_exponents(x1, z1, x2, z2):
+        """Returns the power of i picked up when Pauli products (x1, z1) multiply (x2, z2), summed over the qubits.
+        Qubits where the Paulis anticommute contribute 1 in the cyclic order XY, YZ, ZX and -1 otherwise."""
+        x1z2 = x1 & z2
+        anticommuting = x1z2 ^ (x2 & z1)
+        minus = anticommuting & (x1 ^ x2 ^ z1 ^ z2 ^ x1z2)
+        return popcount(anticommuting) - 2 * popcount(minus)
+
+
+class StabilizerSimulator:
+    """Stabilizer simulator for circuits of Clifford gates and measurements.
+
+    Memory grows with the square of the number of qubits, and each gate and
+    measurement takes polynomial time, so thousands of qubits can be sampled.
+    The circuit is simulated once: every measured bit is an affine function of
+    the random measurement outcomes, and all shots are drawn from those
+    functions at once.
+    """
+
+    def __init__(self, seed=None):
+        super(StabilizerSimulator, self).__init__()
+        self.rng = np.random.default_rng(seed)
+
+    def run_bits(self, operations, num_qubits, num_cbits, repetitions):
+        """Samples the circuit.
+        :param operations: Operations of the circuit, Clifford gates and measurements only
+        :param num_qubits: number of qubits of the circuit
+        :param num_cbits: number of classical bits of the circuit
+        :param repetitions: number of shots
+        :return: (bits, register_widths) where bits is a (repetitions, bits) uint8 array of 0 and 1,
+                 column j holding classical bit j, and register_widths those of the counts
+        """
+        if not is_clifford(operations):
+            names = sorted({op_type.name for op_type, _, _ in operations if op_type not in CLIFFORD_OPS})
+            raise CircuitError(ErrorMessages.OPERATION_NOT_CLIFFORD, ', '.join(names))
+        operations = list(operations)
+        measured, measure_all, cbits_width, register_widths = \
+            StatevectorSimulator.registers(operations, num_qubits, num_cbits)
+        # a circuit without measurements measures all qubits at the end
+        final_measure = not measured and all(op_type != OpType.measure_all for op_type, _, _ in operations)
+        num_measurements = len(measured) + num_qubits * (final_measure + sum(
+            op_type == OpType.measure_all for op_type, _, _ in operations))
+        tableau = Tableau(num_qubits, num_measurements)
+
+        # affine function of the random outcomes giving each classical bit, measure_all bits last
+        width = (num_qubits if measure_all else 0) + cbits_width
+        functions = np.zeros((width, words(1 + num_measurements)), dtype='<u8')
+        for op_type, qargs, params in operations:
+            if op_type == OpType.measure:
+                outcome = tableau.measure(qargs[0])
+                if qargs[0] < cbits_width:
+                    functions[qargs[0]] = outcome
+            elif op_type == OpType.measure_all:
+                for qubit in range(num_qubits):
+                    functions[cbits_width + qubit] = tableau.measure(qubit)
+            else:
+                tableau.apply(op_type, qargs)
+        if final_measure:
+            for qubit in range(num_qubits):
+                functions[cbits_width + qubit] = tableau.measure(qubit)
+        functions = np.unpackbits(functions.view(np.uint8), axis=1, count=1 + tableau.random_bits, bitorder='little')
+        return self.sample(functions, repetitions), register_widths
+
+    def sample(self, functions, repetitions):
+        """Draws the random outcomes of all shots and evaluates the affine functions of the bits.
+        :param functions: (bits, 1 + random outcomes) array of 0 and 1, column 0 holding the constant terms
+        """
+        random_bits = functions.shape[1] - 1
+        outcomes = self.rng.integers(0, 2, size=(repetitions, random_bits), dtype=np.uint8)
+        # float32 products are exact below 2**24 random outcomes and use BLAS
+        flips = outcomes.astype(np.float32) @ functions[:, 1:].T.astype(np.float32)
+        return ((flips.astype(np.int64) + functions[:, 0]) & 1).astype(np.uint8)
@@ -0,0 +1,229 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from quantumcat.circuit.op_type import OpType
+from quantumcat.exceptions import CircuitError
+from quantumcat.gates import matrices
+from quantumcat.simulators import sampling
+from quantumcat.utils import ErrorMessages, constants
+
+DTYPES = {constants.PRECISION_SINGLE: np.complex64, constants.PRECISION_DOUBLE: np.complex128}
+
+
+def precision_dtype(precision):
+    """Returns the complex dtype of PRECISION_SINGLE or PRECISION_DOUBLE."""
+    if precision not in DTYPES:
+        raise CircuitError(ErrorMessages.PRECISION_NOT_SUPPORTED, str(precision))
+    return DTYPES[precision]
+
+
+def as_statevector(state, precision=constants.PRECISION_DOUBLE):
+    """Returns state as a flat, C-contiguous array of the dtype of precision.
+    The array is returned as is when it already is one, and copied otherwise."""
+    return np.ascontiguousarray(np.asarray(state).reshape(-1), dtype=precision_dtype(precision))
+
+
+class StatevectorSimulator:
+    """Statevector simulator that runs quantumcat operations directly with NumPy.
+
+    The state is kept as a tensor with one axis of size 2 per qubit. Qubit q is
+    stored on axis (num_qubits - 1 - q) so the flattened statevector and the
+    counts use the same little-endian ordering as qiskit.
+    """
+
+    def __init__(self, seed=None, precision=constants.PRECISION_DOUBLE):
+        super(StatevectorSimulator, self).__init__()
+        self.rng = np.random.default_rng(seed)
+        self.dtype = precision_dtype(precision)
+
+    def statevector(self, operations, num_qubits):
+        """Returns the final statevector of the circuit. Measurements are ignored.
+        :param operations: Operations of the circuit
+        :param num_qubits: number of qubits of the circuit
+        :return: complex numpy array of size 2**num_qubits, a view of the simulated state
+        """
+        state = self.initial_state(num_qubits)
+        for op_type, qargs, params in operations:
+            if op_type not in (OpType.measure, OpType.measure_all):
+                state = self.apply(state, op_type, qargs, params)
+        return state.reshape(-1)
+
+    def run(self, operations, num_qubits, num_cbits, repetitions):
+        """Samples the circuit and returns qiskit style counts.
+        :param operations: Operations of the circuit
+        :param num_qubits: number of qubits of the circuit
+        :param num_cbits: number of classical bits of the circuit
+        :param repetitions: number of shots
+        :return: dict of bitstring to count
+        """
+        return self.run_counts(operations, num_qubits, num_cbits, repetitions).to_dict()
+
+    def run_counts(self, operations, num_qubits, num_cbits, repetitions):
+        """Samples the circuit and returns the counts with integer outcomes.
+        :return: Counts
+        """
+        operations = list(operations)
+        if self.measurements_are_terminal(operations):
+            state = self.initial_state(num_qubits)
+            for op_type, qargs, params in operations:
+                if op_type not in (OpType.measure, OpType.measure_all):
+                    state = self.apply(state, op_type, qargs, params)
+            return self.sample_counts(state, operations, num_qubits, num_cbits, repetitions)
+
+        _, measure_all, cbits_width, register_widths = self.registers(operations, num_qubits, num_cbits)
+        return self.run_trajectories(operations, num_qubits, cbits_width, measure_all, repetitions,
+                                     register_widths)
+
+    def sample_counts(self, state, operations, num_qubits, num_cbits, repetitions):
+        """Samples the measurements of a circuit whose measurements are all terminal from its
+        final statevector, e.g. a statevector computed earlier for a different number of shots.
+        :return: Counts
+        """
+        measured, measure_all, cbits_width, register_widths = self.registers(operations, num_qubits, num_cbits)
+        qubits = list(range(num_qubits)) if measure_all else sorted(set(measured))
+        cbits_mask = sum(1 << qubit for qubit in set(measured))
+        outcomes, counts = self.sample(state, qubits, repetitions)
+        values = sampling.scatter_bits(outcomes, qubits)
+        values = ((values << cbits_width) if measure_all else 0) | (values & cbits_mask)
+        return sampling.Counts.from_values(values, register_widths, counts)
+
+    @staticmethod
+    def registers(operations, num_qubits, num_cbits):
+        """Returns (measured qubits, whether all qubits are measured, width of the classical bits,
+        register_widths of the counts)."""
+        measured = [qargs[0] for op_type, qargs, _ in operations if op_type == OpType.measure]
+        measure_all = any(op_type == OpType.measure_all for op_type, _, _ in operations)
+        cbits_width = num_cbits if num_cbits > 0 else (num_qubits if len(measured) > 0 else 0)
+        if not measured and not measure_all:
+            measure_all = True
+        # measure_all adds a separate register, printed before the classical bits
+        register_widths = [width for width in ([num_qubits] if measure_all else []) + [cbits_width] if width > 0]
+        return measured, measure_all, cbits_width, register_widths
+
+    def run_trajectories(self, operations, num_qubits, cbits_width, measure_all, repetitions,
+                         register_widths):
+        """Simulates shot by shot, collapsing the state at every measurement.
+        Used when gates act on a qubit after it has been measured."""
+        first = next(index for index, (op_type, _, _) in enumerate(operations)
+                     if op_type in (OpType.measure, OpType.measure_all))
+        prefix = self.initial_state(num_qubits)
+        for op_type, qargs, params in operations[:first]:
+            prefix = self.apply(prefix, op_type, qargs, params)
+
+        values = np.zeros(repetitions, dtype=np.int64)
+        for shot in range(repetitions):
+            state = prefix.copy()
+            cbits_value = 0
+            meas_value = 0
+            for op_type, qargs, params in operations[first:]:
+                if op_type == OpType.measure:
+                    bit = self.collapse(state, qargs[0])
+                    cbits_value = (cbits_value & ~(1 << qargs[0])) | (bit << qargs[0])
+                elif op_type == OpType.measure_all:
+                    for qubit in range(num_qubits):
+                        meas_value |= self.collapse(state, qubit) << qubit
+                else:
+                    state = self.apply(state, op_type, qargs, params)
+            values[shot] = ((meas_value << cbits_width) if measure_all else 0) | cbits_value
+        return sampling.Counts.from_values(values, register_widths)
+
+    @staticmethod
+    def measurements_are_terminal(operations):
+        measured = set()
+        for index, (op_type, qargs, params) in enumerate(operations):
+            if op_type == OpType.measure:
+                measured.add(qargs[0])
+            elif op_type == OpType.measure_all:
+                return all(o in (OpType.measure, OpType.measure_all) for o, _, _ in operations[index:])
+            elif measured and not measured.isdisjoint(qargs):
+                return False
+        return True
+
+    def initial_state(self, num_qubits):
+        state = np.zeros((2,) * num_qubits, dtype=self.dtype)
+        state[(0,) * num_qubits] = 1
+        return state
+
+    def sample(self, state, qubits, repetitions):
+        """Draws all shots at once from the marginal distribution of qubits.
+        :return: (outcomes, counts) where bit j of an outcome is the value of qubits[j]
+        """
+        return sampling.sample(sampling.marginal_probabilities(state, qubits), repetitions, self.rng)
+
+    def collapse(self, state, qubit):
+        axis = state.ndim - 1 - qubit
+        one = self.index(state.ndim, {axis: 1})
+        zero = self.index(state.ndim, {axis: 0})
+        prob_one = float(np.sum(np.abs(state[one]) ** 2))
+        bit = int(self.rng.random() < prob_one)
+        state[zero if bit else one] = 0
+        state /= np.sqrt(prob_one if bit else 1 - prob_one)
+        return bit
+
+    @staticmethod
+    def index(ndim, fixed):
+        # the trailing Ellipsis keeps fully indexed tensors as writable 0-d views
+        return tuple(fixed.get(axis, slice(None)) for axis in range(ndim)) + (Ellipsis,)
+
+    def apply(self, state, op_type, qargs, params):
+        """Applies a single quantumcat operation to the state tensor."""
+        if op_type not in matrices.GATES:
+            raise CircuitError(ErrorMessages.OPERATION_NOT_SUPPORTED)
+        num_controls, base = matrices.gate(op_type, params, len(qargs))
+        base = base.astype(state.dtype, copy=False)
+        num_qubits = state.ndim
+        axes = [num_qubits - 1 - qubit for qubit in qargs]
+        control_axes, target_axes = axes[:num_controls], axes[num_controls:]
+
+        if control_axes:
+            view = state[self.index(num_qubits, {axis: 1 for axis in control_axes})]
+            target_axes = [axis - sum(1 for c in control_axes if c < axis) for axis in target_axes]
+        else:
+            view = state
+
+        if len(target_axes) == 1:
+            self.apply_single(view, base, target_axes[0])
+        else:
+            view[...] = self.apply_dense(view, base, target_axes)
+        return state
+
+    def apply_single(self, view, mat, axis):
+        """Applies a 2x2 unitary in place on one axis of the state tensor."""
+        zero = view[self.index(view.ndim, {axis: 0})]
+        one = view[self.index(view.ndim, {axis: 1})]
+        if mat[0, 1] == 0 and mat[1, 0] == 0:
+            if mat[0, 0] != 1:
+                zero *= mat[0, 0]
+            if mat[1, 1] != 1:
+                one *= mat[1, 1]
+        elif mat[0, 0] == 0 and mat[1, 1] == 0:
+            tmp = zero.copy()
+            zero[...] = mat[0, 1] * one
+            one[...] = mat[1, 0] * tmp
+        else:
+            tmp = zero.copy()
+            zero[...] = mat[0, 0] * zero + mat[0, 1] * one
+            one[...] = mat[1, 0] * tmp + mat[1, 1] * one
+
+    @staticmethod
+    def apply_dense(view, mat, axes):
+        """Applies a little-endian unitary on several axes of the state tensor.
+        axes[j] holds the j-th qubit of the operation."""
+        k = len(axes)
+        # the reshaped matrix lists its qubits most significant first
+        axes = list(reversed(axes))
+        tensor = mat.reshape((2,) * (2 * k))
+        result = np.tensordot(tensor, view, axes=(list(range(k, 2 * k)), axes))
+        return np.moveaxis(result, list(range(k)), axes)
@@ -16,6 +16,8 @@ DEVICE = 'device'
 SIMULATOR = 'simulator'
 DEFAULT_SIMULATOR = 'qasm_simulator'
 STATEVECTOR_SIMULATOR = 'statevector_simulator'
+STABILIZER_SIMULATOR = 'stabilizer_simulator'
+MPS_SIMULATOR = 'mps_simulator'
 PARAMS = 'params'
 BINARY = 'binary'
 DECIMAL = 'decimal'
@@ -25,3 +27,24 @@ UNIT16_TYPE = 'uint16'
 DEFAULT_REPETITIONS = 1024
 DEFAULT_COLOR = '#B3365B'
 COLORS = ['#B3365B', '#F46526', '#EFCBCA']
+RESULT = 'result'
+TIME = 'time'
+ERROR = 'error'
+BEFORE = 'before'
+AFTER = 'after'
+COUNTS_DICT = 'dict'
+COUNTS_ARRAY = 'array'
+COUNTS_SHOTS = 'shots'
+JOB_QUEUED = 'QUEUED'
+JOB_RUNNING = 'RUNNING'
+JOB_DONE = 'DONE'
+JOB_CANCELLED = 'CANCELLED'
+JOB_FAILED = 'FAILED'
+PRECISION_SINGLE = 'single'
+PRECISION_DOUBLE = 'double'
+DEFAULT_TRUNCATION_THRESHOLD = 1e-12
+BLOCK_NAME = 'block'
+GROVER_CIRCUIT = 'circuit'
+GROVER_ANALYTIC = 'analytic'
+XOR_CLAUSES = 'xor'
+CNF_CLAUSES = 'cnf'
@@ -19,4 +19,21 @@ API_DETAILS_NOT_PROVIDED = 'API Key is required for running on real quantum devi
 IONQ_API_DETAILS_NOT_PROVIDED = 'API Key is required for running on IonQ.'
 PASSWORD_LENGTH_INCORRECT = 'Password length should be between 5 and 20'
 OTP_LENGTH_INCORRECT = 'OTP length should be either 4 or 5'
-
+OPERATION_NOT_SUPPORTED = 'Operation is not supported by the native simulator.'
+PROVIDER_NOT_SUPPORTED = 'No backend is registered for provider'
+PROVIDER_TIMED_OUT = 'Provider did not finish before the timeout.'
+PARAMETERS_NOT_BOUND = 'No value is given for the parameters'
+PARAMETER_VALUES_MISMATCH = 'Number of parameter values does not match the number of circuit parameters.'
+JOB_TIMED_OUT = 'Job did not finish before the timeout.'
+JOB_CANCELLED = 'Job was cancelled.'
+JOB_FAILED = 'Job failed:'
+OPERATION_NOT_CLIFFORD = 'The stabilizer simulator only runs Clifford gates and measurements, not'
+PRECISION_NOT_SUPPORTED = 'Precision should be either single or double, not'
+BLOCK_NOT_UNITARY = 'Blocks only hold gates with numeric params, not'
+BLOCK_QUBITS_MISMATCH = 'Number of qubits does not match the number of block qubits.'
+GATE_NOT_INVERTIBLE = 'No inverse is known for'
+GROVER_MODE_NOT_SUPPORTED = 'Mode should be either circuit or analytic, not'
+CLAUSE_TYPE_NOT_SUPPORTED = 'Clause type should be either xor or cnf, not'
+ORACLES_NOT_GIVEN = 'Masks or seeds are required to run one case on many oracles, got the case'
+ORACLES_COUNT_MISMATCH = 'Number of masks or seeds does not match the number of cases.'
+MASK_OUT_OF_RANGE = 'Mask should be in [1, 2 ** num_qubits) for a balanced oracle and 0 or 1 for a constant one, not'
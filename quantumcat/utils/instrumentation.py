@@ -0,0 +1,140 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Timed spans and counters around the phases of an execution.
+
+The phases are CONVERT, BACKEND (constructing the provider simulator or
+device), SIMULATE and POSTPROCESS, nested in an EXECUTE span. Every finished
+span is passed to the registered hooks:
+
+    spans = []
+    instrumentation.add_hook(spans.append)
+
+or, for a block of code, recorded with
+
+    with instrumentation.recording() as spans:
+        circuit.execute(provider=providers.NATIVE_PROVIDER)
+
+Without hooks, span() returns a shared object that does nothing, so the
+instrumented code only pays for a function call and a list check.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+EXECUTE = 'execute'
+CONVERT = 'convert'
+BACKEND = 'backend'
+SIMULATE = 'simulate'
+POSTPROCESS = 'postprocess'
+
+_hooks = []
+_current = ContextVar('quantumcat_span', default=None)
+
+
+class Span:
+    """A timed phase. counters holds numbers such as gates, qubits, shots or statevector_bytes,
+    and parent is the span it ran in, if any."""
+
+    __slots__ = ('name', 'counters', 'parent', 'start', 'duration', 'token')
+
+    def __init__(self, name, counters):
+        self.name = name
+        self.counters = counters
+        self.parent = None
+        self.start = None
+        self.duration = None
+        self.token = None
+
+    def count(self, **counters):
+        self.counters.update(counters)
+
+    def count_result(self, result):
+        """Counts the outcomes of counts, or the bytes of a statevector or of packed shots."""
+        if isinstance(result, dict):
+            self.counters['outcomes'] = len(result)
+        elif hasattr(result, 'outcomes'):
+            self.counters['outcomes'] = len(result.outcomes)
+        elif hasattr(result, 'nbytes'):
+            key = 'statevector_bytes' if getattr(result.dtype, 'kind', None) == 'c' else 'bytes'
+            self.counters[key] = result.nbytes
+
+    def __enter__(self):
+        self.parent = _current.get()
+        self.token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.duration = time.perf_counter() - self.start
+        _current.reset(self.token)
+        for hook in list(_hooks):
+            hook(self)
+        return False
+
+    def __repr__(self):
+        return 'Span({}, {:.6f}s, {})'.format(self.name, self.duration or 0, self.counters)
+
+
+class NoSpan:
+    """Span used when instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def count(self, **counters):
+        pass
+
+    def count_result(self, result):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NO_SPAN = NoSpan()
+
+
+def span(name, **counters):
+    """Returns a context manager timing a phase, a no-op when no hook is registered."""
+    if not _hooks:
+        return NO_SPAN
+    return Span(name, counters)
+
+
+def enabled():
+    return bool(_hooks)
+
+
+def add_hook(hook):
+    """Registers hook(span), called with every finished span."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    _hooks.remove(hook)
+
+
+@contextmanager
+def recording():
+    """Collects the spans finished inside the with block into the list it yields."""
+    spans = []
+    add_hook(spans.append)
+    try:
+        yield spans
+    finally:
+        remove_hook(spans.append)
@@ -18,3 +18,4 @@ MICROSOFT_PROVIDER = 'MICROSOFT'
 AMAZON_PROVIDER = 'AMAZON'
 DEFAULT_PROVIDER = 'IBM'
 IONQ_PROVIDER = 'IonQ'
+NATIVE_PROVIDER = 'NATIVE'
@@ -0,0 +1,85 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import subprocess
+import sys
+import numpy as np
+import pytest
+import quantumcat
+from quantumcat import backends
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.exceptions import ProviderNotFoundError
+from quantumcat.utils import constants, providers
+
+
+def test_import_does_not_load_sdks():
+    code = (
+        "import sys\n"
+        "import quantumcat, quantumcat.circuit, quantumcat.algorithms, quantumcat.applications.generator\n"
+        "sdks = ('qiskit', 'cirq', 'braket')\n"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in sdks))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == '[]'
+
+
+def test_native_backend_is_loaded_on_use():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    assert circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10) == {'1': 10}
+    assert providers.NATIVE_PROVIDER in backends.loaded_backends()
+    assert backends.load_times()[providers.NATIVE_PROVIDER] >= 0
+
+
+def test_unknown_provider():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    with pytest.raises(ProviderNotFoundError):
+        circ.execute(provider='UNKNOWN')
+
+
+def test_execute_batch_keeps_order():
+    circuits = []
+    for value in range(4):
+        circ = QCircuit(2)
+        for qubit in range(2):
+            if value >> qubit & 1:
+                circ.x_gate(qubit)
+        circ.measure_all()
+        circuits.append(circ)
+    results = quantumcat.execute_batch(circuits, provider=providers.NATIVE_PROVIDER, repetitions=8)
+    assert results == [{'00': 8}, {'01': 8}, {'10': 8}, {'11': 8}]
+
+
+def out_of_order_circuit():
+    # measures qubit 3 before qubit 1 and never measures qubits 0 and 2
+    circ = QCircuit(4)
+    circ.x_gate(1)
+    circ.x_gate(3)
+    circ.h_gate(2)
+    circ.measure(3)
+    circ.measure(1)
+    return circ
+
+
+@pytest.mark.parametrize('provider, sdk', [(providers.GOOGLE_PROVIDER, 'cirq'), (providers.AMAZON_PROVIDER, 'braket')])
+def test_shots_are_laid_out_as_classical_bits(provider, sdk):
+    pytest.importorskip(sdk)
+    circ = out_of_order_circuit()
+    native = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=20, counts_format=constants.COUNTS_SHOTS)
+    shots = circ.execute(provider=provider, repetitions=20, counts_format=constants.COUNTS_SHOTS)
+    assert np.array_equal(shots, native)
+    assert circ.execute(provider=provider, repetitions=20, counts_format=constants.COUNTS_ARRAY) == \
+        circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=20, counts_format=constants.COUNTS_ARRAY)
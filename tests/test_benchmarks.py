@@ -0,0 +1,29 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from benchmarks import runner
+from benchmarks.bench_construction import build
+
+
+def test_run_stores_timings_and_compares():
+    results = runner.run('construction(num_gates=1000)', min_seconds=0, max_repeat=1, log=lambda line: None)
+    [(name, result)] = results['benchmarks'].items()
+    assert result['params'] == {'num_gates': 1000} and result['repeat'] == 1
+    slower = {'benchmarks': {name: dict(result, min=result['min'] * 2)}}
+    rows, regressions = runner.compare(results, slower)
+    assert rows[0][3] == 2 and regressions == [name]
+
+
+def test_build_mixes_families():
+    assert len(build(4, 100).operations) == 100
@@ -0,0 +1,104 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from quantumcat.circuit import QCircuit, OpType, Parameter
+from quantumcat.circuit.block import expand
+from quantumcat.exceptions import CircuitError
+from quantumcat.utils import providers, constants
+
+
+def bell():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    return circ
+
+
+def statevector(circ):
+    return circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR)
+
+
+def test_repeat_references_the_block():
+    step = QCircuit(3)
+    step.h_gate(0)
+    step.cx_gate(0, 1)
+    step.t_gate(2)
+    circ = step.repeat(1000)
+    assert len(circ.operations) == 1
+    assert circ.count_ops() == {OpType.h_gate: 1000, OpType.cx_gate: 1000, OpType.t_gate: 1000}
+    assert circ.depth() == 2000
+    assert len(expand(circ.operations)) == 3000
+    assert step.to_block() is step.to_block()
+
+
+def test_compose_maps_qubits():
+    circ = QCircuit(3)
+    circ.compose(bell(), [2, 0])
+    expected = QCircuit(3)
+    expected.h_gate(2)
+    expected.cx_gate(2, 0)
+    assert np.allclose(statevector(circ), statevector(expected))
+    with pytest.raises(CircuitError):
+        circ.compose(bell(), [0])
+
+
+def test_block_is_a_snapshot():
+    source = bell()
+    circ = QCircuit(2)
+    circ.compose(source)
+    source.x_gate(1)
+    assert len(circ.operations.extras[0]) == 2
+    assert np.allclose(statevector(circ), [2 ** -0.5, 0, 0, 2 ** -0.5])
+
+
+def test_inverse_undoes_the_circuit():
+    circ = QCircuit(3)
+    circ.h_gate(0)
+    circ.u2_gate(0.3, 0.7, 1)
+    circ.cu_gate(0.1, 0.2, 0.3, 0.4, 0, 2)
+    circ.iswap_gate(1, 2)
+    circ.dcx_gate(0, 1)
+    circ.compose(bell().repeat(3), [2, 1])
+    circ.compose(circ.inverse())
+    assert np.allclose(statevector(circ), np.eye(8)[0])
+
+
+def test_blocks_without_measurements_or_parameters():
+    circ = bell()
+    circ.measure_all()
+    with pytest.raises(CircuitError):
+        circ.inverse()
+    # circuits that cannot be blocks are copied
+    target = QCircuit(2)
+    target.compose(circ)
+    assert target.operations.count(OpType.block) == 0 and len(target.operations) == 3
+    assert target.execute(provider=providers.NATIVE_PROVIDER, repetitions=100, seed=1).keys() <= {'00', '11'}
+    parameterized = QCircuit(1)
+    parameterized.rx_gate(Parameter('theta'), 0)
+    target = QCircuit(1)
+    target.compose(parameterized)
+    assert target.parameters == [Parameter('theta')]
+
+
+def test_appended_blocks_are_expanded_incrementally():
+    circ = QCircuit(2, 2)
+    circ.compose(bell())
+    assert np.allclose(statevector(circ), [2 ** -0.5, 0, 0, 2 ** -0.5])
+    circ.compose(bell().inverse())
+    circ.x_gate(1)
+    circ.measure(0)
+    circ.measure(1)
+    assert circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10) == {'10': 10}
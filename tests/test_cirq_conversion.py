@@ -0,0 +1,54 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from quantumcat.circuit import QCircuit
+
+cirq = pytest.importorskip('cirq')
+
+from quantumcat.backends import cirq_backend
+
+
+def test_moments_match_earliest_append():
+    circ = QCircuit(4)
+    circ.h_gate(0)
+    circ.x_gate(3)
+    circ.cx_gate(0, 1)
+    circ.ccx_gate(1, 2, 3)
+    circ.rx_gate(0.3, 0)
+    circ.mct_gate([0, 1, 2], 3)
+    circ.measure(2)
+    converted = cirq_backend.convert(circ)
+
+    expected = cirq.Circuit()
+    for moment in converted:
+        for operation in moment:
+            expected.append(operation, strategy=cirq.InsertStrategy.EARLIEST)
+    assert converted == expected
+    assert len(converted) == 5
+
+
+def test_incremental_conversion_matches_full_conversion():
+    circ = QCircuit(3)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    converted = cirq_backend.convert(circ)
+    circ.x_gate(2)
+    circ.cx_gate(1, 2)
+    assert cirq_backend.extend(circ, converted, 2) == cirq_backend.convert(circ)
+
+
+def test_every_mapped_op_type_has_an_emitter():
+    from quantumcat.utils import gates_map
+    assert set(cirq_backend.EMITTERS) == set(gates_map.quantumcat_to_cirq)
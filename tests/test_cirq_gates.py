@@ -0,0 +1,41 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+
+cirq = pytest.importorskip('cirq')
+
+from quantumcat.gates.custom_gates import cirq as custom_gates
+
+GATES = [
+    custom_gates.C3XGate(), custom_gates.C4XGate(), custom_gates.C3SXGate(), custom_gates.RCCXGate(),
+    custom_gates.RC3XGate(), custom_gates.DCXGate(), custom_gates.CHGate(), custom_gates.CYGate(),
+    custom_gates.CU3Gate(0.3, 0.2, 0.1), custom_gates.RXGate(0.4), custom_gates.SDGGate(),
+]
+
+
+@pytest.mark.parametrize('gate', GATES, ids=lambda gate: type(gate).__name__)
+def test_apply_unitary_matches_matrix(gate):
+    qubits = cirq.LineQubit.range(cirq.num_qubits(gate))
+    # a circuit unitary is computed through _apply_unitary_ when the gate has one
+    assert np.allclose(cirq.Circuit(gate.on(*qubits)).unitary(), gate.matrix())
+
+
+@pytest.mark.parametrize('gate', [custom_gates.C3XGate(), custom_gates.C4XGate(), custom_gates.C3SXGate()],
+                         ids=lambda gate: type(gate).__name__)
+def test_decompose_matches_matrix(gate):
+    qubits = cirq.LineQubit.range(cirq.num_qubits(gate))
+    assert np.allclose(cirq.Circuit(cirq.decompose_once(gate.on(*qubits))).unitary(qubit_order=qubits),
+                       gate.matrix())
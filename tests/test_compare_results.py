@@ -0,0 +1,87 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+import pytest
+from quantumcat import backends
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.utils import providers, constants, ErrorMessages
+
+# This module doubles as a backend that takes a while to execute, registered under two providers
+SLOW_PROVIDER = 'SLOW'
+OTHER_SLOW_PROVIDER = 'OTHER_SLOW'
+
+
+def convert(q_circuit):
+    return q_circuit.operations
+
+
+def extend(q_circuit, converted_circuit, start):
+    return converted_circuit
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, **options):
+    time.sleep(1)
+    return {}
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def slow_backend():
+    backends.register_backend(SLOW_PROVIDER, __name__)
+    backends.register_backend(OTHER_SLOW_PROVIDER, __name__)
+    yield
+    backends.BACKENDS.pop(SLOW_PROVIDER)
+    backends.BACKENDS.pop(OTHER_SLOW_PROVIDER)
+
+
+def test_concurrent_results_with_failures_and_timeouts():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    providers_list = [{'provider': providers.NATIVE_PROVIDER, 'repetitions': 10},
+                      {'provider': 'UNKNOWN'},
+                      {'provider': SLOW_PROVIDER}]
+    results = circ.compare_results(providers_list, concurrent=True, timeout=0.5)
+
+    native = results[providers.NATIVE_PROVIDER]
+    assert native[constants.RESULT] == {'1': 10}
+    assert native[constants.ERROR] is None
+    assert native[constants.TIME] >= 0
+    assert 'ProviderNotFoundError' in results['UNKNOWN'][constants.ERROR]
+    assert results[SLOW_PROVIDER][constants.ERROR] == ErrorMessages.PROVIDER_TIMED_OUT
+
+
+def test_timeout_counts_from_the_start_of_each_provider():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    # the second provider waits for the first one in the single worker thread
+    results = circ.compare_results([{'provider': SLOW_PROVIDER}, {'provider': OTHER_SLOW_PROVIDER}],
+                                   concurrent=True, timeout=1.5, max_workers=1)
+    for provider in (SLOW_PROVIDER, OTHER_SLOW_PROVIDER):
+        assert results[provider][constants.ERROR] is None
+        assert 1 <= results[provider][constants.TIME] < 1.5
+    assert circ.converted_circuits.keys() == {SLOW_PROVIDER, OTHER_SLOW_PROVIDER}
+
+
+def test_sequential_results_are_unchanged():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    results = circ.compare_results([{'provider': providers.NATIVE_PROVIDER, 'repetitions': 10}])
+    assert results == {providers.NATIVE_PROVIDER: {'1': 10}}
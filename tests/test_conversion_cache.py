@@ -0,0 +1,79 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from quantumcat import backends
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.utils import providers
+
+# This module doubles as a backend that records the conversions it is asked for
+RECORDING_PROVIDER = 'RECORDING'
+calls = []
+
+
+def convert(q_circuit):
+    calls.append(('convert', len(q_circuit.operations)))
+    return [op_type for op_type, _, _ in q_circuit.operations]
+
+
+def extend(q_circuit, converted_circuit, start):
+    calls.append(('extend', start))
+    return converted_circuit + [op_type for op_type, _, _ in q_circuit.operations.iterate(start)]
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, **options):
+    return converted_circuit
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    print(converted_circuit)
+
+
+@pytest.fixture(autouse=True)
+def recording_backend():
+    backends.register_backend(RECORDING_PROVIDER, __name__)
+    calls.clear()
+    yield
+    backends.BACKENDS.pop(RECORDING_PROVIDER)
+
+
+def test_appended_operations_are_converted_incrementally():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    assert len(circ.execute(provider=RECORDING_PROVIDER)) == 1
+    circ.cx_gate(0, 1)
+    circ.x_gate(1)
+    assert len(circ.execute(provider=RECORDING_PROVIDER)) == 3
+    circ.execute(provider=RECORDING_PROVIDER)
+    assert calls == [('convert', 1), ('extend', 1)]
+
+
+def test_conversions_are_cached_per_provider():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    for _ in range(3):
+        circ.execute(provider=RECORDING_PROVIDER)
+        assert circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10) == {'1': 10}
+    assert calls == [('convert', 2)]
+    assert set(circ.converted_circuits) == {RECORDING_PROVIDER, providers.NATIVE_PROVIDER}
+
+
+def test_rewritten_operations_are_converted_again():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.execute(provider=RECORDING_PROVIDER)
+    circ.operations.rewritten()
+    circ.execute(provider=RECORDING_PROVIDER)
+    assert calls == [('convert', 1), ('convert', 1)]
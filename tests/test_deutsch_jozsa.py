@@ -0,0 +1,60 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from quantumcat.algorithms import DeutschJozsa
+from quantumcat.circuit import OpType
+from quantumcat.exceptions import CircuitError
+from quantumcat.utils import providers
+
+
+def test_seeded_oracles_are_reproducible():
+    first, second = DeutschJozsa('balanced', 5, seed=7), DeutschJozsa('balanced', 5, seed=7)
+    assert first.oracle_mask() == second.oracle_mask() != 0
+    assert DeutschJozsa('constant', 3, mask=1).execute(provider=providers.NATIVE_PROVIDER, repetitions=8) == \
+        {'000': 8}
+
+
+def test_circuits_share_prefix_and_suffix():
+    circuits = [DeutschJozsa('balanced', 4, mask=mask).dj_algorithm() for mask in (1, 6)]
+    blocks = [[circ.operations.extras[index] for index in sorted(circ.operations.extras)] for circ in circuits]
+    assert blocks[0][0] is blocks[1][0] and blocks[0][2] is blocks[1][2]
+    assert circuits[0].count_ops()[OpType.cx_gate] == 4
+
+
+def test_execute_batch_verdicts():
+    cases = ['balanced', 'constant', 'constant', 'balanced']
+    verdicts = DeutschJozsa.execute_batch(cases, 4, seeds=range(4), provider=providers.NATIVE_PROVIDER,
+                                          repetitions=16)
+    assert isinstance(verdicts, np.ndarray) and verdicts.tolist() == cases
+    verdicts = DeutschJozsa.execute_batch('balanced', 3, masks=[1, 5, 7], provider=providers.NATIVE_PROVIDER,
+                                          repetitions=16)
+    assert verdicts.tolist() == ['balanced'] * 3
+
+
+def test_execute_batch_needs_oracles_for_one_case():
+    with pytest.raises(CircuitError):
+        DeutschJozsa.execute_batch('balanced', 3, provider=providers.NATIVE_PROVIDER)
+
+
+def test_invalid_oracles_are_rejected():
+    with pytest.raises(CircuitError):
+        DeutschJozsa.execute_batch(['balanced', 'constant'], 3, seeds=[1, 2, 3])
+    with pytest.raises(CircuitError):
+        DeutschJozsa.execute_batch('balanced', 3, masks=[1, 2], seeds=[1])
+    for case, mask in [('balanced', 0), ('balanced', 8), ('constant', 2), ('constant', -1)]:
+        with pytest.raises(CircuitError):
+            DeutschJozsa(case, 3, mask)
+    assert DeutschJozsa('balanced', 3, 7).mask == 7
@@ -0,0 +1,99 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from quantumcat.algorithms.grovers_algorithm import GroversAlgorithm
+from quantumcat.algorithms.sat_oracle import SATOracle
+from quantumcat.circuit import QCircuit
+from quantumcat.exceptions import CircuitError
+from quantumcat.utils import providers, constants
+
+
+def most_frequent(counts):
+    return max(counts, key=counts.get)
+
+
+def test_analytic_mode_matches_the_circuit():
+    for grover in (GroversAlgorithm(search_keyword=1101, solution_known='Y'),
+                   GroversAlgorithm(clause_list=[[0, 1], [0, 2], [1, 3], [2, 3]], input_arr=[0, 0, 1, 1])):
+        circuit_counts = grover.execute(provider=providers.NATIVE_PROVIDER, repetitions=2000, seed=3)
+        analytic_counts = grover.execute(repetitions=2000, mode=constants.GROVER_ANALYTIC, seed=3)
+        for counts in (circuit_counts, analytic_counts):
+            assert sum(counts.values()) == 2000
+        for key in set(circuit_counts) | set(analytic_counts):
+            assert abs(circuit_counts.get(key, 0) - analytic_counts.get(key, 0)) < 120
+
+
+def test_analytic_mode_on_a_large_search_space():
+    keyword = '1011' * 6
+    grover = GroversAlgorithm(search_keyword=keyword, solution_known='Y')
+    counts = grover.execute(repetitions=100, mode=constants.GROVER_ANALYTIC, seed=1)
+    assert most_frequent(counts) == keyword[::-1]
+    assert counts[keyword[::-1]] > 95
+
+
+def test_no_marked_state_gives_uniform_counts():
+    grover = GroversAlgorithm(clause_list=[[0], [0]], input_arr=[0, 1], num_of_iterations=3)
+    assert len(grover.marked_states()) == 0
+    counts = grover.execute(repetitions=4000, mode=constants.GROVER_ANALYTIC, seed=2)
+    assert set(counts) == {'00', '01', '10', '11'}
+
+
+def test_unknown_mode():
+    with pytest.raises(CircuitError):
+        GroversAlgorithm(search_keyword=11, solution_known='Y').execute(mode='exact')
+
+
+CNF = [[0, 1, ~2], [~0, 2], [1, 3], [~1, ~3], [2, 3], [0, ~3], [~0, 1, 2], [3, ~2, 0], [1, 2]]
+
+
+def oracle_signs(oracle):
+    """Applies the oracle to all variable states with the output qubit in |->, returns the sign of each state."""
+    circ = QCircuit(oracle.num_qubits)
+    for qubit in range(oracle.num_variables):
+        circ.h_gate(qubit)
+    circ.x_gate(oracle.output_qubit)
+    circ.h_gate(oracle.output_qubit)
+    before = circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR)
+    circ.append_block(oracle.block())
+    after = circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR)
+    states = 1 << oracle.num_variables
+    return after.reshape(-1)[:states] / before.reshape(-1)[:states]
+
+
+def test_cnf_oracle_reuses_clause_qubits():
+    oracle = SATOracle(CNF, 4, constants.CNF_CLAUSES)
+    assert len(oracle.groups) == 3 and oracle.num_qubits == 4 + 3 + 3 + 1
+    satisfied = oracle.satisfied(np.arange(16))
+    assert np.flatnonzero(satisfied).tolist() == [7, 13]
+    assert np.allclose(oracle_signs(oracle), np.where(satisfied, -1, 1))
+
+
+def test_xor_oracle_with_groups():
+    clauses = [[0, 1], [1, 2], [0, 2], [2], [0, 1, 2]]
+    oracle = SATOracle(clauses, 3, parities=[1, 1, 0, 1, 0], group_size=2)
+    assert oracle.num_qubits == 3 + 2 + 3 + 1
+    assert np.allclose(oracle_signs(oracle), np.where(oracle.satisfied(np.arange(8)), -1, 1))
+
+
+def test_execute_batch():
+    results = GroversAlgorithm.execute_batch([CNF, CNF[:5]], provider=providers.NATIVE_PROVIDER, repetitions=200,
+                                             seed=1, clause_type=constants.CNF_CLAUSES, num_of_variables=4,
+                                             num_of_iterations=1)
+    assert len(results) == 2
+    assert set(sorted(results[0], key=results[0].get)[-2:]) == {'0111', '1101'}
+    analytic = GroversAlgorithm.execute_batch([CNF], repetitions=200, mode=constants.GROVER_ANALYTIC,
+                                              clause_type=constants.CNF_CLAUSES, num_of_iterations=1)
+    assert sum(analytic[0].values()) == 200
@@ -0,0 +1,48 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from quantumcat.circuit import QCircuit
+from quantumcat.utils import constants, instrumentation, providers
+
+
+def test_execute_phases_are_recorded():
+    circ = QCircuit(3)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    circ.measure_all()
+    with instrumentation.recording() as spans:
+        circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=100)
+        circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR)
+    names = [span.name for span in spans]
+    assert names == [instrumentation.CONVERT, instrumentation.SIMULATE, instrumentation.POSTPROCESS,
+                     instrumentation.EXECUTE, instrumentation.SIMULATE, instrumentation.EXECUTE]
+    execute = spans[3]
+    assert execute.counters == {'provider': providers.NATIVE_PROVIDER, 'gates': 3, 'qubits': 3, 'shots': 100}
+    assert all(span.parent is execute for span in spans[:3])
+    assert spans[2].counters['outcomes'] <= 4
+    assert spans[4].counters['statevector_bytes'] == 8 * 16
+    assert all(span.duration >= 0 for span in spans)
+
+
+def test_disabled_spans_do_nothing():
+    assert not instrumentation.enabled()
+    assert instrumentation.span(instrumentation.EXECUTE, gates=1) is instrumentation.NO_SPAN
+    calls = []
+    instrumentation.add_hook(calls.append)
+    try:
+        with instrumentation.span(instrumentation.CONVERT) as span:
+            span.count(gates=2)
+    finally:
+        instrumentation.remove_hook(calls.append)
+    assert calls == [span] and span.counters == {'gates': 2}
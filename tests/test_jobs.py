@@ -0,0 +1,146 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import pytest
+import quantumcat
+from quantumcat import backends
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.exceptions import JobError
+from quantumcat.utils import constants, providers
+
+# This module doubles as a fake remote device whose jobs finish after a few status polls
+FAKE_PROVIDER = 'FAKE_DEVICE'
+status_calls = []
+
+
+class FakeJob:
+    def __init__(self, result, polls):
+        self.result = result
+        self.polls = polls
+        self.cancelled = False
+
+
+def convert(q_circuit):
+    return len(q_circuit.operations)
+
+
+def extend(q_circuit, converted_circuit, start):
+    return convert(q_circuit)
+
+
+def submit(q_circuit, converted_circuit, simulator_name, repetitions, polls=2, **options):
+    return FakeJob({'0' * q_circuit.qubits: repetitions}, polls)
+
+
+def job_statuses(handles):
+    status_calls.append(len(handles))
+    statuses = []
+    for job in handles:
+        if job.cancelled:
+            statuses.append(constants.JOB_CANCELLED)
+        elif job.polls > 0:
+            job.polls -= 1
+            statuses.append(constants.JOB_RUNNING)
+        else:
+            statuses.append(constants.JOB_DONE)
+    return statuses
+
+
+def job_result(q_circuit, handle, simulator_name, counts_format=constants.COUNTS_DICT):
+    return handle.result
+
+
+def cancel_job(handle):
+    handle.cancelled = True
+
+
+def execute(q_circuit, converted_circuit, simulator_name, repetitions, **options):
+    raise AssertionError('the fake device only runs jobs')
+
+
+def draw(converted_circuit, filename=None, output='text'):
+    print(converted_circuit)
+
+
+@pytest.fixture(autouse=True)
+def fake_device():
+    backends.register_backend(FAKE_PROVIDER, __name__)
+    status_calls.clear()
+    yield
+    backends.BACKENDS.pop(FAKE_PROVIDER)
+
+
+def circuits(count):
+    result = []
+    for qubits in range(1, count + 1):
+        circ = QCircuit(qubits)
+        circ.x_gate(0)
+        result.append(circ)
+    return result
+
+
+def test_jobs_are_polled_together():
+    jobs = quantumcat.execute_async(circuits(5), provider=FAKE_PROVIDER, repetitions=10)
+    done, pending = quantumcat.circuit.jobs.wait(jobs, interval=0.001)
+    assert len(done) == 5 and pending == []
+    # one status request per polling round for all five jobs
+    assert status_calls == [5, 5, 5]
+    assert [job.result() for job in jobs] == [{'0' * qubits: 10} for qubits in range(1, 6)]
+
+
+def test_await_job():
+    circ = circuits(1)[0]
+
+    async def run():
+        return await circ.execute_async(provider=FAKE_PROVIDER, repetitions=7)
+
+    assert asyncio.run(run()) == {'0': 7}
+
+
+def test_cancel_and_timeout():
+    first, second = quantumcat.execute_async(circuits(2), provider=FAKE_PROVIDER)
+    first.cancel()
+    assert first.status() == constants.JOB_CANCELLED
+    with pytest.raises(JobError):
+        first.result()
+    second.handle.polls = 10 ** 6
+    with pytest.raises(JobError):
+        second.result(timeout=0.01, interval=0.001)
+
+
+def test_local_jobs_run_in_thread_pool():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    job = circ.execute_async(provider=providers.NATIVE_PROVIDER, repetitions=10)
+    assert job.local
+    assert job.result() == {'1': 10}
+    assert job.status() == constants.JOB_DONE
+
+
+def test_local_jobs_take_the_options_of_execute(tmp_path):
+    circ = QCircuit(8)
+    for qubit in range(8):
+        circ.h_gate(qubit)
+    circ.measure_all()
+    blocking = circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STABILIZER_SIMULATOR,
+                            repetitions=50, seed=5)
+    job = circ.execute_async(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STABILIZER_SIMULATOR,
+                             repetitions=50, seed=5)
+    assert job.result() == blocking
+    cache = quantumcat.ResultCache(str(tmp_path / 'results.sqlite'))
+    job = circ.execute_async(provider=providers.NATIVE_PROVIDER, repetitions=50, seed=5, cache=cache)
+    assert job.result() == circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=50, seed=5)
+    assert len(cache) == 1
@@ -0,0 +1,82 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from quantumcat.circuit import QCircuit, OpType
+
+
+def test_depth_and_counts_follow_appends():
+    circ = QCircuit(4)
+    assert circ.depth() == 0 and circ.count_ops() == {}
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    circ.x_gate(3)
+    assert circ.depth() == 2
+    circ.cx_gate(1, 2)
+    circ.t_gate(3)
+    assert circ.depth() == 3
+    assert circ.count_ops() == {OpType.cx_gate: 2, OpType.h_gate: 1, OpType.x_gate: 1, OpType.t_gate: 1}
+    assert list(circ.count_ops())[0] == OpType.cx_gate
+    assert circ.two_qubit_gates() == 2
+    circ.measure_all()
+    assert circ.depth() == 4
+
+
+def test_layers():
+    circ = QCircuit(3)
+    circ.h_gate(0)
+    circ.h_gate(1)
+    circ.cx_gate(0, 2)
+    circ.rz_gate(0.5, 1)
+    circ.measure(2)
+    layers = [[op_type for op_type, _, _ in layer] for layer in circ.layers()]
+    assert layers == [[OpType.h_gate, OpType.h_gate], [OpType.cx_gate, OpType.rz_gate], [OpType.measure]]
+    circ.x_gate(1)
+    assert circ.layers()[2] == [(OpType.measure, [2], []), (OpType.x_gate, [1], [])]
+
+
+def test_ancillas_count_as_qubits_of_the_gate():
+    circ = QCircuit(4)
+    circ.x_gate(3)
+    circ.mcx_gate([0, 1], 2, ancilla_qubits=[3])
+    assert circ.depth() == 2
+
+
+def test_rewritten_operations_are_measured_again():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    assert circ.depth() == 3
+    circ.optimize()
+    assert circ.depth() == 1
+    assert circ.count_ops() == {OpType.cx_gate: 1}
+
+
+def test_block_depth_is_the_expanded_depth():
+    block = QCircuit(2)
+    block.x_gate(0)
+    block.cx_gate(0, 1)
+    block.x_gate(1)
+    # the second x(0) runs alongside the first x(1)
+    assert block.repeat(2).depth() == 5
+    circ = QCircuit(3)
+    circ.x_gate(2)
+    circ.append_block(block.to_block(), [2, 0], repetitions=3)
+    expanded = QCircuit(3)
+    expanded.x_gate(2)
+    for _ in range(3):
+        expanded.x_gate(2)
+        expanded.cx_gate(2, 0)
+        expanded.x_gate(0)
+    assert circ.depth() == expanded.depth() == 8
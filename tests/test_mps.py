@@ -0,0 +1,96 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.simulators import MPSSimulator, StatevectorSimulator
+from quantumcat.utils import constants, instrumentation, providers
+
+
+def random_circuit(rng, num_qubits, num_gates):
+    circ = QCircuit(num_qubits)
+    for _ in range(num_gates):
+        choice = rng.random()
+        qubits = [int(qubit) for qubit in rng.choice(num_qubits, 3, replace=False)]
+        if choice < 0.3:
+            circ.u_gate(*rng.random(3), qubits[0])
+        elif choice < 0.6:
+            circ.rzz_gate(rng.random(), qubits[0], qubits[1])
+        elif choice < 0.8:
+            circ.cx_gate(qubits[0], qubits[1])
+        else:
+            circ.ccx_gate(*qubits)
+    return circ
+
+
+def test_statevector_matches_the_statevector_simulator():
+    rng = np.random.default_rng(3)
+    for num_qubits in (3, 4, 5, 6):
+        circ = random_circuit(rng, num_qubits, 30)
+        simulator = MPSSimulator()
+        state = simulator.statevector(circ.operations, num_qubits)
+        assert np.allclose(state, StatevectorSimulator().statevector(circ.operations, num_qubits))
+        assert np.isclose(simulator.fidelity, 1)
+
+
+def test_wide_nearest_neighbour_chain():
+    circ = QCircuit(80)
+    for qubit in range(80):
+        circ.h_gate(qubit)
+    for layer in range(3):
+        for qubit in range(layer % 2, 79, 2):
+            circ.rzz_gate(0.4, qubit, qubit + 1)
+        for qubit in range(80):
+            circ.rx_gate(0.3, qubit)
+    circ.measure_all()
+    with instrumentation.recording() as spans:
+        shots = circ.execute(simulator_name=constants.MPS_SIMULATOR, repetitions=300, seed=1,
+                             counts_format=constants.COUNTS_SHOTS)
+    assert shots.shape == (300, 10)
+    simulate = next(span for span in spans if span.name == instrumentation.SIMULATE)
+    assert np.isclose(simulate.counters['fidelity'], 1)
+    assert simulate.counters['bond_dimension'] <= 8
+
+
+def test_long_range_ghz():
+    circ = QCircuit(40)
+    circ.h_gate(0)
+    for qubit in range(1, 40):
+        circ.cx_gate(0, qubit)
+    circ.t_gate(5)
+    circ.measure_all()
+    counts = circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.MPS_SIMULATOR,
+                          repetitions=200)
+    assert set(counts) == {'0' * 40, '1' * 40}
+
+
+def test_bond_dimension_limit_reports_fidelity():
+    rng = np.random.default_rng(5)
+    circ = random_circuit(rng, 8, 80)
+    simulator = MPSSimulator(max_bond_dimension=2)
+    state = simulator.state(circ.operations, 8)
+    assert state.bond_dimension <= 2
+    assert 0 < simulator.fidelity < 1
+    assert np.isclose(np.linalg.norm(state.statevector()), 1)
+
+
+def test_mid_circuit_measurements():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.t_gate(0)
+    circ.measure(0)
+    circ.cx_gate(0, 1)
+    circ.measure(1)
+    counts = circ.execute(simulator_name=constants.MPS_SIMULATOR, repetitions=100, seed=2)
+    assert set(counts) == {'00', '11'}
@@ -0,0 +1,140 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import inspect
+import pytest
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.gates import matrices
+from quantumcat.utils import providers, constants
+from quantumcat.simulators import StatevectorSimulator, as_statevector
+import numpy as np
+
+
+def statevector_native(circ):
+    return circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR)
+
+
+def counts_native(circ, repetitions=1024):
+    return circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=repetitions)
+
+
+@pytest.fixture()
+def circdef():
+    circ = QCircuit(5)
+    return circ
+
+
+def test_x_gate(circdef):
+    circdef.x_gate(0)
+    circdef.x_gate(2)
+    expected = np.zeros(32)
+    expected[0b00101] = 1
+    assert np.allclose(statevector_native(circdef), expected)
+
+
+def test_entangle(circdef):
+    circdef.entangle(0, 4)
+    expected = np.zeros(32)
+    expected[0b00000] = expected[0b10001] = 1 / np.sqrt(2)
+    assert np.allclose(statevector_native(circdef), expected)
+
+
+def test_mct_gate(circdef):
+    circdef.x_gate(0)
+    circdef.x_gate(1)
+    circdef.x_gate(2)
+    circdef.mct_gate([0, 1, 2], 4)
+    circdef.mcx_gate([0, 1, 2, 4], 3)
+    expected = np.zeros(32)
+    expected[0b11111] = 1
+    assert np.allclose(statevector_native(circdef), expected)
+
+
+def test_cu3_gate(circdef):
+    circdef.x_gate(1)
+    circdef.cu3_gate(np.pi, 0, 0, 1, 3)
+    expected = np.zeros(32)
+    expected[0b01010] = 1
+    assert np.allclose(statevector_native(circdef), expected)
+
+
+def test_measure_counts(circdef):
+    circdef.x_gate(0)
+    circdef.superposition(2)
+    circdef.measure(0)
+    circdef.measure(1)
+    counts = counts_native(circdef)
+    assert counts == {'00001': 1024}
+
+
+def test_measure_all_counts(circdef):
+    circdef.entangle(0, 1)
+    circdef.measure_all()
+    counts = counts_native(circdef)
+    assert set(counts.keys()) == {'00000', '00011'}
+    assert sum(counts.values()) == 1024
+
+
+def test_mid_circuit_measure(circdef):
+    circdef.x_gate(0)
+    circdef.measure(0)
+    circdef.x_gate(0)
+    circdef.x_gate(1)
+    circdef.measure(1)
+    assert counts_native(circdef, repetitions=10) == {'00011': 10}
+
+
+def test_single_precision(circdef):
+    circdef.h_gate(0)
+    circdef.cx_gate(0, 1)
+    circdef.u_gate(0.3, 0.2, 0.1, 2)
+    single = circdef.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR,
+                             precision=constants.PRECISION_SINGLE)
+    assert single.dtype == np.complex64 and single.flags.c_contiguous
+    assert np.allclose(single, statevector_native(circdef), atol=1e-6)
+    assert np.shares_memory(as_statevector(single, constants.PRECISION_SINGLE), single)
+
+
+def gate_params(op_type, num_qubits, rng):
+    """Returns random angles for the params of op_type, and the control count of multi-controlled gates."""
+    names = inspect.signature(matrices.GATES[op_type][1]).parameters
+    values = {'num_ctrl': num_qubits - 1, 'dirty_ancilla': False}
+    return [values[name] if name in values else rng.uniform(-np.pi, np.pi) for name in names]
+
+
+def apply_unitary(state, unitary, qargs):
+    """Applies a little-endian unitary, whose bit j is qubit qargs[j], to a state tensor."""
+    num_qubits, k = state.ndim, len(qargs)
+    axes = [num_qubits - 1 - qargs[k - 1 - axis] for axis in range(k)]
+    result = np.tensordot(unitary.reshape((2,) * 2 * k), state, axes=(list(range(k, 2 * k)), axes))
+    return np.moveaxis(result, list(range(k)), axes)
+
+
+@pytest.mark.parametrize('op_type', list(matrices.GATES))
+def test_gates_match_their_unitary(op_type):
+    rng = np.random.default_rng(op_type.value)
+    num_controls, factory = matrices.GATES[op_type]
+    num_qubits = 4 if num_controls is None else None
+    if num_qubits is None:
+        params = [rng.uniform(-np.pi, np.pi) for _ in inspect.signature(factory).parameters]
+        num_qubits = num_controls + int(np.log2(factory(*params).shape[0]))
+    else:
+        params = gate_params(op_type, num_qubits, rng)
+    # the qubits of the gate in a shuffled order, among others it does not act on
+    qargs = rng.permutation(6)[:num_qubits].tolist()
+    state = rng.normal(size=(2,) * 6) + 1j * rng.normal(size=(2,) * 6)
+    state /= np.linalg.norm(state)
+    simulated = StatevectorSimulator().apply(state.copy(), op_type, qargs, params)
+    expected = apply_unitary(state, matrices.unitary(op_type, params, num_qubits), qargs)
+    assert np.allclose(simulated, expected)
@@ -0,0 +1,45 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.circuit.op_type import OpType
+from quantumcat.utils import constants
+
+
+def test_operations_storage():
+    circ = QCircuit(3)
+    circ.h_gate(0)
+    circ.crx_gate(0.5, 0, 2)
+    circ.mcx_gate([0, 1], 2)
+    assert len(circ.operations) == 3
+    assert list(circ.operations) == [(OpType.h_gate, [0], []),
+                                     (OpType.crx_gate, [0, 2], [0.5]),
+                                     (OpType.mcx_gate, [0, 1, 2], [2])]
+    assert circ.operations.count(OpType.h_gate) == 1
+
+
+def test_get_operations_legacy_format():
+    circ = QCircuit(4)
+    circ.x_gate(0)
+    circ.cu3_gate(0.1, 0.2, 0.3, 0, 1)
+    circ.mct_gate([0, 1], 2)
+    circ.mcp_gate(0.4, [0, 1], 3)
+    circ.measure(0)
+    circ.measure_all()
+    assert circ.get_operations() == [{OpType.x_gate: [0]},
+                                      {OpType.cu3_gate: [[0], [1]], constants.PARAMS: [0.1, 0.2, 0.3]},
+                                      {OpType.mct_gate: [[0, 1], [2], None, 'noancilla']},
+                                      {OpType.mcp_gate: [0, 1, 3], constants.PARAMS: [0.4, 2]},
+                                      {OpType.measure: [0]},
+                                      {OpType.measure_all: OpType.measure_all}]
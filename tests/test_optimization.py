@@ -0,0 +1,72 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from quantumcat.circuit import QCircuit, OpType
+from quantumcat.utils import providers, constants
+
+
+def statevector(circ):
+    return circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR)
+
+
+def equal_up_to_phase(state1, state2):
+    return np.isclose(abs(np.vdot(state1, state2)), 1)
+
+
+def test_inverse_pairs_cancel():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.x_gate(1)
+    circ.h_gate(0)
+    circ.x_gate(1)
+    circ.s_gate(0)
+    circ.t_gate(1)
+    circ.sdg_gate(0)
+    circ.td_gate(1)
+    circ.sx_gate(0)
+    circ.sxd_gate(0)
+    circ.cx_gate(0, 1)
+    assert circ.optimize() == {constants.BEFORE: 11, constants.AFTER: 1}
+    assert len(circ.operations) == 1
+
+
+def test_single_qubit_runs_fuse_into_u3():
+    rng = np.random.default_rng(7)
+    circ = QCircuit(3)
+    gates = [circ.h_gate, circ.x_gate, circ.s_gate, circ.t_gate, circ.sx_gate, circ.y_gate]
+    for _ in range(40):
+        qubit = int(rng.integers(3))
+        if rng.random() < 0.2:
+            circ.cx_gate(qubit, (qubit + 1) % 3)
+        elif rng.random() < 0.5:
+            circ.rx_gate(float(rng.uniform(-np.pi, np.pi)), qubit)
+            circ.u3_gate(*rng.uniform(-np.pi, np.pi, 3).tolist(), qubit)
+        else:
+            gates[int(rng.integers(len(gates)))](qubit)
+    expected = statevector(circ)
+    report = circ.optimize()
+    assert report[constants.AFTER] < report[constants.BEFORE]
+    assert equal_up_to_phase(statevector(circ), expected)
+
+
+def test_measurement_ends_run():
+    circ = QCircuit(1)
+    circ.x_gate(0)
+    circ.measure(0)
+    circ.x_gate(0)
+    circ.measure(0)
+    circ.optimize()
+    assert circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10) == {'0': 10}
+    assert circ.operations.count(OpType.x_gate) == 2
@@ -0,0 +1,73 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from quantumcat.circuit import QCircuit, Parameter
+from quantumcat.exceptions import CircuitError
+from quantumcat.utils import providers, constants
+
+
+def parameterized_circuit():
+    theta, phi = Parameter('theta'), Parameter('phi')
+    circ = QCircuit(2)
+    circ.ry_gate(theta, 0)
+    circ.cx_gate(0, 1)
+    circ.u3_gate(theta, phi, 0.5, 1)
+    return circ, theta, phi
+
+
+def bound_circuit(theta, phi):
+    circ = QCircuit(2)
+    circ.ry_gate(theta, 0)
+    circ.cx_gate(0, 1)
+    circ.u3_gate(theta, phi, 0.5, 1)
+    return circ
+
+
+def test_parameters_in_order_of_use():
+    circ, theta, phi = parameterized_circuit()
+    assert circ.parameters == [theta, phi]
+    assert Parameter('theta') == theta
+
+
+def test_execute_binds_many_values():
+    circ, theta, phi = parameterized_circuit()
+    values = [[0.1, 0.2], [1.0, -0.3], [2.5, 3.0]]
+    results = circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR,
+                           parameter_values=values)
+    assert len(results) == 3
+    for result, (theta_value, phi_value) in zip(results, values):
+        expected = bound_circuit(theta_value, phi_value).execute(provider=providers.NATIVE_PROVIDER,
+                                                                 simulator_name=constants.STATEVECTOR_SIMULATOR)
+        assert np.allclose(result, expected)
+
+
+def test_execute_binds_single_dict():
+    circ, theta, phi = parameterized_circuit()
+    result = circ.execute(provider=providers.NATIVE_PROVIDER, simulator_name=constants.STATEVECTOR_SIMULATOR,
+                          parameter_values={theta: 1.0, 'phi': 0.25})
+    expected = bound_circuit(1.0, 0.25).execute(provider=providers.NATIVE_PROVIDER,
+                                                simulator_name=constants.STATEVECTOR_SIMULATOR)
+    assert np.allclose(result, expected)
+
+
+def test_unbound_parameters():
+    circ, theta, phi = parameterized_circuit()
+    with pytest.raises(CircuitError):
+        circ.execute(provider=providers.NATIVE_PROVIDER)
+    with pytest.raises(CircuitError):
+        circ.execute(provider=providers.NATIVE_PROVIDER, parameter_values={theta: 1.0})
+    with pytest.raises(CircuitError):
+        circ.execute(provider=providers.NATIVE_PROVIDER, parameter_values=[1.0])
@@ -0,0 +1,126 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+import numpy as np
+from quantumcat import ResultCache
+from quantumcat.circuit import QCircuit
+from quantumcat.utils import constants, providers
+
+
+def bell_circuit():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    circ.measure_all()
+    return circ
+
+
+def test_seeded_runs_hit_the_cache(tmp_path):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'))
+    calls = []
+
+    def run():
+        calls.append(1)
+        return {'00': 1}
+
+    first = cache.execute(bell_circuit(), 'RECORDING', constants.DEFAULT_SIMULATOR, 100, run, seed=7)
+    second = cache.execute(bell_circuit(), 'RECORDING', constants.DEFAULT_SIMULATOR, 100, run, seed=7)
+    cache.execute(bell_circuit(), 'RECORDING', constants.DEFAULT_SIMULATOR, 100, run, seed=8)
+    assert first == second == {'00': 1}
+    assert len(calls) == 2
+
+
+def test_cached_statevector_is_resampled(tmp_path):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'))
+    # Clifford circuits are sampled by the stabilizer simulator, a T gate needs the statevector
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.t_gate(0)
+    circ.cx_gate(0, 1)
+    circ.measure_all()
+    uncached = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=1000, seed=3)
+    assert circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=1000, seed=3, cache=cache) == uncached
+    # the statevector and the counts are stored, the counts for 50 shots are sampled from the statevector
+    assert len(cache) == 2
+    counts = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=50, seed=3, cache=cache)
+    assert sum(counts.values()) == 50 and set(counts) <= {'00', '11'}
+    assert len(cache) == 3
+    # a different circuit misses the cache
+    circ.x_gate(0)
+    circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=50, seed=3, cache=cache)
+    assert len(cache) == 4
+
+
+def test_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'), max_bytes=2000)
+    for index in range(20):
+        cache.put(str(index), b'x' * 300)
+    assert 0 < len(cache) <= 6
+    assert cache.get('19') is not None and cache.get('0') is None
+
+    cache = ResultCache(str(tmp_path / 'aged.sqlite'), max_age_seconds=0.05)
+    cache.put('old', 1)
+    time.sleep(0.1)
+    assert cache.get('old') is None
+
+
+def test_collapsed_provider_statevector_is_not_resampled(tmp_path):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'))
+    circ = QCircuit(1)
+    circ.h_gate(0)
+    circ.t_gate(0)
+    circ.measure(0)
+    # the statevector_simulator of Aer applies the measurements, here collapsing the state to |1>
+    state_key = cache.key(circ, providers.IBM_PROVIDER, constants.STATEVECTOR_SIMULATOR, 0)
+    cache.put(state_key, np.array([0, 1], dtype=complex))
+    calls = []
+
+    def run():
+        calls.append(1)
+        return {'0': 512, '1': 488}
+
+    counts = cache.execute(circ, providers.IBM_PROVIDER, constants.DEFAULT_SIMULATOR, 1000, run, seed=3)
+    assert counts == {'0': 512, '1': 488}
+    assert len(calls) == 1
+
+
+def test_remote_targets_are_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'))
+    circ = bell_circuit()
+    circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=100, seed=3, api='token', cache=cache)
+    circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=100, seed=3, device='device', cache=cache)
+    assert len(cache) == 0
+    circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=100, seed=3, cache=cache)
+    assert len(cache) == 1
+
+
+def test_unseeded_counts_are_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'))
+    circ = QCircuit(16)
+    for qubit in range(16):
+        circ.h_gate(qubit)
+    circ.measure_all()
+    first = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=1, cache=cache)
+    second = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=1, cache=cache)
+    assert first != second
+    assert len(cache) == 0
+    # the statevector of a non-Clifford circuit is still cached and sampled again
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.t_gate(0)
+    circ.measure_all()
+    counts = [circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=100, cache=cache) for _ in range(2)]
+    assert all(sum(result.values()) == 100 for result in counts)
+    assert len(cache) == 1
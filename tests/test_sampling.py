@@ -0,0 +1,101 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from quantumcat.circuit import QCircuit
+from quantumcat.simulators import Counts, sampling
+from quantumcat.utils import providers, constants
+
+
+def test_counts_round_trip():
+    counts = {'01 101': 3, '11 000': 5}
+    result = Counts.from_dict(counts)
+    assert result.register_widths == (2, 3)
+    assert result.outcomes.tolist() == [0b01101, 0b11000]
+    assert result.to_dict() == counts
+    assert result.shots == 8
+
+
+def test_counts_from_bits():
+    bits = np.array([[1, 0], [1, 0], [0, 1]])
+    assert Counts.from_bits(bits).to_dict() == {'01': 2, '10': 1}
+
+
+def test_marginal_probabilities():
+    state = np.zeros(8)
+    state[0b110] = 1
+    assert sampling.marginal_probabilities(state, [2, 0]).tolist() == [0, 1, 0, 0]
+
+
+def test_sample_draws_all_shots():
+    outcomes, counts = sampling.sample([0.5, 0, 0.5, 0], 10 ** 6, np.random.default_rng(1))
+    assert outcomes.tolist() == [0, 2]
+    assert counts.sum() == 10 ** 6
+
+
+def test_execute_array_counts():
+    circ = QCircuit(3, 3)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    circ.x_gate(2)
+    circ.measure(0)
+    circ.measure(1)
+    circ.measure(2)
+    counts = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10 ** 6,
+                          counts_format=constants.COUNTS_ARRAY)
+    assert counts.outcomes.tolist() == [0b100, 0b111]
+    assert counts.shots == 10 ** 6
+    assert set(counts.to_dict()) == {'100', '111'}
+
+
+def test_pack_bits_round_trip():
+    bits = np.array([[1, 0, 0, 0, 0, 0, 0, 0, 1], [0, 1, 1, 0, 0, 0, 0, 0, 0]])
+    shots = sampling.pack_bits(bits)
+    assert shots.dtype == np.uint8 and shots.shape == (2, 2)
+    assert sampling.shot_values(shots).tolist() == [0b100000001, 0b110]
+    assert sampling.unpack_bits(shots, 9).tolist() == bits.tolist()
+    assert sampling.bits_from_strings(['100000001', '000 000110']).tolist() == bits.tolist()
+
+
+def test_execute_packed_shots():
+    circ = QCircuit(3, 3)
+    circ.h_gate(0)
+    circ.cx_gate(0, 1)
+    circ.x_gate(2)
+    circ.measure(0)
+    circ.measure(1)
+    circ.measure(2)
+    shots = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=1000,
+                         counts_format=constants.COUNTS_SHOTS)
+    assert shots.shape == (1000, 1)
+    assert set(sampling.shot_values(shots).tolist()) == {0b100, 0b111}
+    assert set(Counts.from_shots(shots, [3]).to_dict()) == {'100', '111'}
+
+
+def test_place_bits():
+    columns = np.array([[1, 0], [0, 1]])
+    assert sampling.place_bits(columns, [3, 0], 4).tolist() == [[0, 0, 0, 1], [1, 0, 0, 0]]
+
+
+def test_counts_wider_than_int64():
+    circ = QCircuit(100)
+    circ.x_gate(99)
+    circ.x_gate(70)
+    circ.measure_all()
+    counts = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10, counts_format=constants.COUNTS_ARRAY)
+    assert counts.outcomes.tolist() == [2 ** 99 + 2 ** 70]
+    assert counts == circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10)
+    shots = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10, counts_format=constants.COUNTS_SHOTS)
+    assert np.array_equal(counts.to_shots(), shots)
+    assert Counts.from_shots(shots, [100]) == counts
@@ -0,0 +1,92 @@
+# (C) Copyright Artificial Brain 2021.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from quantumcat.circuit.circuit import QCircuit
+from quantumcat.exceptions import CircuitError
+from quantumcat.simulators import StatevectorSimulator, StabilizerSimulator, sampling
+from quantumcat.utils import providers, constants
+
+SINGLE_QUBIT_GATES = ['i_gate', 'x_gate', 'y_gate', 'z_gate', 'h_gate', 's_gate', 'sdg_gate']
+TWO_QUBIT_GATES = ['cx_gate', 'cy_gate', 'cz_gate', 'swap_gate']
+
+
+def random_clifford_circuit(rng, num_qubits, num_gates):
+    circ = QCircuit(num_qubits)
+    for _ in range(num_gates):
+        if num_qubits > 1 and rng.random() < 0.4:
+            control, target = rng.choice(num_qubits, 2, replace=False)
+            getattr(circ, rng.choice(TWO_QUBIT_GATES))(int(control), int(target))
+        else:
+            getattr(circ, rng.choice(SINGLE_QUBIT_GATES))(int(rng.integers(num_qubits)))
+    return circ
+
+
+def test_random_clifford_circuits_match_statevector():
+    rng = np.random.default_rng(7)
+    for _ in range(40):
+        circ = random_clifford_circuit(rng, 4, 20)
+        circ.measure_all()
+        bits, register_widths = StabilizerSimulator(seed=1).run_bits(circ.operations, 4, 0, 2000)
+        state = StatevectorSimulator().statevector(circ.operations, 4)
+        probabilities = sampling.marginal_probabilities(state, range(4))
+        outcomes = np.flatnonzero(probabilities > 1e-9)
+        # stabilizer states are uniform over their outcomes
+        assert np.allclose(probabilities[outcomes], 1 / len(outcomes))
+        assert register_widths == [4]
+        assert set(sampling.Counts.from_bits(bits).outcomes.tolist()) == set(outcomes.tolist())
+
+
+def test_ghz_on_many_qubits():
+    circ = QCircuit(300)
+    circ.h_gate(0)
+    for qubit in range(299):
+        circ.cx_gate(qubit, qubit + 1)
+    circ.measure_all()
+    assert circ.is_clifford()
+    counts = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=200, seed=3)
+    assert set(counts) == {'0' * 300, '1' * 300}
+    assert sum(counts.values()) == 200
+
+
+def test_mid_circuit_measurements():
+    circ = QCircuit(2)
+    circ.h_gate(0)
+    circ.measure(0)
+    circ.cx_gate(0, 1)
+    circ.h_gate(0)
+    circ.measure(1)
+    counts = circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=500)
+    assert set(counts) == {'00', '11'}
+
+
+def test_seeded_runs_repeat():
+    circ = QCircuit(3)
+    for qubit in range(3):
+        circ.h_gate(qubit)
+    circ.measure_all()
+    first, second = (circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=100, seed=5,
+                                  counts_format=constants.COUNTS_SHOTS) for _ in range(2))
+    assert np.array_equal(first, second)
+
+
+def test_non_clifford_circuits_use_the_statevector():
+    circ = QCircuit(1)
+    circ.h_gate(0)
+    circ.t_gate(0)
+    assert not circ.is_clifford()
+    assert sum(circ.execute(provider=providers.NATIVE_PROVIDER, repetitions=10).values()) == 10
+    with pytest.raises(CircuitError):
+        circ.execute(simulator_name=constants.STABILIZER_SIMULATOR)